@@ -14,10 +14,13 @@ def get_info():
         "default_config": _config,
         "functions": {
             "adamic_adar_index": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L108",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L640",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the adamic adar index for all `pairs_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel; all the other non-edges have a score of zero and are left out.',
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
             "all_pairs_all_shortest_paths": {
@@ -63,10 +66,10 @@ def get_info():
                 },
             },
             "all_pairs_node_connectivity": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/connectivity/connectivity.py#L18",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/connectivity/connectivity.py#L20",
                 "additional_docs": "The parallel implementation first divides a list of all permutation (in case of directed graphs) and combinations (in case of undirected graphs) of `nbunch` into chunks and then creates a generator to lazily compute the local node connectivities for each chunk, and then employs joblib's `Parallel` function to execute these computations in parallel across `n_jobs` number of CPU cores. At the end, the results are aggregated into a single dictionary and returned.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in `list(iter_func(nbunch, 2))` as input and returns an iterable `pairs_chunks`, here `iter_func` is `permutations` in case of directed graphs and `combinations` in case of undirected graphs. The default is to create chunks by slicing the list into `n_jobs` number of chunks, such that size of each chunk is atmost 10, and at least 1."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in the list of the pairs of nodes of `nbunch` whose connectivity needs a flow computation, sorted by decreasing upper bound, and returns an iterable `pairs_chunks`. Only one of `(u, v)` and `(v, u)` is listed in case of undirected graphs. The default chunking splits the pairs into `n_jobs` chunks of about the same sum of upper bounds."
                 },
             },
             "all_pairs_shortest_path": {
@@ -90,16 +93,23 @@ def get_info():
                     'get_chunks : str, function (default = "chunks")': "A function that takes in `list(iter_func(nbunch, 2))` as input and returns an iterable `pairs_chunks`, here `iter_func` is `permutations` in case of directed graphs and `combinations` in case of undirected graphs. The default is to create chunks by slicing the list into `n_jobs` chunks, such that size of each chunk is atmost 10, and at least 1."
                 },
             },
+            "attracting_components": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/attracting.py#L43",
+                "additional_docs": "The attracting components are found in parallel as in `number_attracting_components`, and are generated in the order of their first node in `G`.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, whose out-edges are checked by the same worker. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
+                },
+            },
             "average_clustering": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L213",
-                "additional_docs": "The nodes are chunked into `node_chunks` and then the average clustering coefficient for all `node_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L210",
+                "additional_docs": "The nodes are chunked into `node_chunks` and then the average clustering coefficient for all `node_chunks` is computed in parallel over `n_jobs` number of CPU cores. Each worker only returns the sum of its coefficients, the number of nonzero coefficients and the number of nodes in its chunk, computed with the same shared array kernel as `clustering`.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes (or nbunch) as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
             "average_neighbor_degree": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/assortativity/neighbor_degree.py#L10",
-                "additional_docs": "The nodes are chunked into `node_chunks` and then the average degree of the neighborhood of each node for all `node_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/assortativity/neighbor_degree.py#L11",
+                "additional_docs": "The degrees are read off the CSR adjacency of `G` as row and column sums, and the nodes are chunked into `node_chunks`. For all `node_chunks`, the sums of the target degrees of the neighbors are then computed in parallel over `n_jobs` number of CPU cores, as the product of the rows of the chunk of the (weighted) adjacency, or of its transpose for the predecessors, with the vector of the target degrees.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes (or nbunch) as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
@@ -119,31 +129,43 @@ def get_info():
                 },
             },
             "clustering": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L146",
-                "additional_docs": "The nodes are chunked into `node_chunks` and then the clustering coefficient for all `node_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L163",
+                "additional_docs": "The nodes are chunked into `node_chunks` and then the clustering coefficient for all `node_chunks` is computed in parallel over `n_jobs` number of CPU cores. The triangles of each node are read off the diagonal of ``S @ S @ S``, where `S` is a CSR matrix shared by all the workers holding the cube roots of the normalized edge weights (the symmetrized ``A + A.T`` for directed graphs), so the same kernel covers all four un/weighted and un/directed variants.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes (or nbunch) as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
             "cn_soundarajan_hopcroft": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L200",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L795",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the number of common neighbors for all `pairs_chunks` is computed in parallel, using community information, over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel; all the other non-edges have a score of zero and are left out.',
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
             "colliders": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/dag.py#L37",
-                "additional_docs": "The parallel implementation first divides the nodes into chunks and then creates a generator to lazily yield 3-node tuples that represent colliders for each `node_chunk`, and then employs joblib's `Parallel` function to execute these computations in parallel across `n_jobs` number of CPU cores.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/dag.py#L42",
+                "additional_docs": "The parallel implementation divides the nodes into batches holding a bounded number of colliders, as the in-degrees make it grow quadratically, and yields the colliders of each batch as soon as a worker finishes it, in no particular order. The graph is shared with the workers through a file rather than pickled into every task.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the nodes into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, each of which is further split into bounded batches. The default chunking is done by slicing the nodes into `n_jobs` number of chunks."
                 },
             },
             "common_neighbor_centrality": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L158",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L750",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the common neighbor centrality for all `pairs_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
+                },
+            },
+            "connected_components": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/connected.py#L42",
+                "additional_docs": "The connected components are found in parallel as in `number_connected_components`, and are generated in the same order as networkx does, that is, by their first node in `G`.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. Each chunk holds the edges of its nodes. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
                 },
             },
             "edge_betweenness_centrality": {
@@ -153,6 +175,13 @@ def get_info():
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
+            "eigenvector_centrality": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/centrality/eigenvector.py#L11",
+                "additional_docs": "The power iteration runs on the same shared row blocks as `pagerank`, here of the transposed (weighted) adjacency of `G`. At every step, each worker multiplies its block with the current vector, adds the current vector to it to iterate with ``A + I`` as networkx does, and returns the sum of the squares of its rows, which are added up into the norm the next vector is divided by.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, whose rows form a block. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of in-edges."
+                },
+            },
             "harmonic_centrality": {
                 "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/centrality/harmonic.py#L10",
                 "additional_docs": "The parallel computation is implemented by dividing the nodes into chunks and computing harmonic centrality for each chunk concurrently.",
@@ -160,18 +189,49 @@ def get_info():
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
+            "is_attracting_component": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/attracting.py#L71",
+                "additional_docs": "A graph is a single attracting component if and only if it is not empty and strongly connected, that is, if a node reaches and is reached from all the others. The forward and backward searches from the first node run in parallel.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "Unused, as there are only the two searches to run in parallel."
+                },
+            },
+            "is_isolate": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/isolate.py#L53",
+                "additional_docs": "A node is isolated if it has no neighbor, that is, if its row of the CSR adjacency (and its column, for directed graphs) is empty. This is read off the adjacency dicts of `n` directly, so nothing is run in parallel.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "Unused, as a single node is checked."
+                },
+            },
             "is_reachable": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/tournament.py#L15",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/tournament.py#L16",
                 "additional_docs": "The function parallelizes the calculation of two neighborhoods of vertices in `G` and checks closure conditions for each neighborhood subset in parallel.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
+            "is_weakly_connected": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/weakly_connected.py#L66",
+                "additional_docs": "The answer is False without looking for the components if `G` has fewer than `n - 1` edges or a node without any neighbor. Otherwise the weakly connected components are found in parallel as in `number_weakly_connected_components`.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. Each chunk holds the out-edges of its nodes. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
+                },
+            },
+            "isolates": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/isolate.py#L31",
+                "additional_docs": "The isolated nodes are found from the array of the degrees as in `number_of_isolates`, and are generated in the order of `G`, as networkx does.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "Unused, as nothing is run in parallel."
+                },
+            },
             "jaccard_coefficient": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L80",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L576",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the jaccard coefficient for all `pairs_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel; all the other non-edges have a score of zero and are left out.',
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
             "johnson": {
@@ -181,109 +241,174 @@ def get_info():
                     'get_chunks : str, function (default = "chunks")': "A function that takes in an iterable of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `G.nodes` into `n_jobs` number of chunks."
                 },
             },
+            "katz_centrality": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/centrality/katz.py#L11",
+                "additional_docs": "The power iteration runs on the same shared row blocks as `pagerank`, here of the transposed (weighted) adjacency of `G`. At every step, each worker multiplies its block with the current vector, scales it by `alpha`, adds `beta` to it and returns the L1 distance between its rows of the two vectors, which are added up to check the convergence.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, whose rows form a block. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of in-edges."
+                },
+            },
+            "latapy_clustering": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/bipartite/cluster.py#L12",
+                "additional_docs": "In the parallel implementation we divide the nodes into chunks and compute the bipartite clustering coefficients for all `node_chunk` in parallel. Each worker reads the second neighbors of its nodes, and the number of neighbors they share with them, off the rows of the products of a shared CSR adjacency with itself, so neighbor sets are never intersected one by one.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in an iterable of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `G.nodes` (or `nodes`) into `n_jobs` number of chunks."
+                },
+            },
+            "link_prediction_features": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L986",
+                "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then all the requested link prediction scores of every chunk are computed together in parallel over `n_jobs` number of CPU cores. The common neighbors of each pair are found once and shared by all the metrics.",
+                "additional_parameters": {
+                    "G : graph": "A NetworkX undirected graph.",
+                    "ebunch : iterable of node pairs, optional (default = None)": "The pairs to score, as in `resource_allocation_index`.",
+                    "metrics : list of str, optional (default = None)": 'The scores to compute, among "resource_allocation_index", "jaccard_coefficient", "adamic_adar_index" and "preferential_attachment". If None, all of them are computed.',
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel.',
+                    "features : NumPy structured array": 'One record per pair, with the fields "u" and "v" holding the nodes of the pair, followed by one field per metric, in the order of `metrics`. The preferential attachment is an integer, the other scores are floats.',
+                },
+            },
             "local_efficiency": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/efficiency_measures.py#L11",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/efficiency_measures.py#L16",
                 "additional_docs": "The parallel computation is implemented by dividing the nodes into chunks and then computing and adding global efficiencies of all node in all chunks, in parallel, and then adding all these sums and dividing by the total number of nodes at the end.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking splits the nodes into `n_jobs` chunks of about the same sum of cubed degrees."
+                },
+            },
+            "node_connected_component": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/connected.py#L66",
+                "additional_docs": "The component of `n` is found by a breadth-first search from `n`, which only visits the nodes of that component. Labelling the components of all the nodes in parallel would cost more, so nothing is run in parallel.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "Unused, as nothing is run in parallel."
                 },
             },
             "node_redundancy": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/bipartite/redundancy.py#L12",
-                "additional_docs": "In the parallel implementation we divide the nodes into chunks and compute the node redundancy coefficients for all `node_chunk` in parallel.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/bipartite/redundancy.py#L11",
+                "additional_docs": "In the parallel implementation we divide the nodes into chunks and compute the node redundancy coefficients for all `node_chunk` in parallel. Each worker enumerates the pairs of neighbors of its nodes as arrays of rows of a shared CSR adjacency, and counts the neighbors shared by every pair at once, from the elementwise product of their rows. The pairs of a node of large degree are instead counted by blocks of its neighbors, from the products of their rows with each other, so memory stays bounded.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in an iterable of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `G.nodes` (or `nodes`) into `n_jobs` number of chunks."
                 },
             },
             "number_attracting_components": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/attracting.py#L9",
-                "additional_docs": "The parallel computation is implemented by dividing the list of attracting components into chunks and then finding the length of each chunk in parallel and then adding all the lengths at the end.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/attracting.py#L18",
+                "additional_docs": "The strongly connected components are first found in parallel as in `number_strongly_connected_components`. The rows of the CSR adjacency are then divided into chunks, and every worker returns the components left by an edge out of its nodes. The attracting components are the ones that no edge leaves.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of attracting components as input and returns an iterable `component_chunks`. The default chunking is done by slicing the list of attracting components into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, whose out-edges are checked by the same worker. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
                 },
             },
             "number_connected_components": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/connected.py#L9",
-                "additional_docs": "The parallel computation is implemented by dividing the list of connected components into chunks and then finding the length of each chunk in parallel and then adding all the lengths at the end.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/connected.py#L13",
+                "additional_docs": "The parallel computation is implemented by dividing the edges of the CSR adjacency of `G` into chunks, finding the connected components of each chunk of edges in parallel, and merging the partial components at the end.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of connected components as input and returns an iterable `component_chunks`. The default chunking is done by slicing the list of connected components into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. Each chunk holds the edges of its nodes. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
                 },
             },
             "number_of_isolates": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/isolate.py#L9",
-                "additional_docs": "The parallel computation is implemented by dividing the list of isolated nodes into chunks and then finding the length of each chunk in parallel and then adding all the lengths at the end.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/isolate.py#L8",
+                "additional_docs": "The degrees of all the nodes are read into an array, from the lengths of the adjacency dicts (plus those of the predecessor dicts for directed graphs), and the zero degrees are counted at once. Reading the lengths is cheaper than sending any part of the graph to the workers, so nothing is run in parallel.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the isolated nodes as input and returns an iterable `isolate_chunks`. The default chunking is done by slicing the `isolates` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "Unused, as nothing is run in parallel."
                 },
             },
             "number_strongly_connected_components": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/strongly_connected.py#L9",
-                "additional_docs": "The parallel computation is implemented by dividing the list of strongly connected components into chunks and then finding the length of each chunk in parallel and then adding all the lengths at the end.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/strongly_connected.py#L16",
+                "additional_docs": "The parallel computation is implemented with a forward-backward decomposition over the CSR adjacency of `G`, shared by all the workers.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of strongly connected components as input and returns an iterable `component_chunks`. The default chunking is done by slicing the list of strongly connected components into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of sets of nodes, each made of whole strongly connected components, and returns an iterable `component_chunks`. The default chunking splits the list into `n_jobs` chunks with about the same number of edges."
                 },
             },
             "number_weakly_connected_components": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/weakly_connected.py#L9",
-                "additional_docs": "The parallel computation is implemented by dividing the list of weakly connected components into chunks and then finding the length of each chunk in parallel and then adding all the lengths at the end.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/weakly_connected.py#L17",
+                "additional_docs": "The parallel computation is implemented by dividing the edges of the CSR adjacency of `G` into chunks, finding the components of each chunk of edges in parallel, regardless of their direction, and merging the partial components at the end, as in `number_connected_components`.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. Each chunk holds the out-edges of its nodes. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
+                },
+            },
+            "pagerank": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_analysis/pagerank_alg.py#L10",
+                "additional_docs": "The parallel computation is implemented by splitting the rows of the transposed transition matrix of `G` into blocks, which are shared once with the workers. At every step of the power iteration, each worker multiplies its block with the current vector, adds the teleportation and the mass of the dangling nodes to its rows of the next vector, and returns the L1 distance between its rows of the two vectors, which are added up to check the convergence.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of weakly connected components as input and returns an iterable `component_chunks`. The default chunking is done by slicing the list of weakly connected components into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, whose rows form a block. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of in-edges."
                 },
             },
             "preferential_attachment": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L133",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L703",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the preferential attachment for all `pairs_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
             "ra_index_soundarajan_hopcroft": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L232",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L856",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the resource allocation index for all `pairs_chunks` is computed in parallel, using the community information, over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel; all the other non-edges have a score of zero and are left out.',
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
             "resource_allocation_index": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L55",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L513",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the resource allocation index for all `pairs_chunks` is computed in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel; all the other non-edges have a score of zero and are left out.',
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
             "square_clustering": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L22",
-                "additional_docs": "The nodes are chunked into `node_chunks` and then the square clustering coefficient for all `node_chunks` are computed in parallel over `n_jobs` number of CPU cores.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L17",
+                "additional_docs": "The nodes are chunked into `node_chunks` and then the square clustering coefficient for all `node_chunks` are computed in parallel over `n_jobs` number of CPU cores. Each worker reads its rows of ``A @ A.T`` (the number of common neighbors of a node and every other node) from a shared CSR adjacency matrix, so neighbor pairs are never enumerated.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes (or nbunch) as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
+            "strongly_connected_components": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/strongly_connected.py#L48",
+                "additional_docs": "The strongly connected components are found in parallel as in `number_strongly_connected_components`, and are generated in the order of their first node in `G`.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of sets of nodes, each made of whole strongly connected components, and returns an iterable `component_chunks`. The default chunking splits the list into `n_jobs` chunks with about the same number of edges."
+                },
+            },
             "tournament_is_strongly_connected": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/tournament.py#L76",
-                "additional_docs": "The parallel computation is implemented by dividing the nodes into chunks and then checking whether each node is reachable from each other node in parallel.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/tournament.py#L118",
+                "additional_docs": "The tournament is strongly connected if and only if, by Landau's theorem, the sum of its `k` smallest out-degrees is more than `k * (k - 1) / 2` for every `0 < k < n`. This only takes sorting the out-degrees, so no reachability check is run at all, once the CSR adjacency has been checked to be that of a tournament.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks. It is only used when `G` is not a tournament."
                 },
             },
             "triangles": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L84",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/cluster.py#L101",
                 "additional_docs": "The nodes are chunked into `node_chunks` and for all `node_chunks` the number of triangles that include a node as one vertex is computed in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
                     'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes (or nbunch) as input and returns an iterable `node_chunks`. The default chunking is done by slicing the `nodes` into `n_jobs` number of chunks."
                 },
             },
             "v_structures": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/dag.py#L13",
-                "additional_docs": "The parallel implementation first divides the nodes into chunks and then creates a generator to lazily yield 3-node tuples that represent v_structures for each `node_chunk`, and then employs joblib's `Parallel` function to execute these computations in parallel across `n_jobs` number of CPU cores.",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/dag.py#L17",
+                "additional_docs": "The parallel implementation divides the nodes into batches holding a bounded number of colliders, and the workers keep only the colliders of their batch whose parents are not adjacent, so that only the v-structures are sent back. The graph is shared with the workers through a file rather than pickled into every task, and the batches are yielded as soon as any worker finishes one, so the v-structures come out in no particular order.",
+                "additional_parameters": {
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`, each of which is further split into bounded batches. The default chunking is done by slicing the nodes into `n_jobs` number of chunks."
+                },
+            },
+            "weakly_connected_components": {
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/components/weakly_connected.py#L42",
+                "additional_docs": "The weakly connected components are found in parallel as in `number_weakly_connected_components`, and are generated in the order of their first node in `G`, as networkx does.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. The default chunking is done by slicing the nodes into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the nodes as input and returns an iterable `node_chunks`. Each chunk holds the out-edges of its nodes. The default chunking splits the nodes into `n_jobs` ranges of consecutive nodes with about the same number of edges."
                 },
             },
             "within_inter_cluster": {
-                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L264",
+                "url": "https://github.com/networkx/nx-parallel/blob/main/nx_parallel/algorithms/link_prediction.py#L921",
                 "additional_docs": "The edge pairs are chunked into `pairs_chunks` and then the ratio of within- and inter-cluster common neighbors is computed, for all `pairs_chunks` in parallel over `n_jobs` number of CPU cores.",
                 "additional_parameters": {
-                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks."
+                    'get_chunks : str, function (default = "chunks")': "A function that takes in a list of all the edges (or ebunch) as input and returns an iterable `pairs_chunks`. The default chunking is done by slicing `ebunch` into `n_jobs` number of chunks.",
+                    'candidates : str (default = "non_edges")': 'The pairs scored when `ebunch` is None. "non_edges" scores all the non-edges of `G`, as networkx does. "two_hop" only scores the non-edges whose nodes share a neighbor, which are generated in parallel; all the other non-edges have a score of zero and are left out.',
+                    "top_k : int, optional (default = None)": "If given, only the `top_k` highest scoring pairs are returned, as a list sorted by decreasing score. Every worker only sends back the best pairs of its chunk, so the result transfer does not grow with the number of pairs.",
+                    "top_k_per_node : int, optional (default = None)": "If given, only the pairs that are among the `top_k_per_node` highest scoring pairs of one of their nodes are returned, as a list sorted by decreasing score. It can be combined with `top_k`.",
                 },
             },
         },
@@ -21,6 +21,9 @@ class Redundancy(Benchmark):
     def time_node_redundancy(self, backend, n, m, edge_prob):
         _ = nx.node_redundancy(self.G, backend=backend)
 
+    def time_latapy_clustering(self, backend, n, m, edge_prob):
+        _ = nx.bipartite.latapy_clustering(self.G, backend=backend)
+
 
 def get_random_bipartite_graph(n, m, edge_prob, directed=False):
     """Ref. https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.bipartite.generators.random_graph.html"""
@@ -34,3 +34,17 @@ class Harmonic(Benchmark):
 
     def time_harmonic_centrality(self, backend, num_nodes, edge_prob):
         _ = nx.harmonic_centrality(self.G, backend=backend)
+
+
+class Eigenvector(Benchmark):
+    params = [backends, num_nodes, edge_prob]
+    param_names = ["backend", "num_nodes", "edge_prob"]
+
+    def setup(self, backend, num_nodes, edge_prob):
+        self.G = get_cached_gnp_random_graph(num_nodes, edge_prob)
+
+    def time_eigenvector_centrality(self, backend, num_nodes, edge_prob):
+        _ = nx.eigenvector_centrality(self.G, backend=backend)
+
+    def time_katz_centrality(self, backend, num_nodes, edge_prob):
+        _ = nx.katz_centrality(self.G, alpha=0.5 / num_nodes, backend=backend)
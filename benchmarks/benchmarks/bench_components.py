@@ -21,6 +21,12 @@ class Attracting(Benchmark):
     def time_number_attracting_components(self, backend, num_nodes, edge_prob):
         _ = nx.number_attracting_components(self.G, backend=backend)
 
+    def time_attracting_components(self, backend, num_nodes, edge_prob):
+        _ = list(nx.attracting_components(self.G, backend=backend))
+
+    def time_is_attracting_component(self, backend, num_nodes, edge_prob):
+        _ = nx.is_attracting_component(self.G, backend=backend)
+
 
 class Connected(Benchmark):
     params = [backends, num_nodes, edge_prob]
@@ -32,6 +38,12 @@ class Connected(Benchmark):
     def time_number_connected_components(self, backend, num_nodes, edge_prob):
         _ = nx.number_connected_components(self.G, backend=backend)
 
+    def time_connected_components(self, backend, num_nodes, edge_prob):
+        _ = list(nx.connected_components(self.G, backend=backend))
+
+    def time_node_connected_component(self, backend, num_nodes, edge_prob):
+        _ = nx.node_connected_component(self.G, 0, backend=backend)
+
 
 class StronglyConnected(Benchmark):
     params = [backends, num_nodes, edge_prob]
@@ -45,6 +57,9 @@ class StronglyConnected(Benchmark):
     def time_number_strongly_connected_components(self, backend, num_nodes, edge_prob):
         _ = nx.number_strongly_connected_components(self.G, backend=backend)
 
+    def time_strongly_connected_components(self, backend, num_nodes, edge_prob):
+        _ = list(nx.strongly_connected_components(self.G, backend=backend))
+
 
 class WeaklyConnected(Benchmark):
     params = [backends, num_nodes, edge_prob]
@@ -57,3 +72,9 @@ class WeaklyConnected(Benchmark):
 
     def time_number_weakly_connected_components(self, backend, num_nodes, edge_prob):
         _ = nx.number_weakly_connected_components(self.G, backend=backend)
+
+    def time_weakly_connected_components(self, backend, num_nodes, edge_prob):
+        _ = list(nx.weakly_connected_components(self.G, backend=backend))
+
+    def time_is_weakly_connected(self, backend, num_nodes, edge_prob):
+        _ = nx.is_weakly_connected(self.G, backend=backend)
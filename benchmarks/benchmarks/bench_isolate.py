@@ -17,3 +17,6 @@ class Isolate(Benchmark):
 
     def time_number_of_isolates(self, backend, num_nodes, edge_prob):
         _ = nx.number_of_isolates(self.G, backend=backend)
+
+    def time_isolates(self, backend, num_nodes, edge_prob):
+        _ = list(nx.isolates(self.G, backend=backend))
@@ -0,0 +1,19 @@
+from .common import (
+    backends,
+    num_nodes,
+    edge_prob,
+    get_cached_gnp_random_graph,
+    Benchmark,
+)
+import networkx as nx
+
+
+class PageRank(Benchmark):
+    params = [backends, num_nodes, edge_prob]
+    param_names = ["backend", "num_nodes", "edge_prob"]
+
+    def setup(self, backend, num_nodes, edge_prob):
+        self.G = get_cached_gnp_random_graph(num_nodes, edge_prob, is_weighted=True)
+
+    def time_pagerank(self, backend, num_nodes, edge_prob):
+        _ = nx.pagerank(self.G, backend=backend)
@@ -2,6 +2,7 @@ from .common import (
     backends,
     num_nodes,
     edge_prob,
+    seed,
     get_cached_gnp_random_graph,
     Benchmark,
 )
@@ -17,3 +18,14 @@ class Vitality(Benchmark):
 
     def time_closeness_vitality(self, backend, num_nodes, edge_prob):
         _ = nx.closeness_vitality(self.G, backend=backend)
+
+
+class SparseVitality(Benchmark):
+    params = [backends, num_nodes, [1, 2]]
+    param_names = ["backend", "num_nodes", "m"]
+
+    def setup(self, backend, num_nodes, m):
+        self.G = nx.barabasi_albert_graph(num_nodes, m, seed=seed)
+
+    def time_closeness_vitality(self, backend, num_nodes, m):
+        _ = nx.closeness_vitality(self.G, backend=backend)
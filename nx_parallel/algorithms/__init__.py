@@ -6,6 +6,7 @@ from .approximation import *
 from .assortativity import *
 from .connectivity import *
 from .components import *
+from .link_analysis import *
 
 # modules
 from .efficiency_measures import *
@@ -1,18 +1,22 @@
 import networkx as nx
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks
 from joblib import Parallel, delayed
 
 
 __all__ = ["average_neighbor_degree"]
 
 
-@nxp._configure_if_nx_active(nxp.should_skip_parallel)
+@nxp._configure_if_nx_active()
 def average_neighbor_degree(
     G, source="out", target="out", nodes=None, weight=None, get_chunks="chunks"
 ):
-    """The nodes are chunked into `node_chunks` and then the average degree of the
-    neighborhood of each node for all `node_chunks` is computed in parallel over
-    `n_jobs` number of CPU cores.
+    """The degrees are read off the CSR adjacency of `G` as row and column
+    sums, and the nodes are chunked into `node_chunks`. For all `node_chunks`,
+    the sums of the target degrees of the neighbors are then computed in
+    parallel over `n_jobs` number of CPU cores, as the product of the rows of
+    the chunk of the (weighted) adjacency, or of its transpose for the
+    predecessors, with the vector of the target degrees.
 
     networkx.average_neighbor_degree: https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.assortativity.average_neighbor_degree.html
 
@@ -23,48 +27,18 @@ def average_neighbor_degree(
         returns an iterable `node_chunks`. The default chunking is done by slicing the
         `nodes` into `n_jobs` number of chunks.
     """
-
-    def _process_chunk(source_degree, chunk):
-        avg = {}
-        for n, deg in source_degree(chunk, weight=weight):
-            if deg == 0:
-                avg[n] = 0.0
-                continue
-
-            if weight is None:
-                avg[n] = (
-                    sum(t_deg[nbr] for nbr in G_S[n])
-                    + sum(t_deg[nbr] for nbr in G_P[n])
-                ) / deg
-            else:
-                avg[n] = (
-                    sum(dd.get(weight, 1) * t_deg[nbr] for nbr, dd in G_S[n].items())
-                    + sum(dd.get(weight, 1) * t_deg[nbr] for nbr, dd in G_P[n].items())
-                ) / deg
-        return avg
+    import numpy as np
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    if G.is_directed():
-        if source == "in":
-            source_degree = G.in_degree
-        elif source == "out":
-            source_degree = G.out_degree
-        elif source == "in+out":
-            source_degree = G.degree
-        else:
+    directed = G.is_directed()
+    if directed:
+        if source not in ("in", "out", "in+out"):
             raise nx.NetworkXError(
                 f"source argument {source} must be 'in', 'out' or 'in+out'"
             )
-
-        if target == "in":
-            target_degree = G.in_degree
-        elif target == "out":
-            target_degree = G.out_degree
-        elif target == "in+out":
-            target_degree = G.degree
-        else:
+        if target not in ("in", "out", "in+out"):
             raise nx.NetworkXError(
                 f"target argument {target} must be 'in', 'out' or 'in+out'"
             )
@@ -73,35 +47,73 @@ def average_neighbor_degree(
             raise nx.NetworkXError(
                 "source and target arguments are only supported for directed graphs"
             )
-        source_degree = target_degree = G.degree
+        source = target = "in+out"
 
-    t_deg = dict(target_degree())
-
-    G_P = G_S = {n: {} for n in G}
-    if G.is_directed():
-        if "in" in source:
-            G_P = G.pred
-        if "out" in source:
-            G_S = G.succ
-    else:
-        G_S = G.adj
+    node_iter = list(G.nbunch_iter(nodes))
+    if not node_iter:
+        return {}
 
-    if nodes is None:
-        nodes = list(G)
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
 
-    n_jobs = nxp.get_n_jobs()
-
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(nodes, n_jobs)
+    # the entries count the parallel edges, so the sums are the degrees
+    A = _csr_adjacency(G, nodelist)
+    # as in networkx, the target degrees are not weighted
+    t_deg = _degree_vector(A, target, directed)
+    if weight is None:
+        s_deg = _degree_vector(A, source, directed)
+    else:
+        s_deg = _degree_vector(
+            _csr_adjacency(G, nodelist, weight=weight), source, directed
+        )
+
+    # networkx adds up the target degrees once per neighbor, weighted by the
+    # edge weight only in simple graphs
+    if weight is None or G.is_multigraph():
+        M = A.copy()
+        M.data[:] = 1
     else:
-        node_chunks = get_chunks(nodes)
+        M = _csr_adjacency(G, nodelist, weight=weight)
+    succ = M if "out" in source or not directed else None
+    pred = M.T.tocsr() if "in" in source and directed else None
 
+    n_jobs = nxp.get_n_jobs()
+    row_chunks = list(_index_chunks(node_iter, index, n_jobs, get_chunks))
     results = Parallel()(
-        delayed(_process_chunk)(source_degree, chunk) for chunk in node_chunks
+        delayed(_neighbor_degree_rows)(succ, pred, t_deg, rows) for rows in row_chunks
     )
 
     avg = {}
-    for result in results:
-        avg.update(result)
-
+    for rows, totals in zip(row_chunks, results):
+        deg = s_deg[rows]
+        values = np.divide(totals, deg, out=np.zeros(len(rows)), where=deg != 0)
+        avg.update(zip((nodelist[i] for i in rows), values.tolist()))
     return avg
+
+
+def _degree_vector(A, kind, directed):
+    """Return the degrees of all the nodes from their (weighted) adjacency
+    `A`, as the out-, in- or total degrees given by `kind`.
+    """
+    if not directed:
+        # a self-loop counts twice towards the degree of its node
+        return A.sum(axis=1) + A.diagonal()
+    if kind == "out":
+        return A.sum(axis=1)
+    if kind == "in":
+        return A.sum(axis=0)
+    return A.sum(axis=1) + A.sum(axis=0)
+
+
+def _neighbor_degree_rows(succ, pred, t_deg, rows):
+    """Return the sums of `t_deg` over the neighbors of the nodes at `rows`,
+    weighted by the entries of their rows of `succ` and of `pred`, where
+    either may be None.
+    """
+    import numpy as np
+
+    totals = np.zeros(len(rows))
+    for M in (succ, pred):
+        if M is not None:
+            totals += M[rows] @ t_deg
+    return totals
@@ -0,0 +1,42 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+def _assert_close(result, expected):
+    assert list(result) == list(expected)
+    for node, value in expected.items():
+        assert math.isclose(result[node], value, rel_tol=1e-12, abs_tol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "graph_type", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_average_neighbor_degree(graph_type, weight):
+    G = graph_type(nx.gnp_random_graph(30, 0.15, seed=42, directed=True))
+    # self-loops, parallel edges, an isolated node and partial weights
+    G.add_edges_from([(0, 0), (3, 4), (3, 4)])
+    G.add_node("a")
+    for i, (u, v, d) in enumerate(G.edges(data=True)):
+        if i % 3:
+            d["weight"] = i / 7
+    H = nxp.ParallelGraph(G)
+
+    directions = ["in", "out", "in+out"] if G.is_directed() else ["out"]
+    for source in directions:
+        for target in directions:
+            for nodes in [None, [5, "a", 0, 99]]:
+                expected = nx.average_neighbor_degree(G, source, target, nodes, weight)
+                result = nxp.average_neighbor_degree(H, source, target, nodes, weight)
+                _assert_close(result, expected)
+
+
+def test_average_neighbor_degree_invalid_direction():
+    with pytest.raises(nx.NetworkXError):
+        nxp.average_neighbor_degree(nx.path_graph(3), source="in")
+    with pytest.raises(nx.NetworkXError):
+        nxp.average_neighbor_degree(nx.path_graph(3, nx.DiGraph), target="both")
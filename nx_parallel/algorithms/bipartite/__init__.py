@@ -1 +1,2 @@
 from .redundancy import *
+from .cluster import *
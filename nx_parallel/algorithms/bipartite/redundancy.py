@@ -1,8 +1,7 @@
 from joblib import Parallel, delayed
-from networkx.algorithms.bipartite.redundancy import _node_redundancy
 import networkx as nx
 import nx_parallel as nxp
-from itertools import chain
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _row_batches
 
 
 __all__ = ["node_redundancy"]
@@ -11,7 +10,12 @@ __all__ = ["node_redundancy"]
 @nxp._configure_if_nx_active()
 def node_redundancy(G, nodes=None, get_chunks="chunks"):
     """In the parallel implementation we divide the nodes into chunks and compute
-    the node redundancy coefficients for all `node_chunk` in parallel.
+    the node redundancy coefficients for all `node_chunk` in parallel. Each
+    worker enumerates the pairs of neighbors of its nodes as arrays of rows of
+    a shared CSR adjacency, and counts the neighbors shared by every pair at
+    once, from the elementwise product of their rows. The pairs of a node of
+    large degree are instead counted by blocks of its neighbors, from the
+    products of their rows with each other, so memory stays bounded.
 
     networkx.bipartite.node_redundancy : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.bipartite.redundancy.node_redundancy.html
 
@@ -27,20 +31,101 @@ def node_redundancy(G, nodes=None, get_chunks="chunks"):
         G = G.graph_object
     if nodes is None:
         nodes = G
+    nodes = list(nodes)
     if any(len(G[v]) < 2 for v in nodes):
         raise nx.NetworkXError(
             "Cannot compute redundancy coefficient for a node"
             " that has fewer than two neighbors."
         )
+    if not nodes:
+        return {}
+
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
+    A = _neighbor_sets(G, nodelist)
+
     n_jobs = nxp.get_n_jobs()
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(nodes, n_jobs)
-    else:
-        node_chunks = get_chunks(nodes)
-    node_redundancies = Parallel()(
-        delayed(
-            lambda G, node_chunk: [(v, _node_redundancy(G, v)) for v in node_chunk]
-        )(G, node_chunk)
-        for node_chunk in node_chunks
-    )
-    return dict(chain.from_iterable((node_redundancies)))
+    row_chunks = list(_index_chunks(nodes, index, n_jobs, get_chunks))
+    results = Parallel()(delayed(_redundancy_rows)(A, rows) for rows in row_chunks)
+
+    redundancy = {}
+    for rows, values in zip(row_chunks, results):
+        redundancy.update(zip((nodelist[i] for i in rows), values.tolist()))
+    return redundancy
+
+
+def _neighbor_sets(G, nodelist):
+    """Return the CSR adjacency of `G` whose row `i` holds exactly the set
+    ``set(G[nodelist[i]])``, self-loops included, with all entries set to 1.
+    """
+    A = _csr_adjacency(G, nodelist)
+    A.data[:] = 1
+    return A
+
+
+def _redundancy_rows(A, rows, budget=1 << 22):
+    """Redundancy of the nodes at `rows` of the neighbor sets `A`.
+
+    The pairs ``(u, w)`` of neighbors of every node `v` are laid out as two
+    arrays of rows, so that the neighbors they share are counted for all the
+    pairs at once as the row sums of ``A[u] * A[w]``. A pair overlaps if it
+    shares a neighbor other than `v`. The nodes whose pairs alone exceed the
+    `budget` are left to `_hub_redundancy`.
+    """
+    import numpy as np
+
+    deg = np.diff(A.indptr)
+    # a pair costs the sum of the degrees of its nodes, and the pairs are
+    # picked out of the d * d positions of two neighbors
+    work = (deg[rows] - 1) * (A[rows] @ deg) + deg[rows] ** 2
+    redundancy = np.empty(len(rows))
+    for batch in _row_batches(work, budget):
+        r = rows[batch]
+        if len(r) == 1 and work[batch][0] > budget:
+            redundancy[batch] = _hub_redundancy(A, r[0], budget)
+            continue
+        d = deg[r]
+        # all the ordered positions (a, b) of two neighbors, keeping a < b
+        sq = d * d
+        owner = np.repeat(np.arange(len(r)), sq)
+        within = np.arange(sq.sum()) - np.repeat(np.cumsum(sq) - sq, sq)
+        a, b = np.divmod(within, d[owner])
+        keep = a < b
+        owner, a, b = owner[keep], a[keep], b[keep]
+        start = A.indptr[r][owner]
+        u, w = A.indices[start + a], A.indices[start + b]
+        v = r[owner]
+
+        common = A[u].multiply(A[w]).sum(axis=1) - A[u, v] * A[w, v]
+        overlap = np.bincount(owner, weights=common > 0, minlength=len(r))
+        redundancy[batch] = 2 * overlap / (d * (d - 1))
+    return redundancy
+
+
+def _hub_redundancy(A, v, budget=1 << 22):
+    """Redundancy of the node `v` of the neighbor sets `A`.
+
+    The neighbors shared by all the pairs of neighbors of `v` are the entries
+    of ``B @ B.T``, where ``B`` holds the rows of the neighbors. It is
+    computed for blocks of rows of ``B`` small enough for the block to hold
+    at most about `budget` entries, so the pairs are never all laid out at
+    once.
+    """
+    import numpy as np
+
+    nbrs = A.indices[A.indptr[v] : A.indptr[v + 1]]
+    d = len(nbrs)
+    B = A[nbrs]
+    BT = B.T.tocsr()
+    # the neighbor `v` is shared by the pairs adjacent to it, not counted
+    through_v = B[:, [v]].toarray().ravel()
+    step = max(1, budget // d)
+    overlap = 0
+    for start in range(0, d, step):
+        stop = min(start + step, d)
+        common = (B[start:stop] @ BT).toarray()
+        common -= np.outer(through_v[start:stop], through_v)
+        # only the pairs (a, b) with a < b
+        upper = np.arange(d) > np.arange(start, stop)[:, None]
+        overlap += np.count_nonzero((common > 0) & upper)
+    return 2 * overlap / (d * (d - 1))
@@ -0,0 +1,28 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("mode", ["dot", "min", "max"])
+@pytest.mark.parametrize("directed", [False, True])
+def test_latapy_clustering(mode, directed):
+    if directed and mode == "min":
+        pytest.skip("networkx divides by zero at nodes without out-neighbors")
+    G = nx.bipartite.random_graph(15, 10, 0.3, seed=42, directed=directed)
+    H = nxp.ParallelGraph(G)
+    for nodes in [None, [0, 3, 20]]:
+        expected = nx.bipartite.latapy_clustering(G, nodes, mode)
+        result = nxp.latapy_clustering(H, nodes, mode)
+        assert list(result) == list(expected)
+        for v in expected:
+            assert math.isclose(result[v], expected[v])
+
+
+def test_latapy_clustering_errors():
+    with pytest.raises(nx.NetworkXError):
+        nxp.latapy_clustering(nx.complete_graph(3))
+    with pytest.raises(nx.NetworkXError):
+        nxp.latapy_clustering(nx.path_graph(3), mode="avg")
@@ -0,0 +1,48 @@
+import math
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import nx_parallel as nxp
+from nx_parallel.algorithms.bipartite.redundancy import (
+    _neighbor_sets,
+    _redundancy_rows,
+)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_node_redundancy(seed):
+    G = nx.bipartite.random_graph(15, 10, 0.3, seed=seed)
+    nodes = [v for v in G if len(G[v]) >= 2]
+    expected = nx.bipartite.node_redundancy(G, nodes)
+    result = nxp.node_redundancy(nxp.ParallelGraph(G), nodes)
+    assert list(result) == list(expected)
+    for v in nodes:
+        assert math.isclose(result[v], expected[v])
+
+
+def test_node_redundancy_not_bipartite():
+    # the shared neighbor must differ from the node itself, even on a triangle
+    G = nx.complete_graph(4)
+    G.add_edge(0, 0)
+    assert nxp.node_redundancy(G) == nx.bipartite.node_redundancy(G)
+
+
+def test_node_redundancy_few_neighbors():
+    with pytest.raises(nx.NetworkXError):
+        nxp.node_redundancy(nx.path_graph(3))
+
+
+@pytest.mark.parametrize("budget", [1, 50, 400])
+def test_redundancy_rows_budget(budget):
+    # the nodes whose pairs exceed the budget are split into blocks of pairs
+    G = nx.bipartite.random_graph(8, 30, 0.5, seed=42)
+    G.add_edge(0, 0)
+    nodes = [v for v in G if len(G[v]) >= 2]
+    expected = nx.bipartite.node_redundancy(G, nodes)
+    nodelist = list(G)
+    index = {v: i for i, v in enumerate(nodelist)}
+    rows = np.array([index[v] for v in nodes])
+    result = _redundancy_rows(_neighbor_sets(G, nodelist), rows, budget)
+    assert np.allclose(result, [expected[v] for v in nodes])
@@ -1,2 +1,4 @@
 from .betweenness import *
 from .harmonic import *
+from .eigenvector import *
+from .katz import *
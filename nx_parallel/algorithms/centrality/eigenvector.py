@@ -0,0 +1,79 @@
+import networkx as nx
+import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _edge_chunks
+from nx_parallel.utils.spmv import _spmv_engine
+
+__all__ = ["eigenvector_centrality"]
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+@nx.utils.not_implemented_for("multigraph")
+def eigenvector_centrality(
+    G, max_iter=100, tol=1.0e-6, nstart=None, weight=None, get_chunks="chunks"
+):
+    """The power iteration runs on the same shared row blocks as `pagerank`,
+    here of the transposed (weighted) adjacency of `G`. At every step, each
+    worker multiplies its block with the current vector, adds the current vector
+    to it to iterate with ``A + I`` as networkx does, and returns the sum of
+    the squares of its rows, which are added up into the norm the next vector
+    is divided by.
+
+    networkx.eigenvector_centrality : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.centrality.eigenvector_centrality.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`, whose rows form a block. The default chunking
+        splits the nodes into `n_jobs` ranges of consecutive nodes with about the
+        same number of in-edges.
+    """
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    if len(G) == 0:
+        raise nx.NetworkXPointlessConcept(
+            "cannot compute centrality for the null graph"
+        )
+    nodelist = list(G)
+    # If no initial vector is provided, start with the all-ones vector.
+    if nstart is None:
+        nstart = dict.fromkeys(nodelist, 1)
+    if all(v == 0 for v in nstart.values()):
+        raise nx.NetworkXError("initial vector cannot have all zero values")
+    x = np.array([nstart[v] for v in nodelist], dtype=float)
+    x /= sum(nstart.values())
+
+    A = _csr_adjacency(G, nodelist, weight=weight or None, dtype=float)
+    T = A.T.tocsr()
+
+    n_jobs = nxp.get_n_jobs()
+    if get_chunks == "chunks":
+        rows_chunks = _edge_chunks(T, n_jobs)
+    else:
+        index = {node: i for i, node in enumerate(nodelist)}
+        rows_chunks = list(_index_chunks(nodelist, index, n_jobs, get_chunks))
+
+    nnodes = len(nodelist)
+    with _spmv_engine(T, rows_chunks) as spmv:
+        for _ in range(max_iter):
+            xlast = x
+            x, (squares,) = spmv(xlast, _eigenvector_step)
+            # the norm is assumed to be one if it vanishes numerically
+            x /= np.sqrt(squares) or 1
+            # Check for convergence (in the L_1 norm).
+            if np.absolute(x - xlast).sum() < nnodes * tol:
+                return dict(zip(nodelist, map(float, x)))
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _eigenvector_step(y, x):
+    """Return the rows of ``(A + I) @ x``, given the rows `y` of ``A @ x``,
+    and the sum of their squares.
+    """
+    import numpy as np
+
+    y = y + x
+    return y, (np.square(y).sum(),)
@@ -0,0 +1,92 @@
+import networkx as nx
+import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _edge_chunks
+from nx_parallel.utils.spmv import _spmv_engine
+
+__all__ = ["katz_centrality"]
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+@nx.utils.not_implemented_for("multigraph")
+def katz_centrality(
+    G,
+    alpha=0.1,
+    beta=1.0,
+    max_iter=1000,
+    tol=1.0e-6,
+    nstart=None,
+    normalized=True,
+    weight=None,
+    get_chunks="chunks",
+):
+    """The power iteration runs on the same shared row blocks as `pagerank`,
+    here of the transposed (weighted) adjacency of `G`. At every step, each
+    worker multiplies its block with the current vector, scales it by `alpha`,
+    adds `beta` to it and returns the L1 distance between its rows of the two
+    vectors, which are added up to check the convergence.
+
+    networkx.katz_centrality : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.centrality.katz_centrality.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`, whose rows form a block. The default chunking
+        splits the nodes into `n_jobs` ranges of consecutive nodes with about the
+        same number of in-edges.
+    """
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    if len(G) == 0:
+        return {}
+
+    nodelist = list(G)
+    if nstart is None:
+        # choose starting vector with entries of 0
+        x = np.zeros(len(nodelist))
+    else:
+        x = np.array([nstart[v] for v in nodelist], dtype=float)
+
+    try:
+        b = np.full(len(nodelist), float(beta))
+    except (TypeError, ValueError, AttributeError) as err:
+        if set(beta) != set(G):
+            raise nx.NetworkXError(
+                "beta dictionary must have a value for every node"
+            ) from err
+        b = np.array([beta[v] for v in nodelist], dtype=float)
+
+    A = _csr_adjacency(G, nodelist, weight=weight, dtype=float)
+    T = A.T.tocsr()
+
+    n_jobs = nxp.get_n_jobs()
+    if get_chunks == "chunks":
+        rows_chunks = _edge_chunks(T, n_jobs)
+    else:
+        index = {node: i for i, node in enumerate(nodelist)}
+        rows_chunks = list(_index_chunks(nodelist, index, n_jobs, get_chunks))
+
+    nnodes = len(nodelist)
+    with _spmv_engine(T, rows_chunks, b) as spmv:
+        for _ in range(max_iter):
+            x, (error,) = spmv(x, _katz_step, alpha)
+            # check convergence
+            if error < nnodes * tol:
+                if normalized:
+                    norm = np.sqrt(np.square(x).sum())
+                    x *= 1.0 / norm if norm else 1.0
+                return dict(zip(nodelist, map(float, x)))
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _katz_step(y, x, b, alpha):
+    """Return the rows of ``alpha * A @ x + b``, given the rows `y` of
+    ``A @ x``, and their L1 distance to the rows of `x`.
+    """
+    import numpy as np
+
+    y = alpha * y + b
+    return y, (np.absolute(y - x).sum(),)
@@ -0,0 +1,41 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_eigenvector_centrality(directed, weight):
+    G = nx.gnp_random_graph(60, 0.1, seed=42, directed=directed)
+    if directed:
+        # keep the graph strongly connected for the power iteration
+        nx.add_cycle(G, list(G))
+    for i, (u, v, d) in enumerate(G.edges(data=True)):
+        d["weight"] = i % 4 + 1
+    H = nxp.ParallelGraph(G)
+
+    expected = nx.eigenvector_centrality(G, weight=weight, backend="networkx")
+    result = nxp.eigenvector_centrality(H, weight=weight)
+    assert list(result) == list(expected)
+    for v in G:
+        assert math.isclose(result[v], expected[v], rel_tol=1e-9)
+
+    nstart = {v: i + 1 for i, v in enumerate(G)}
+    expected = nx.eigenvector_centrality(G, nstart=nstart, backend="networkx")
+    result = nxp.eigenvector_centrality(H, nstart=nstart)
+    for v in G:
+        assert math.isclose(result[v], expected[v], rel_tol=1e-9)
+
+
+def test_eigenvector_centrality_errors():
+    with pytest.raises(nx.NetworkXPointlessConcept):
+        nxp.eigenvector_centrality(nx.Graph())
+    with pytest.raises(nx.NetworkXError):
+        nxp.eigenvector_centrality(nx.path_graph(3), nstart={0: 0, 1: 0, 2: 0})
+    with pytest.raises(nx.PowerIterationFailedConvergence):
+        nxp.eigenvector_centrality(nx.path_graph(50), max_iter=2)
+    with pytest.raises(nx.NetworkXNotImplemented):
+        nxp.eigenvector_centrality(nx.MultiGraph([(0, 1)]))
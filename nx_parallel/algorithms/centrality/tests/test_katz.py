@@ -0,0 +1,38 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("normalized", [False, True])
+def test_katz_centrality(directed, normalized):
+    G = nx.gnp_random_graph(60, 0.1, seed=42, directed=directed)
+    G.add_node("a")
+    for i, (u, v, d) in enumerate(G.edges(data=True)):
+        d["weight"] = i % 4 + 1
+    H = nxp.ParallelGraph(G)
+    beta = {v: i % 3 + 1 for i, v in enumerate(G)}
+
+    for kwargs in [
+        {"alpha": 0.05},
+        {"alpha": 0.02, "weight": "weight"},
+        {"alpha": 0.05, "beta": beta, "nstart": beta},
+    ]:
+        expected = nx.katz_centrality(
+            G, normalized=normalized, backend="networkx", **kwargs
+        )
+        result = nxp.katz_centrality(H, normalized=normalized, **kwargs)
+        assert list(result) == list(expected)
+        for v in G:
+            assert math.isclose(result[v], expected[v], rel_tol=1e-9)
+
+
+def test_katz_centrality_errors():
+    assert nxp.katz_centrality(nx.Graph()) == {}
+    with pytest.raises(nx.NetworkXError):
+        nxp.katz_centrality(nx.path_graph(3), beta={0: 1})
+    with pytest.raises(nx.PowerIterationFailedConvergence):
+        nxp.katz_centrality(nx.complete_graph(10), alpha=0.5, max_iter=20)
@@ -1,14 +1,9 @@
-from itertools import combinations, chain
 from collections import Counter
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _row_batches
 import networkx as nx
-from networkx.algorithms.cluster import (
-    _directed_weighted_triangles_and_degree_iter,
-    _directed_triangles_and_degree_iter,
-    _weighted_triangles_and_degree_iter,
-    _triangles_and_degree_iter,
-)
+from networkx.algorithms.cluster import _triangles_and_degree_iter
 
 __all__ = [
     "square_clustering",
@@ -22,7 +17,9 @@ __all__ = [
 def square_clustering(G, nodes=None, get_chunks="chunks"):
     """The nodes are chunked into `node_chunks` and then the square clustering
     coefficient for all `node_chunks` are computed in parallel over `n_jobs` number
-    of CPU cores.
+    of CPU cores. Each worker reads its rows of ``A @ A.T`` (the number of common
+    neighbors of a node and every other node) from a shared CSR adjacency matrix,
+    so neighbor pairs are never enumerated.
 
     networkx.square_clustering: https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.cluster.square_clustering.html
 
@@ -33,53 +30,73 @@ def square_clustering(G, nodes=None, get_chunks="chunks"):
         returns an iterable `node_chunks`. The default chunking is done by slicing the
         `nodes` into `n_jobs` number of chunks.
     """
-
-    def _compute_clustering_chunk(node_iter_chunk):
-        result_chunk = []
-        for v in node_iter_chunk:
-            clustering = 0
-            potential = 0
-            v_nbrs = G_nbrs_as_sets[v]
-            for u, w in combinations(v_nbrs, 2):
-                u_nbrs = G_nbrs_as_sets[u]
-                w_nbrs = G_nbrs_as_sets[w]
-                squares = len((u_nbrs & w_nbrs) - {v})
-                clustering += squares
-                degm = squares + 1
-                if w in u_nbrs:
-                    degm += 1
-                potential += (len(u_nbrs) - degm) + (len(w_nbrs) - degm) + squares
-            if potential > 0:
-                clustering /= potential
-            result_chunk += [(v, clustering)]
-        return result_chunk
-
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    # ignore self-loops as per networkx 3.5
-    G_nbrs_as_sets = {node: set(G[node]) - {node} for node in G}
-
     node_iter = list(G.nbunch_iter(nodes))
+    if not node_iter:
+        return {}
 
-    n_jobs = nxp.get_n_jobs()
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
 
-    if get_chunks == "chunks":
-        node_iter_chunks = nxp.chunks(node_iter, n_jobs)
-    else:
-        node_iter_chunks = get_chunks(node_iter)
+    # ignore self-loops as per networkx 3.5
+    A = _csr_adjacency(G, nodelist, simple=True)
+    directed = G.is_directed()
+    AT = A.T.tocsr() if directed else A
 
-    result = Parallel()(
-        delayed(_compute_clustering_chunk)(node_iter_chunk)
-        for node_iter_chunk in node_iter_chunks
+    n_jobs = nxp.get_n_jobs()
+
+    row_chunks = list(_index_chunks(node_iter, index, n_jobs, get_chunks))
+    results = Parallel()(
+        delayed(_square_clustering_rows)(A, AT, rows, directed) for rows in row_chunks
     )
-    clustering = dict(chain.from_iterable(result))
+
+    clustering = {}
+    for rows, values in zip(row_chunks, results):
+        clustering.update(zip((nodelist[i] for i in rows), values.tolist()))
 
     if nodes in G:
         return clustering[nodes]
     return clustering
 
 
+def _square_clustering_rows(A, AT, rows, directed):
+    """Square clustering of the nodes at `rows` of the simple adjacency `A`.
+
+    With ``P = A[rows] @ AT``, ``P[v, x]`` is the number of common neighbors of
+    `v` and `x` (`AT` is the transpose of `A`), so every term of networkx's formula is a row reduction of `P`:
+    squares sum ``p * (p - 1) / 2`` over the 2-hop neighborhood of `v`, triangles
+    sum `P` over the neighbors of `v`.
+    """
+    import numpy as np
+
+    deg = np.diff(A.indptr)
+    Ar = A[rows]
+    deg_sum = Ar @ deg
+    clustering = np.zeros(len(rows))
+    for batch in _row_batches(deg_sum):
+        Ab = Ar[batch]
+        r = rows[batch]
+        P = Ab @ AT
+        if directed:
+            # x only closes a square if it is reachable in at most two steps
+            P = P.multiply((Ab @ A + Ab) > 0).tocsr()
+        triangles = Ab.multiply(P).sum(axis=1)
+        P = P.tocoo()
+        p = P.data.astype(np.float64)
+        keep = P.col != r[P.row]
+        squares = (
+            np.bincount(P.row[keep], weights=(p * (p - 1))[keep], minlength=len(r)) // 2
+        )
+        k = deg[r]
+        potential = (k - 1) * deg_sum[batch] - k * (k - 1) - triangles - squares
+        clustering[batch] = np.divide(
+            squares, potential, out=np.zeros(len(r)), where=potential > 0
+        )
+    return clustering
+
+
 @nxp._configure_if_nx_active(should_run=nxp.should_run_if_nodes_none)
 def triangles(G, nodes=None, get_chunks="chunks"):
     """The nodes are chunked into `node_chunks` and for all `node_chunks`
@@ -146,7 +163,11 @@ def triangles(G, nodes=None, get_chunks="chunks"):
 def clustering(G, nodes=None, weight=None, get_chunks="chunks"):
     """The nodes are chunked into `node_chunks` and then the clustering
     coefficient for all `node_chunks` is computed in parallel over `n_jobs`
-    number of CPU cores.
+    number of CPU cores. The triangles of each node are read off the diagonal of
+    ``S @ S @ S``, where `S` is a CSR matrix shared by all the workers holding the
+    cube roots of the normalized edge weights (the symmetrized ``A + A.T`` for
+    directed graphs), so the same kernel covers all four un/weighted and
+    un/directed variants.
 
     networkx.clustering: https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.cluster.clustering.html
 
@@ -157,52 +178,28 @@ def clustering(G, nodes=None, weight=None, get_chunks="chunks"):
         returns an iterable `node_chunks`. The default chunking is done by slicing the
         `nodes` into `n_jobs` number of chunks.
     """
-
-    def _compute_chunk(chunk):
-        if G.is_directed():
-            if weight is not None:
-                td_iter = _directed_weighted_triangles_and_degree_iter(G, chunk, weight)
-                clusterc = {
-                    v: 0 if t == 0 else t / ((dt * (dt - 1) - 2 * db) * 2)
-                    for v, dt, db, t in td_iter
-                }
-            else:
-                td_iter = _directed_triangles_and_degree_iter(G, chunk)
-                clusterc = {
-                    v: 0 if t == 0 else t / ((dt * (dt - 1) - 2 * db) * 2)
-                    for v, dt, db, t in td_iter
-                }
-        else:
-            # The formula 2*T/(d*(d-1)) from docs is t/(d*(d-1)) here b/c t==2*T
-            if weight is not None:
-                td_iter = _weighted_triangles_and_degree_iter(G, chunk, weight)
-                clusterc = {
-                    v: 0 if t == 0 else t / (d * (d - 1)) for v, d, t in td_iter
-                }
-            else:
-                td_iter = _triangles_and_degree_iter(G, chunk)
-                clusterc = {
-                    v: 0 if t == 0 else t / (d * (d - 1)) for v, d, t, _ in td_iter
-                }
-        return clusterc
-
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
+    if G.is_multigraph():
+        raise nx.NetworkXNotImplemented("not implemented for multigraph type")
+
     n_jobs = nxp.get_n_jobs()
 
     nodes_to_chunk = list(G.nbunch_iter(nodes))
 
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(nodes_to_chunk, n_jobs)
-    else:
-        node_chunks = get_chunks(nodes_to_chunk)
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
+    S, denom = _clustering_arrays(G, nodelist, weight)
 
-    results = Parallel()(delayed(_compute_chunk)(chunk) for chunk in node_chunks)
+    row_chunks = list(_index_chunks(nodes_to_chunk, index, n_jobs, get_chunks))
+    results = Parallel()(
+        delayed(_clustering_rows)(S, denom, rows) for rows in row_chunks
+    )
 
     clusterc = {}
-    for result in results:
-        clusterc.update(result)
+    for rows, result in zip(row_chunks, results):
+        clusterc.update(zip((nodelist[i] for i in rows), result.tolist()))
 
     if nodes in G:
         return clusterc[nodes]
@@ -215,7 +212,9 @@ def average_clustering(
 ):
     """The nodes are chunked into `node_chunks` and then the average clustering
     coefficient for all `node_chunks` is computed in parallel over `n_jobs`
-    number of CPU cores.
+    number of CPU cores. Each worker only returns the sum of its coefficients, the
+    number of nonzero coefficients and the number of nodes in its chunk, computed
+    with the same shared array kernel as `clustering`.
 
     networkx.average_clustering: https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.cluster.average_clustering.html
 
@@ -226,32 +225,97 @@ def average_clustering(
         returns an iterable `node_chunks`. The default chunking is done by slicing the
         `nodes` into `n_jobs` number of chunks.
     """
-
-    def _compute_chunk(chunk):
-        return nx.clustering(G, chunk, weight=weight)
-
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
+    if G.is_multigraph():
+        raise nx.NetworkXNotImplemented("not implemented for multigraph type")
+
     n_jobs = nxp.get_n_jobs()
 
-    if nodes is None:
-        nodes = list(G)
+    nodes = list(dict.fromkeys(G.nbunch_iter(nodes)))
 
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(nodes, n_jobs)
-    else:
-        node_chunks = get_chunks(nodes)
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
+    S, denom = _clustering_arrays(G, nodelist, weight)
 
-    results = Parallel()(delayed(_compute_chunk)(chunk) for chunk in node_chunks)
+    tasks = (
+        delayed(_average_clustering_rows)(S, denom, rows)
+        for rows in _index_chunks(nodes, index, n_jobs, get_chunks)
+    )
 
-    clustering = {}
-    for result in results:
-        clustering.update(result)
+    total = count_nonzero = count = 0
+    for chunk_total, chunk_nonzero, chunk_count in Parallel()(tasks):
+        total += chunk_total
+        count_nonzero += chunk_nonzero
+        count += chunk_count
+
+    return total / (count if count_zeros else count_nonzero)
 
-    c = clustering.values()
 
-    if not count_zeros:
-        c = [v for v in c if abs(v) > 0]
+def _clustering_arrays(G, nodelist, weight=None):
+    """Return the CSR matrix `S` whose cubed diagonal holds the triangles of
+    each node, and the array of the matching clustering denominators.
 
-    return sum(c) / len(c)
+    `S` is the simple adjacency matrix ``A`` for undirected graphs and
+    ``A + A.T`` for directed ones, as in Fagiolo's directed clustering. For
+    weighted graphs the entries of ``A`` are replaced by the cube roots of the
+    edge weights normalized by the maximum weight, so that the products along
+    a triangle are the geometric means used by networkx.
+    """
+    import numpy as np
+
+    A = _csr_adjacency(G, nodelist, simple=True)
+    if weight is None:
+        W = A
+    else:
+        if G.number_of_edges() == 0:
+            max_weight = 1
+        else:
+            max_weight = max(d.get(weight, 1) for u, v, d in G.edges(data=True))
+        W = _csr_adjacency(G, nodelist, weight, dtype=float, self_loops=False)
+        W.data = np.cbrt(W.data / max_weight)
+
+    if not G.is_directed():
+        deg = A.sum(axis=1)
+        return W, deg * (deg - 1)
+    S = (W + W.T).tocsr()
+    dtotal = (A + A.T).sum(axis=1)
+    dbidirectional = A.multiply(A.T).sum(axis=1)
+    return S, 2 * (dtotal * (dtotal - 1) - 2 * dbidirectional)
+
+
+def _clustering_rows(S, denom, rows):
+    """Clustering coefficients of the nodes at `rows`, with the triangles of a
+    node `v` given by ``(S @ S @ S)[v, v]``.
+
+    With negative weights the triangles of a node can cancel out, and their sum
+    is then set to zero when it is within rounding error of it, as networkx
+    sums them in another order and gets an exact zero.
+    """
+    import numpy as np
+
+    Sr = S[rows]
+    triangles = np.zeros(len(rows))
+    signed = S.dtype.kind == "f" and (S.data < 0).any()
+    if signed:
+        absS = abs(S)
+        scale = np.zeros(len(rows))
+    for batch in _row_batches(Sr @ np.diff(S.indptr)):
+        Sb = Sr[batch]
+        triangles[batch] = Sb.multiply(Sb @ S).sum(axis=1)
+        if signed:
+            Sb = abs(Sb)
+            scale[batch] = Sb.multiply(Sb @ absS).sum(axis=1)
+    if signed:
+        eps = S.shape[0] * np.finfo(float).eps
+        triangles[np.abs(triangles) <= eps * scale] = 0
+    d = denom[rows]
+    return np.divide(triangles, d, out=np.zeros(len(rows)), where=triangles != 0)
+
+
+def _average_clustering_rows(S, denom, rows):
+    import numpy as np
+
+    clusterc = _clustering_rows(S, denom, rows)
+    return float(clusterc.sum()), int(np.count_nonzero(clusterc)), len(clusterc)
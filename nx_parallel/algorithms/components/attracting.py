@@ -1,35 +1,126 @@
-from networkx import attracting_components
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _edge_chunks
+from nx_parallel.algorithms.components.connected import _label_sets
+from nx_parallel.algorithms.components.strongly_connected import (
+    _reachable,
+    _scc_labels,
+)
 
-__all__ = ["number_attracting_components"]
+__all__ = [
+    "number_attracting_components",
+    "attracting_components",
+    "is_attracting_component",
+]
 
 
-@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
 def number_attracting_components(G, get_chunks="chunks"):
-    """The parallel computation is implemented by dividing the list
-    of attracting components into chunks and then finding the length
-    of each chunk in parallel and then adding all the lengths at the end.
+    """The strongly connected components are first found in parallel as in
+    `number_strongly_connected_components`. The rows of the CSR adjacency are
+    then divided into chunks, and every worker returns the components left by
+    an edge out of its nodes. The attracting components are the ones that no
+    edge leaves.
 
     networkx.number_attracting_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.number_attracting_components.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
-        A function that takes in a list of attracting components as input and returns
-        an iterable `component_chunks`. The default chunking is done by slicing the
-        list of attracting components into `n_jobs` number of chunks.
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`, whose out-edges are checked by the same worker. The
+        default chunking splits the nodes into `n_jobs` ranges of consecutive nodes
+        with about the same number of edges.
     """
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    n_jobs = nxp.get_n_jobs()
+    _, _, sinks = _attracting_labels(G, get_chunks)
+    return int(sinks.sum())
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+def attracting_components(G, get_chunks="chunks"):
+    """The attracting components are found in parallel as in
+    `number_attracting_components`, and are generated in the order of their
+    first node in `G`.
+
+    networkx.attracting_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.attracting_components.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`, whose out-edges are checked by the same worker. The
+        default chunking splits the nodes into `n_jobs` ranges of consecutive nodes
+        with about the same number of edges.
+    """
+    import numpy as np
 
-    ac = list(attracting_components(G))
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    nodelist, labels, sinks = _attracting_labels(G, get_chunks)
+    keep = sinks[labels]
+    # renumber the attracting components from 0, keeping their order
+    ranks = np.cumsum(sinks) - 1
+    return _label_sets([v for v, k in zip(nodelist, keep) if k], ranks[labels[keep]])
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+def is_attracting_component(G, get_chunks="chunks"):
+    """A graph is a single attracting component if and only if it is not empty
+    and strongly connected, that is, if a node reaches and is reached from all
+    the others. The forward and backward searches from the first node run in
+    parallel.
+
+    networkx.is_attracting_component : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.is_attracting_component.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        Unused, as there are only the two searches to run in parallel.
+    """
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    if len(G) == 0:
+        return False
+    A = _csr_adjacency(G)
+    forward, backward = Parallel()(delayed(_reachable)(M, 0) for M in (A, A.T))
+    return bool(forward.all() and backward.all())
+
+
+def _attracting_labels(G, get_chunks="chunks"):
+    """Return the list of the nodes of `G`, the labels of their strongly
+    connected components, and the mask of the labels of the attracting ones.
+    """
+    import numpy as np
+
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist, self_loops=False)
+    labels = _scc_labels(nodelist, A)
+
+    n_jobs = nxp.get_n_jobs()
     if get_chunks == "chunks":
-        component_chunks = nxp.chunks(ac, n_jobs)
+        rows_chunks = _edge_chunks(A, n_jobs)
     else:
-        component_chunks = get_chunks(ac)
+        index = {node: i for i, node in enumerate(nodelist)}
+        rows_chunks = _index_chunks(nodelist, index, n_jobs, get_chunks)
+
+    left = Parallel()(delayed(_left_labels)(A, labels, rows) for rows in rows_chunks)
+    sinks = np.ones(int(labels.max()) + 1 if labels.size else 0, dtype=bool)
+    for chunk_left in left:
+        sinks[chunk_left] = False
+    return nodelist, labels, sinks
+
+
+def _left_labels(A, labels, rows):
+    """Return the labels of the components left by an edge out of the nodes
+    at `rows`.
+    """
+    import numpy as np
 
-    results = Parallel()(delayed(len)(chunk) for chunk in component_chunks)
-    return sum(results)
+    E = A[rows].tocoo()
+    src, dst = labels[rows[E.row]], labels[E.col]
+    return np.unique(src[src != dst])
@@ -1,35 +1,170 @@
-from networkx import connected_components
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _edge_chunks
 
-__all__ = ["number_connected_components"]
+__all__ = [
+    "number_connected_components",
+    "connected_components",
+    "node_connected_component",
+]
 
 
 @nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
 def number_connected_components(G, get_chunks="chunks"):
-    """The parallel computation is implemented by dividing the list
-    of connected components into chunks and then finding the length
-    of each chunk in parallel and then adding all the lengths at the end.
+    """The parallel computation is implemented by dividing the edges of the
+    CSR adjacency of `G` into chunks, finding the connected components of each
+    chunk of edges in parallel, and merging the partial components at the end.
+
+    Every worker returns, for every node, the smallest node it is connected to
+    through the edges of its chunk. Linking every node to these partial roots
+    gives a graph with at most `n_jobs * n` edges that has the same connected
+    components as `G`.
 
     networkx.number_connected_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.number_connected_components.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
-        A function that takes in a list of connected components as input and returns
-        an iterable `component_chunks`. The default chunking is done by slicing the
-        list of connected components into `n_jobs` number of chunks.
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`. Each chunk holds the edges of its nodes. The default
+        chunking splits the nodes into `n_jobs` ranges of consecutive nodes with
+        about the same number of edges.
+    """
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    A = _csr_adjacency(G)
+    labels = _component_labels(list(G), A, get_chunks)
+    return int(labels.max()) + 1 if labels.size else 0
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+def connected_components(G, get_chunks="chunks"):
+    """The connected components are found in parallel as in
+    `number_connected_components`, and are generated in the same order as
+    networkx does, that is, by their first node in `G`.
+
+    networkx.connected_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.connected_components.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`. Each chunk holds the edges of its nodes. The default
+        chunking splits the nodes into `n_jobs` ranges of consecutive nodes with
+        about the same number of edges.
     """
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist)
+    return _label_sets(nodelist, _component_labels(nodelist, A, get_chunks))
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+def node_connected_component(G, n, get_chunks="chunks"):
+    """The component of `n` is found by a breadth-first search from `n`, which
+    only visits the nodes of that component. Labelling the components of all
+    the nodes in parallel would cost more, so nothing is run in parallel.
+
+    networkx.node_connected_component : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.node_connected_component.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        Unused, as nothing is run in parallel.
+    """
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    adj = G._adj
+    seen = {n}
+    nextlevel = [n]
+    while nextlevel:
+        thislevel = nextlevel
+        nextlevel = []
+        for v in thislevel:
+            for w in adj[v]:
+                if w not in seen:
+                    seen.add(w)
+                    nextlevel.append(w)
+    return seen
+
+
+def _component_labels(nodelist, A, get_chunks="chunks"):
+    """Return the array of the labels of the connected components of the
+    nodes, ignoring the direction of the edges of their CSR adjacency `A`.
+
+    The components are numbered from 0 in the order of their first node.
+    """
+    n = len(nodelist)
     n_jobs = nxp.get_n_jobs()
 
-    cc = list(connected_components(G))
     if get_chunks == "chunks":
-        component_chunks = nxp.chunks(cc, n_jobs)
+        rows_chunks = _edge_chunks(A, n_jobs)
     else:
-        component_chunks = get_chunks(cc)
+        index = {node: i for i, node in enumerate(nodelist)}
+        rows_chunks = _index_chunks(nodelist, index, n_jobs, get_chunks)
+
+    roots = Parallel()(delayed(_partial_roots)(A, rows) for rows in rows_chunks)
+    return _merge_roots(roots, n)
+
+
+def _partial_roots(A, rows):
+    """Return, for every node, the smallest node it is connected to by the
+    edges out of the nodes at `rows`.
+    """
+    import numpy as np
+    import scipy as sp
+
+    n = A.shape[0]
+    E = A[rows].tocoo()
+    C = sp.sparse.csr_array(
+        (np.ones(E.nnz, dtype=np.int8), (rows[E.row], E.col)), shape=(n, n)
+    )
+    labels = sp.sparse.csgraph.connected_components(C, directed=False)[1]
+    # the nodes are in order, so the first node of every label is its smallest
+    first = np.unique(labels, return_index=True)[1]
+    return first[labels]
+
+
+def _merge_roots(roots, n):
+    """Return the component labels of the union of the partitions given by
+    the arrays of partial roots `roots`, numbered in the order of their first
+    node.
+    """
+    import numpy as np
+    import scipy as sp
+
+    if not roots:
+        return np.arange(n)
+    nodes = np.tile(np.arange(n), len(roots))
+    M = sp.sparse.csr_array(
+        (np.ones(len(nodes), dtype=np.int8), (nodes, np.concatenate(roots))),
+        shape=(n, n),
+    )
+    labels = sp.sparse.csgraph.connected_components(M, directed=False)[1]
+    return _first_node_labels(labels)
+
+
+def _first_node_labels(labels):
+    """Renumber `labels` from 0 in the order of their first node."""
+    import numpy as np
+
+    _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.intp)
+    rank[np.argsort(first)] = np.arange(len(first))
+    return rank[inverse]
+
+
+def _label_sets(nodelist, labels):
+    """Generate the sets of nodes of every label, in order of label."""
+    import numpy as np
 
-    results = Parallel()(delayed(len)(chunk) for chunk in component_chunks)
-    return sum(results)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.cumsum(np.bincount(labels))
+    start = 0
+    for stop in bounds.tolist():
+        yield {nodelist[i] for i in order[start:stop].tolist()}
+        start = stop
@@ -1,36 +1,184 @@
-from networkx import strongly_connected_components
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _cost_chunks
+from nx_parallel.algorithms.components.connected import (
+    _first_node_labels,
+    _label_sets,
+)
 
-__all__ = ["number_strongly_connected_components"]
+__all__ = [
+    "number_strongly_connected_components",
+    "strongly_connected_components",
+]
 
 
-@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
 def number_strongly_connected_components(G, get_chunks="chunks"):
-    """The parallel computation is implemented by dividing the list
-    of strongly connected components into chunks and then finding the length
-    of each chunk in parallel and then adding all the lengths at the end.
+    """The parallel computation is implemented with a forward-backward
+    decomposition over the CSR adjacency of `G`, shared by all the workers.
+
+    The nodes left without in- or out-edges are first trimmed away, repeatedly,
+    as they are components of their own. The nodes reachable forward and
+    backward from a pivot are then found in parallel; they meet in the
+    component of the pivot, and every other component lies within the nodes
+    reached only forward, only backward, or not at all. These three sets are
+    split into their weakly connected pieces, and the pieces are dealt to the
+    workers, which find their strongly connected components.
 
     networkx.number_strongly_connected_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.number_strongly_connected_components.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
-        A function that takes in a list of strongly connected components as input
-        and returns an iterable `component_chunks`. The default chunking is done
-        by slicing the list of strongly connected components into `n_jobs` number
-        of chunks.
+        A function that takes in a list of sets of nodes, each made of whole
+        strongly connected components, and returns an iterable `component_chunks`.
+        The default chunking splits the list into `n_jobs` chunks with about the
+        same number of edges.
     """
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    n_jobs = nxp.get_n_jobs()
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist, self_loops=False)
+    labels = _scc_labels(nodelist, A, get_chunks)
+    return int(labels.max()) + 1 if labels.size else 0
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+def strongly_connected_components(G, get_chunks="chunks"):
+    """The strongly connected components are found in parallel as in
+    `number_strongly_connected_components`, and are generated in the order of
+    their first node in `G`.
+
+    networkx.strongly_connected_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.strongly_connected_components.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of sets of nodes, each made of whole
+        strongly connected components, and returns an iterable `component_chunks`.
+        The default chunking splits the list into `n_jobs` chunks with about the
+        same number of edges.
+    """
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist, self_loops=False)
+    return _label_sets(nodelist, _scc_labels(nodelist, A, get_chunks))
+
+
+def _scc_labels(nodelist, A, get_chunks="chunks"):
+    """Return the array of the labels of the strongly connected components of
+    the nodes, numbered from 0 in the order of their first node.
+
+    `A` is the CSR adjacency of the graph without self-loops.
+    """
+    import numpy as np
+    import scipy as sp
 
-    scc = list(strongly_connected_components(G))
+    n = len(nodelist)
+    AT = A.T.tocsr()
+    # every node starts as a component of its own, named after its position
+    roots = np.arange(n)
+    alive = _trim(A, AT)
+
+    region = np.full(n, -1)
+    if alive.any():
+        degree = np.diff(A.indptr) * np.diff(AT.indptr)
+        pivot = int(np.argmax(np.where(alive, degree, -1)))
+        forward, backward = Parallel()(delayed(_reachable)(M, pivot) for M in (A, AT))
+        roots[forward & backward] = pivot
+        rest = alive & ~(forward & backward)
+        region[rest] = forward[rest] + 2 * backward[rest]
+
+    # the weakly connected pieces of the nodes reached in the same way
+    E = A.tocoo()
+    keep = (region[E.row] >= 0) & (region[E.row] == region[E.col])
+    P = sp.sparse.csr_array(
+        (np.ones(np.count_nonzero(keep), dtype=np.int8), (E.row[keep], E.col[keep])),
+        shape=(n, n),
+    )
+    piece = sp.sparse.csgraph.connected_components(P, directed=False)[1]
+    size = np.bincount(piece)
+    big = np.flatnonzero(size > 1)
+    order = np.argsort(piece, kind="stable")
+    pieces = np.split(order, np.cumsum(size)[:-1])
+
+    n_jobs = nxp.get_n_jobs()
     if get_chunks == "chunks":
-        component_chunks = nxp.chunks(scc, n_jobs)
+        cost = np.bincount(piece[E.row[keep]], minlength=len(size)) + size
+        rows_chunks = [
+            np.concatenate([pieces[p] for p in big[chunk]])
+            for chunk in _cost_chunks(cost[big], n_jobs)
+        ]
     else:
-        component_chunks = get_chunks(scc)
+        index = {v: i for i, v in enumerate(nodelist)}
+        sets = [{nodelist[i] for i in pieces[p].tolist()} for p in big]
+        rows_chunks = [
+            np.fromiter((index[v] for c in chunk for v in c), dtype=np.intp)
+            for chunk in get_chunks(sets)
+        ]
+
+    rows_chunks = [rows for rows in rows_chunks if rows.size]
+    results = Parallel()(delayed(_strong_roots)(A, rows) for rows in rows_chunks)
+    for rows, chunk_roots in zip(rows_chunks, results):
+        roots[rows] = chunk_roots
+    return _first_node_labels(roots)
+
+
+def _trim(A, AT):
+    """Return the mask of the nodes left after repeatedly removing the nodes
+    without in- or out-edges from the other remaining nodes.
+
+    The removed nodes are on no cycle, so each is a component of its own.
+    Trimming stops once a round removes only a handful of nodes, as long
+    chains would otherwise take one round per node.
+    """
+    import numpy as np
+
+    n = A.shape[0]
+    outdeg = np.diff(A.indptr)
+    indeg = np.diff(AT.indptr)
+    alive = np.ones(n, dtype=bool)
+    removed = np.flatnonzero((outdeg == 0) | (indeg == 0))
+    while removed.size:
+        alive[removed] = False
+        if removed.size < 64:
+            break
+        succ, pred = A[removed].indices, AT[removed].indices
+        nodes, counts = np.unique(succ, return_counts=True)
+        indeg[nodes] -= counts
+        nodes, counts = np.unique(pred, return_counts=True)
+        outdeg[nodes] -= counts
+        touched = np.union1d(succ, pred)
+        touched = touched[alive[touched]]
+        removed = touched[(indeg[touched] == 0) | (outdeg[touched] == 0)]
+    return alive
+
+
+def _reachable(A, source):
+    """Return the mask of the nodes reachable from `source` in `A`."""
+    import numpy as np
+    import scipy as sp
+
+    reached = np.zeros(A.shape[0], dtype=bool)
+    order = sp.sparse.csgraph.breadth_first_order(
+        A, source, directed=True, return_predecessors=False
+    )
+    reached[order] = True
+    return reached
+
+
+def _strong_roots(A, rows):
+    """Return, for each node at `rows`, the position of the first node of its
+    strongly connected component in the subgraph induced by `rows`.
+    """
+    import numpy as np
+    import scipy as sp
 
-    results = Parallel()(delayed(len)(chunk) for chunk in component_chunks)
-    return sum(results)
+    labels = sp.sparse.csgraph.connected_components(
+        A[rows][:, rows], directed=True, connection="strong"
+    )[1]
+    first = np.unique(labels, return_index=True)[1]
+    return rows[first[labels]]
@@ -0,0 +1,24 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.gnp_random_graph(80, 0.02, seed=42, directed=True),
+        nx.scale_free_graph(100, seed=42),
+        nx.MultiDiGraph([(0, 1), (1, 0), (1, 2), (3, 3)]),
+        nx.cycle_graph(5, create_using=nx.DiGraph),
+        nx.DiGraph(),
+    ],
+)
+def test_attracting_components(G):
+    H = nxp.ParallelGraph(G)
+    expected = {frozenset(c) for c in nx.attracting_components(G)}
+    result = [frozenset(c) for c in nxp.attracting_components(H)]
+    assert len(result) == len(expected)
+    assert set(result) == expected
+    assert nxp.number_attracting_components(H) == len(expected)
+    assert nxp.is_attracting_component(H) == nx.is_attracting_component(G)
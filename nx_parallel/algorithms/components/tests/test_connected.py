@@ -0,0 +1,26 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.gnp_random_graph(60, 0.03, seed=42),
+        nx.MultiGraph([(0, 1), (0, 1), (2, 2), (3, 4)]),
+        nx.relabel_nodes(nx.gnp_random_graph(30, 0.05, seed=42), str),
+        nx.empty_graph(0),
+        # a filter view whose adjacency dicts overstate the neighbors
+        nx.MultiGraph([(0, 1), (0, 1), (1, 2), (3, 4)]).edge_subgraph(
+            [(0, 1, 1), (3, 4, 0)]
+        ),
+    ],
+)
+def test_connected_components(G):
+    H = nxp.ParallelGraph(G)
+    # the components are generated in the same order as networkx
+    assert list(nxp.connected_components(H)) == list(nx.connected_components(G))
+    assert nxp.number_connected_components(H) == nx.number_connected_components(G)
+    for n in G:
+        assert nxp.node_connected_component(H, n) == nx.node_connected_component(G, n)
@@ -0,0 +1,24 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.gnp_random_graph(80, 0.02, seed=42, directed=True),
+        nx.scale_free_graph(100, seed=42),
+        # long enough for trimming to stop before the end of the path
+        nx.path_graph(200, create_using=nx.DiGraph),
+        nx.MultiDiGraph([(0, 1), (1, 0), (1, 0), (2, 2), (2, 3)]),
+        nx.DiGraph(),
+    ],
+)
+def test_strongly_connected_components(G):
+    H = nxp.ParallelGraph(G)
+    expected = {frozenset(c) for c in nx.strongly_connected_components(G)}
+    result = [frozenset(c) for c in nxp.strongly_connected_components(H)]
+    assert len(result) == len(expected)
+    assert set(result) == expected
+    assert nxp.number_strongly_connected_components(H) == len(expected)
@@ -0,0 +1,29 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.gnp_random_graph(80, 0.015, seed=42, directed=True),
+        nx.scale_free_graph(100, seed=42),
+        nx.MultiDiGraph([(0, 1), (1, 0), (2, 2), (3, 4), (4, 5), (6, 5)]),
+        nx.path_graph(4, create_using=nx.DiGraph),
+    ],
+)
+def test_weakly_connected_components(G):
+    H = nxp.ParallelGraph(G)
+    expected = list(nx.weakly_connected_components(G))
+    assert list(nxp.weakly_connected_components(H)) == expected
+    assert nxp.number_weakly_connected_components(H) == len(expected)
+    assert nxp.is_weakly_connected(H) == nx.is_weakly_connected(G)
+
+
+def test_is_weakly_connected_trivial():
+    with pytest.raises(nx.NetworkXPointlessConcept):
+        nxp.is_weakly_connected(nx.DiGraph())
+    assert nxp.is_weakly_connected(nx.DiGraph([(0, 0)]))
+    # enough edges, but node 3 only has a self-loop
+    assert not nxp.is_weakly_connected(nx.DiGraph([(0, 1), (1, 2), (2, 0), (3, 3)]))
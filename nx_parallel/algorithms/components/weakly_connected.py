@@ -1,36 +1,99 @@
-from networkx import weakly_connected_components
-from joblib import Parallel, delayed
+import networkx as nx
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency
+from nx_parallel.algorithms.components.connected import (
+    _component_labels,
+    _label_sets,
+)
 
-__all__ = ["number_weakly_connected_components"]
+__all__ = [
+    "number_weakly_connected_components",
+    "weakly_connected_components",
+    "is_weakly_connected",
+]
 
 
-@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
 def number_weakly_connected_components(G, get_chunks="chunks"):
-    """The parallel computation is implemented by dividing the list
-    of weakly connected components into chunks and then finding the length
-    of each chunk in parallel and then adding all the lengths at the end.
+    """The parallel computation is implemented by dividing the edges of the
+    CSR adjacency of `G` into chunks, finding the components of each chunk of
+    edges in parallel, regardless of their direction, and merging the partial
+    components at the end, as in `number_connected_components`.
 
     networkx.number_weakly_connected_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.number_weakly_connected_components.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
-        A function that takes in a list of weakly connected components as input
-        and returns an iterable `component_chunks`. The default chunking is done
-        by slicing the list of weakly connected components into `n_jobs` number
-        of chunks.
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`. Each chunk holds the out-edges of its nodes. The
+        default chunking splits the nodes into `n_jobs` ranges of consecutive nodes
+        with about the same number of edges.
     """
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    n_jobs = nxp.get_n_jobs()
+    nodelist = list(G)
+    labels = _component_labels(nodelist, _csr_adjacency(G, nodelist), get_chunks)
+    return int(labels.max()) + 1 if labels.size else 0
 
-    wcc = list(weakly_connected_components(G))
-    if get_chunks == "chunks":
-        component_chunks = nxp.chunks(wcc, n_jobs)
-    else:
-        component_chunks = get_chunks(wcc)
 
-    results = Parallel()(delayed(len)(chunk) for chunk in component_chunks)
-    return sum(results)
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+def weakly_connected_components(G, get_chunks="chunks"):
+    """The weakly connected components are found in parallel as in
+    `number_weakly_connected_components`, and are generated in the order of
+    their first node in `G`, as networkx does.
+
+    networkx.weakly_connected_components : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.weakly_connected_components.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`. Each chunk holds the out-edges of its nodes. The
+        default chunking splits the nodes into `n_jobs` ranges of consecutive nodes
+        with about the same number of edges.
+    """
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    nodelist = list(G)
+    labels = _component_labels(nodelist, _csr_adjacency(G, nodelist), get_chunks)
+    return _label_sets(nodelist, labels)
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+def is_weakly_connected(G, get_chunks="chunks"):
+    """The answer is False without looking for the components if `G` has
+    fewer than `n - 1` edges or a node without any neighbor. Otherwise the
+    weakly connected components are found in parallel as in
+    `number_weakly_connected_components`.
+
+    networkx.is_weakly_connected : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.components.is_weakly_connected.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`. Each chunk holds the out-edges of its nodes. The
+        default chunking splits the nodes into `n_jobs` ranges of consecutive nodes
+        with about the same number of edges.
+    """
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    n = len(G)
+    if n == 0:
+        raise nx.NetworkXPointlessConcept(
+            """Connectivity is undefined for the null graph."""
+        )
+    if G.number_of_edges() < n - 1:
+        return False
+
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist, self_loops=False)
+    if n > 1 and not (np.diff(A.indptr) + np.bincount(A.indices, minlength=n)).all():
+        return False
+    return not _component_labels(nodelist, A, get_chunks).any()
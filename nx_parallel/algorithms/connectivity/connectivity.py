@@ -2,12 +2,14 @@
 Parallel flow based connectivity algorithms
 """
 
-import itertools
+import networkx as nx
 from networkx.algorithms.flow import build_residual_network
 from networkx.algorithms.connectivity.utils import build_auxiliary_node_connectivity
 from networkx.algorithms.connectivity.connectivity import local_node_connectivity
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _cost_chunks
+from nx_parallel.utils.shared import _shared_object, _load_shared
 
 __all__ = [
     "all_pairs_node_connectivity",
@@ -23,18 +25,31 @@ def all_pairs_node_connectivity(G, nbunch=None, flow_func=None, get_chunks="chun
     execute these computations in parallel across `n_jobs` number of CPU cores. At the end,
     the results are aggregated into a single dictionary and returned.
 
+    Before running any flow, lower and upper bounds on the connectivity of
+    every pair are computed from the degrees, the common neighbors, the
+    reachability and, in undirected graphs, the biconnected components. The
+    pairs whose bounds meet are answered directly. The flows of the other pairs
+    are dealt to the chunks by decreasing upper bound, and stop once they reach
+    it.
+
+    The auxiliary digraph and the residual network reused by all the flow
+    computations are written once to a temporary file and loaded only once by
+    each worker, so the tasks themselves only carry their pairs of nodes.
+
     networkx.all_pairs_node_connectivity : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.connectivity.connectivity.all_pairs_node_connectivity.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
-        A function that takes in `list(iter_func(nbunch, 2))` as input and returns
-        an iterable `pairs_chunks`, here `iter_func` is `permutations` in case of
-        directed graphs and `combinations` in case of undirected graphs. The default
-        is to create chunks by slicing the list into `n_jobs` number of chunks, such
-        that size of each chunk is atmost 10, and at least 1.
+        A function that takes in the list of the pairs of nodes of `nbunch` whose
+        connectivity needs a flow computation, sorted by decreasing upper bound, and
+        returns an iterable `pairs_chunks`. Only one of `(u, v)` and `(v, u)` is
+        listed in case of undirected graphs. The default chunking splits the pairs
+        into `n_jobs` chunks of about the same sum of upper bounds.
     """
 
+    import numpy as np
+
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
@@ -43,38 +58,119 @@ def all_pairs_node_connectivity(G, nbunch=None, flow_func=None, get_chunks="chun
     else:
         nbunch = set(nbunch)
 
+    nodes = list(nbunch)
+    all_pairs = {n: {} for n in nodes}
+    if len(nodes) < 2:
+        return all_pairs
+
     directed = G.is_directed()
+    nodelist = list(G)
+    index = {v: i for i, v in enumerate(nodelist)}
+    lower, upper = _node_connectivity_bounds(G, nodelist, [index[v] for v in nodes])
     if directed:
-        iter_func = itertools.permutations
+        us, vs = np.nonzero(~np.eye(len(nodes), dtype=bool))
     else:
-        iter_func = itertools.combinations
+        us, vs = np.triu_indices(len(nodes), 1)
+    lower, upper = lower[us, vs], upper[us, vs]
 
-    all_pairs = {n: {} for n in nbunch}
+    # pairs whose bounds meet are answered without a flow
+    exact = lower == upper
+    for i, j, k in zip(us[exact].tolist(), vs[exact].tolist(), upper[exact].tolist()):
+        all_pairs[nodes[i]][nodes[j]] = k
+        if not directed:
+            all_pairs[nodes[j]][nodes[i]] = k
 
-    # Reuse auxiliary digraph and residual network
-    H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, "capacity")
-    kwargs = {"flow_func": flow_func, "auxiliary": H, "residual": R}
-
-    def _process_pair_chunk(pairs_chunk):
-        return [
-            (u, v, local_node_connectivity(G, u, v, **kwargs)) for u, v in pairs_chunk
-        ]
+    # the remaining flows are scheduled by decreasing upper bound
+    todo = np.flatnonzero(~exact)
+    todo = todo[np.argsort(-upper[todo], kind="stable")]
+    if not todo.size:
+        return all_pairs
+    bounds = upper[todo]
+    pairs = [(nodes[i], nodes[j]) for i, j in zip(us[todo].tolist(), vs[todo].tolist())]
+    cutoffs = dict(zip(pairs, bounds.tolist()))
 
-    pairs = list(iter_func(nbunch, 2))
     n_jobs = nxp.get_n_jobs()
     if get_chunks == "chunks":
-        pairs_chunks = nxp.chunks(pairs, n_jobs, max_chunk_size=10)
+        chunks = _cost_chunks(bounds, n_jobs)
+        pairs_chunks = [[pairs[p] for p in chunk.tolist()] for chunk in chunks]
     else:
         pairs_chunks = get_chunks(pairs)
 
-    nc_chunk_generator = (  # nc = node connectivity
-        delayed(_process_pair_chunk)(pairs_chunk) for pairs_chunk in pairs_chunks
-    )
+    # Reuse auxiliary digraph and residual network
+    H = build_auxiliary_node_connectivity(G)
+    R = build_residual_network(H, "capacity")
+
+    with _shared_object((G, H, R)) as path:
+        nc_chunk_generator = (  # nc = node connectivity
+            delayed(_pairs_node_connectivity)(
+                path, pairs_chunk, [cutoffs[pair] for pair in pairs_chunk], flow_func
+            )
+            for pairs_chunk in pairs_chunks
+        )
+        nc_chunks = list(Parallel()(nc_chunk_generator))
 
-    for nc_chunk in Parallel()(nc_chunk_generator):
+    for nc_chunk in nc_chunks:
         for u, v, k in nc_chunk:
             all_pairs[u][v] = k
             if not directed:
                 all_pairs[v][u] = k
     return all_pairs
+
+
+def _node_connectivity_bounds(G, nodelist, rows):
+    """Return the matrices of lower and upper bounds of the local node
+    connectivity between the nodes at positions `rows` of `nodelist`.
+
+    Every common neighbor of `u` and `v`, and the edge between them, is a path
+    of its own, and no more paths than the neighbors of `u` (or of `v`) can
+    leave it. Unreachable pairs have no path at all. In undirected graphs, all
+    the paths between two nodes stay within the biconnected component they
+    share, so the degrees are counted within it, and pairs that do not share a
+    biconnected component of at least three nodes are joined by exactly one
+    path, while the others are joined by at least two.
+    """
+    import numpy as np
+    import scipy as sp
+
+    A = _csr_adjacency(G, nodelist, simple=True)
+    B = A[rows]
+    lower = (B @ A[:, rows]).toarray() + B[:, rows].toarray()
+
+    if G.is_directed():
+        D = sp.sparse.csgraph.shortest_path(A, unweighted=True, indices=rows)
+        reach = np.isfinite(D[:, rows])
+        upper = np.minimum.outer(np.diff(B.indptr), A.sum(axis=0)[rows])
+        return np.where(reach, np.maximum(lower, 1), 0), np.where(reach, upper, 0)
+
+    labels = sp.sparse.csgraph.connected_components(A, directed=False)[1][rows]
+    same = labels[:, None] == labels
+    lower = np.where(same, np.maximum(lower, 1), 0)
+    upper = same.astype(lower.dtype)
+
+    position = np.full(len(nodelist), -1)
+    position[rows] = np.arange(len(rows))
+    index = {v: i for i, v in enumerate(nodelist)}
+    for block in nx.biconnected_components(G):
+        if len(block) < 3:
+            continue
+        block = np.fromiter(map(index.__getitem__, block), np.intp, len(block))
+        deg = A[block][:, block].sum(axis=1)
+        keep = position[block] >= 0
+        inner = np.ix_(position[block[keep]], position[block[keep]])
+        upper[inner] = np.minimum.outer(deg[keep], deg[keep])
+        lower[inner] = np.maximum(lower[inner], 2)
+    return lower, upper
+
+
+def _pairs_node_connectivity(path, pairs_chunk, cutoffs, flow_func):
+    """Return ``(u, v, k)`` for the pairs in `pairs_chunk`, with `G` and its
+    auxiliary and residual networks loaded from `path`.
+
+    The flows stop early once they reach the upper bounds in `cutoffs`.
+    """
+    G, H, R = _load_shared(path)
+    kwargs = {"flow_func": flow_func, "auxiliary": H, "residual": R}
+    return [
+        (u, v, local_node_connectivity(G, u, v, cutoff=cutoff, **kwargs))
+        for (u, v), cutoff in zip(pairs_chunk, cutoffs)
+    ]
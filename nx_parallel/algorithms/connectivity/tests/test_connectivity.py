@@ -0,0 +1,24 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        # blocks joined by cut vertices and bridges, plus an isolated part
+        nx.disjoint_union(nx.barbell_graph(5, 2), nx.cycle_graph(4)),
+        nx.gnp_random_graph(25, 0.2, seed=42),
+        nx.gnp_random_graph(25, 0.15, seed=42, directed=True),
+        nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 2), (2, 0), (3, 4)]),
+    ],
+)
+def test_all_pairs_node_connectivity_bounds(G):
+    H = nxp.ParallelGraph(G)
+    expected = nx.all_pairs_node_connectivity(G)
+    assert nxp.all_pairs_node_connectivity(H) == expected
+
+    nbunch = list(G)[::2]
+    expected = nx.all_pairs_node_connectivity(G, nbunch=nbunch)
+    assert nxp.all_pairs_node_connectivity(H, nbunch=nbunch) == expected
@@ -1,6 +1,10 @@
+from contextlib import ExitStack
 from itertools import combinations
+import weakref
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _row_batches
+from nx_parallel.utils.shared import _shared_object, _load_shared
 
 
 __all__ = [
@@ -11,10 +15,12 @@ __all__ = [
 
 @nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
 def v_structures(G, get_chunks="chunks"):
-    """The parallel implementation first divides the nodes into chunks and then
-    creates a generator to lazily yield 3-node tuples that represent v_structures
-    for each `node_chunk`, and then employs joblib's `Parallel` function to
-    execute these computations in parallel across `n_jobs` number of CPU cores.
+    """The parallel implementation divides the nodes into batches holding a
+    bounded number of colliders, and the workers keep only the colliders of their
+    batch whose parents are not adjacent, so that only the v-structures are
+    sent back. The graph is shared with the workers through a file rather than
+    pickled into every task, and the batches are yielded as soon as any worker
+    finishes one, so the v-structures come out in no particular order.
 
     networkx.dag.v_structures: https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.dag.v_structures.html
 
@@ -22,23 +28,23 @@ def v_structures(G, get_chunks="chunks"):
     ----------
     get_chunks : str, function (default = "chunks")
         A function that takes in a list of all the nodes as input and
-        returns an iterable `node_chunks`. The default chunking is done
-        by slicing the nodes into `n_jobs` number of chunks.
+        returns an iterable `node_chunks`, each of which is further split into
+        bounded batches. The default chunking is done by slicing the nodes into
+        `n_jobs` number of chunks.
     """
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    for p1, c, p2 in colliders(G, get_chunks=get_chunks):
-        if not (G.has_edge(p1, p2) or G.has_edge(p2, p1)):
-            yield (p1, c, p2)
+    return _stream_colliders(G, get_chunks, v_structures=True)
 
 
 @nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
 def colliders(G, get_chunks="chunks"):
-    """The parallel implementation first divides the nodes into chunks and then
-    creates a generator to lazily yield 3-node tuples that represent colliders
-    for each `node_chunk`, and then employs joblib's `Parallel` function to execute
-    these computations in parallel across `n_jobs` number of CPU cores.
+    """The parallel implementation divides the nodes into batches holding a
+    bounded number of colliders, as the in-degrees make it grow quadratically,
+    and yields the colliders of each batch as soon as a worker finishes it,
+    in no particular order. The graph is shared with the workers through a
+    file rather than pickled into every task.
 
     networkx.dag.colliders: https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.dag.colliders.html
 
@@ -46,31 +52,74 @@ def colliders(G, get_chunks="chunks"):
     ----------
     get_chunks : str, function (default = "chunks")
         A function that takes in a list of all the nodes as input and
-        returns an iterable `node_chunks`. The default chunking is done
-        by slicing the nodes into `n_jobs` number of chunks.
+        returns an iterable `node_chunks`, each of which is further split into
+        bounded batches. The default chunking is done by slicing the nodes into
+        `n_jobs` number of chunks.
     """
-
-    def _process_chunk(chunk):
-        return [
-            (p1, node, p2)
-            for node in chunk
-            for p1, p2 in combinations(G.predecessors(node), 2)
-        ]
-
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    nodes = list(G)
+    return _stream_colliders(G, get_chunks, v_structures=False)
 
-    n_jobs = nxp.get_n_jobs()
 
+def _stream_colliders(G, get_chunks="chunks", v_structures=False, batch_size=1 << 16):
+    """Return a generator of the colliders of `G`, or only of its
+    v-structures, computed in parallel for every chunk of nodes, in batches of
+    at most about `batch_size` colliders.
+
+    The tasks are dispatched before returning, so that they run with the
+    joblib configuration active at the call rather than at the first `next`.
+    """
+    import numpy as np
+
+    nodes = list(G)
     if get_chunks == "chunks":
-        node_chunks = nxp.chunks(nodes, n_jobs)
+        node_chunks = nxp.chunks(nodes, nxp.get_n_jobs())
     else:
         node_chunks = get_chunks(nodes)
 
-    collider_chunks = (delayed(_process_chunk)(chunk) for chunk in node_chunks)
-
-    for chunk in Parallel()(collider_chunks):
-        for collider in chunk:
-            yield collider
+    batches = []
+    for chunk in node_chunks:
+        chunk = list(chunk)
+        degree = np.fromiter((len(G._pred[v]) for v in chunk), np.int64, len(chunk))
+        # a node with in-degree d has d * (d - 1) / 2 colliders
+        work = degree * (degree - 1) // 2 + 1
+        batches.extend(chunk[rows] for rows in _row_batches(work, batch_size))
+    if not batches:
+        return iter(())
+
+    with ExitStack() as stack:
+        path = stack.enter_context(_shared_object(G))
+        results = Parallel(return_as="generator_unordered")(
+            delayed(_batch_colliders)(path, batch, v_structures) for batch in batches
+        )
+        stack = stack.pop_all()
+    colliders = _chain_results(results, stack)
+    # the shared file is removed once the results are consumed, or once the
+    # generator is dropped if they never are
+    weakref.finalize(colliders, stack.close)
+    return colliders
+
+
+def _chain_results(results, stack):
+    """Yield the items of all the lists in `results`, then close `stack`."""
+    try:
+        for batch_colliders in results:
+            yield from batch_colliders
+    finally:
+        stack.close()
+
+
+def _batch_colliders(path, nodes, v_structures=False):
+    """Return the colliders of the shared graph at `nodes`, keeping only the
+    ones whose parents are not adjacent if `v_structures` is True.
+    """
+    G = _load_shared(path)
+    pred, succ = G._pred, G._succ
+    result = []
+    for node in nodes:
+        for p1, p2 in combinations(pred[node], 2):
+            if v_structures and (p2 in succ[p1] or p1 in succ[p2]):
+                continue
+            result.append((p1, node, p2))
+    return result
@@ -1,8 +1,13 @@
 """Provides functions for computing the efficiency of nodes and graphs."""
 
-import networkx as nx
 from joblib import Parallel, delayed
 import nx_parallel as nxp
+from nx_parallel.utils.csr import (
+    _csr_adjacency,
+    _index_chunks,
+    _cost_chunks,
+    _row_batches,
+)
 
 __all__ = ["local_efficiency"]
 
@@ -14,30 +19,101 @@ def local_efficiency(G, get_chunks="chunks"):
     in all chunks, in parallel, and then adding all these sums and dividing by the
     total number of nodes at the end.
 
+    The global efficiency of the subgraph induced by the neighbors of a node is
+    computed by a BFS from every neighbor restricted to the neighbor set, done
+    with sparse matrix products over the CSR adjacency shared by all the
+    workers. As this costs roughly the cube of the degree, the default chunking
+    balances the sum of the cubed degrees of the chunks.
+
     networkx.local_efficiency : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.efficiency_measures.local_efficiency.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
         A function that takes in a list of all the nodes as input and returns an
-        iterable `node_chunks`. The default chunking is done by slicing the `nodes`
-        into `n_jobs` number of chunks.
+        iterable `node_chunks`. The default chunking splits the nodes into
+        `n_jobs` chunks of about the same sum of cubed degrees.
     """
 
-    def _local_efficiency_node_subset(G, chunk):
-        return sum(nx.global_efficiency(G.subgraph(G[v])) for v in chunk)
+    import numpy as np
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist)
     n_jobs = nxp.get_n_jobs()
 
     if get_chunks == "chunks":
-        node_chunks = list(nxp.chunks(G.nodes, n_jobs))
+        deg = np.diff(A.indptr).astype(float)
+        rows_chunks = _cost_chunks(deg**3, n_jobs)
     else:
-        node_chunks = get_chunks(G.nodes)
+        index = {node: i for i, node in enumerate(nodelist)}
+        rows_chunks = _index_chunks(nodelist, index, n_jobs, get_chunks)
 
     efficiencies = Parallel()(
-        delayed(_local_efficiency_node_subset)(G, chunk) for chunk in node_chunks
+        delayed(_local_efficiency_rows)(A, rows) for rows in rows_chunks
     )
-    return sum(efficiencies) / len(G)
+    return float(sum(efficiencies)) / len(G)
+
+
+def _local_efficiency_rows(A, rows):
+    """Return the sum of the local efficiencies of the nodes in `rows`.
+
+    For a batch of nodes, the neighbor sets are laid out one after the other as
+    `members`, and the subgraphs they induce are assembled into one
+    block-diagonal sparse matrix `S` by looking up the neighbors of every
+    member within the set of its own block. A BFS from many members at once is
+    then a sequence of sparse products of the frontier with `S`.
+    """
+    import numpy as np
+    import scipy as sp
+
+    n = A.shape[0]
+    deg = np.diff(A.indptr)
+    total = 0.0
+    # the work of a node is the number of entries of its neighbors' rows
+    work = A[rows] @ deg + deg[rows]
+    for batch in _row_batches(work):
+        nodes = rows[batch]
+        k = deg[nodes]
+        K = int(k.sum())
+        owner = np.repeat(np.arange(len(nodes)), k)
+        first = np.cumsum(k) - k
+        positions = np.repeat(A.indptr[nodes] - first, k) + np.arange(K)
+        members = A.indices[positions]
+
+        # members are sorted within their block, so the keys are increasing
+        keys = owner * n + members
+        R = A[members].tocoo()
+        queries = owner[R.row] * n + R.col
+        j = np.minimum(np.searchsorted(keys, queries), max(K - 1, 0))
+        keep = (keys[j] == queries) & (j != R.row)
+        S = sp.sparse.csr_array(
+            (np.ones(np.count_nonzero(keep)), (R.row[keep], j[keep])), shape=(K, K)
+        )
+
+        sums = np.zeros(len(nodes))
+        for sources in _row_batches(k[owner]):
+            sources = np.arange(K)[sources]
+            m = len(sources)
+            frontier = sp.sparse.csr_array(
+                (np.ones(m), (np.arange(m), sources)), shape=(m, K)
+            )
+            visited = frontier
+            dist = 0
+            while frontier.nnz:
+                dist += 1
+                frontier = frontier @ S
+                frontier.data[:] = 1
+                frontier = frontier - frontier.multiply(visited)
+                frontier.eliminate_zeros()
+                reached = np.diff(frontier.indptr)
+                sums += np.bincount(owner[sources], reached, len(nodes)) / dist
+                visited = visited + frontier
+
+        pairs = k * (k - 1)
+        total += np.divide(
+            sums, pairs, out=np.zeros(len(nodes)), where=pairs != 0
+        ).sum()
+    return float(total)
@@ -1,35 +1,94 @@
 import networkx as nx
-from joblib import Parallel, delayed
 import nx_parallel as nxp
 
-__all__ = ["number_of_isolates"]
+__all__ = ["number_of_isolates", "isolates", "is_isolate"]
 
 
 @nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
 def number_of_isolates(G, get_chunks="chunks"):
-    """The parallel computation is implemented by dividing the list
-    of isolated nodes into chunks and then finding the length of each chunk in parallel
-    and then adding all the lengths at the end.
+    """The degrees of all the nodes are read into an array, from the lengths
+    of the adjacency dicts (plus those of the predecessor dicts for directed
+    graphs), and the zero degrees are counted at once. Reading the lengths is
+    cheaper than sending any part of the graph to the workers, so nothing is
+    run in parallel.
 
     networkx.number_of_isolates : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.isolate.number_of_isolates.html
 
     Parameters
     ----------
     get_chunks : str, function (default = "chunks")
-        A function that takes in a list of all the isolated nodes as input and returns an
-        iterable `isolate_chunks`. The default chunking is done by slicing the `isolates`
-        into `n_jobs` number of chunks.
+        Unused, as nothing is run in parallel.
+    """
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    return int(np.count_nonzero(_degrees(G) == 0))
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+def isolates(G, get_chunks="chunks"):
+    """The isolated nodes are found from the array of the degrees as in
+    `number_of_isolates`, and are generated in the order of `G`, as networkx
+    does.
+
+    networkx.isolates : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.isolate.isolates.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        Unused, as nothing is run in parallel.
+    """
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    nodelist = list(G)
+    return (nodelist[i] for i in np.flatnonzero(_degrees(G) == 0).tolist())
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_skip_parallel)
+def is_isolate(G, n, get_chunks="chunks"):
+    """A node is isolated if it has no neighbor, that is, if its row of the
+    CSR adjacency (and its column, for directed graphs) is empty. This is read
+    off the adjacency dicts of `n` directly, so nothing is run in parallel.
+
+    networkx.is_isolate : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.isolate.is_isolate.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        Unused, as a single node is checked.
     """
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    n_jobs = nxp.get_n_jobs()
+    if n not in G:
+        raise nx.NetworkXError(f"Node {n} is not in the graph.")
+    size = _count if hasattr(G, "_graph") else len
+    if G.is_directed():
+        return not (size(G._succ[n]) or size(G._pred[n]))
+    return not size(G._adj[n])
+
+
+def _degrees(G):
+    """Return the array of the degrees of the nodes of `G`, self-loops
+    counted once, in the order of `G`.
+    """
+    import numpy as np
+
+    # the lengths of the adjacency dicts of graph views count the neighbors
+    # that the view hides, so their neighbors are counted one by one
+    size = _count if hasattr(G, "_graph") else len
+    n = len(G)
+    degree = np.fromiter(map(size, G._adj.values()), np.int64, n)
+    if G.is_directed():
+        degree += np.fromiter(map(size, G._pred.values()), np.int64, n)
+    return degree
 
-    isolates_list = list(nx.isolates(G))
-    if get_chunks == "chunks":
-        isolate_chunks = nxp.chunks(isolates_list, n_jobs)
-    else:
-        isolate_chunks = get_chunks(isolates_list)
 
-    results = Parallel()(delayed(len)(chunk) for chunk in isolate_chunks)
-    return sum(results)
+def _count(nbrs):
+    """Return the number of neighbors in the adjacency dict `nbrs`."""
+    return sum(1 for _ in nbrs)
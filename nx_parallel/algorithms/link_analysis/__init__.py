@@ -0,0 +1 @@
+from .pagerank_alg import *
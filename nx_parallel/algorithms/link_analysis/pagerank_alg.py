@@ -0,0 +1,104 @@
+import networkx as nx
+import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _edge_chunks
+from nx_parallel.utils.spmv import _spmv_engine
+
+__all__ = ["pagerank"]
+
+
+@nxp._configure_if_nx_active(should_run=nxp.should_run_if_large)
+def pagerank(
+    G,
+    alpha=0.85,
+    personalization=None,
+    max_iter=100,
+    tol=1.0e-6,
+    nstart=None,
+    weight="weight",
+    dangling=None,
+    get_chunks="chunks",
+):
+    """The parallel computation is implemented by splitting the rows of the
+    transposed transition matrix of `G` into blocks, which are shared once with
+    the workers. At every step of the power iteration, each worker multiplies
+    its block with the current vector, adds the teleportation and the mass of
+    the dangling nodes to its rows of the next vector, and returns the L1
+    distance between its rows of the two vectors, which are added up to check
+    the convergence.
+
+    networkx.pagerank : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.link_analysis.pagerank_alg.pagerank.html
+
+    Parameters
+    ----------
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the nodes as input and returns an
+        iterable `node_chunks`, whose rows form a block. The default chunking
+        splits the nodes into `n_jobs` ranges of consecutive nodes with about the
+        same number of in-edges.
+    """
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    N = len(G)
+    if N == 0:
+        return {}
+
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist, weight=weight, dtype=float)
+    S = A.sum(axis=1)
+    dangling_nodes = S == 0
+    S[~dangling_nodes] = 1.0 / S[~dangling_nodes]
+    A.data *= np.repeat(S, np.diff(A.indptr))
+    # the rows of the transpose give the next value of each node at once
+    T = A.T.tocsr()
+
+    # initial vector
+    if nstart is None:
+        x = np.repeat(1.0 / N, N)
+    else:
+        x = np.array([nstart.get(n, 0) for n in nodelist], dtype=float)
+        x /= x.sum()
+
+    # Personalization vector
+    if personalization is None:
+        p = np.repeat(1.0 / N, N)
+    else:
+        p = np.array([personalization.get(n, 0) for n in nodelist], dtype=float)
+        if p.sum() == 0:
+            raise ZeroDivisionError
+        p /= p.sum()
+
+    # Dangling nodes
+    if dangling is None:
+        dangling_weights = p
+    else:
+        dangling_weights = np.array([dangling.get(n, 0) for n in nodelist], dtype=float)
+        dangling_weights /= dangling_weights.sum()
+
+    n_jobs = nxp.get_n_jobs()
+    if get_chunks == "chunks":
+        rows_chunks = _edge_chunks(T, n_jobs)
+    else:
+        index = {node: i for i, node in enumerate(nodelist)}
+        rows_chunks = list(_index_chunks(nodelist, index, n_jobs, get_chunks))
+
+    with _spmv_engine(T, rows_chunks, p, dangling_weights) as spmv:
+        for _ in range(max_iter):
+            x, (err,) = spmv(x, _pagerank_step, alpha, x[dangling_nodes].sum())
+            # check convergence, l1 norm
+            if err < N * tol:
+                return dict(zip(nodelist, map(float, x)))
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _pagerank_step(y, x, p, dangling_weights, alpha, dangling_sum):
+    """Return the rows of the next PageRank vector, given the rows `y` of the
+    product of the transposed transition matrix with the current vector `x`,
+    and their L1 distance to the rows of `x`.
+    """
+    import numpy as np
+
+    y = alpha * (y + dangling_sum * dangling_weights) + (1 - alpha) * p
+    return y, (np.absolute(y - x).sum(),)
@@ -0,0 +1,51 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+def _assert_close(result, expected):
+    assert list(result) == list(expected)
+    for node, value in expected.items():
+        assert math.isclose(result[node], value, rel_tol=1e-9, abs_tol=1e-12)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_pagerank(directed):
+    G = nx.gnp_random_graph(60, 0.05, seed=42, directed=directed)
+    G.add_node("a")
+    for i, (u, v, d) in enumerate(G.edges(data=True)):
+        d["weight"] = i % 5 + 1
+    H = nxp.ParallelGraph(G)
+    personalization = {v: i for i, v in enumerate(list(G)[:20])}
+    dangling = {v: 1 for v in list(G)[10:30]}
+
+    for kwargs in [
+        {},
+        {"weight": None},
+        {"personalization": personalization},
+        {"dangling": dangling},
+        {"nstart": personalization, "alpha": 0.9},
+    ]:
+        expected = nx.pagerank(G, backend="networkx", **kwargs)
+        _assert_close(nxp.pagerank(H, **kwargs), expected)
+
+
+def test_pagerank_get_chunks():
+    G = nx.gnp_random_graph(50, 0.1, seed=42, directed=True)
+
+    def get_chunks(nodes):
+        return [nodes[::3], nodes[1::3], nodes[2::3]]
+
+    _assert_close(nxp.pagerank(G, get_chunks=get_chunks), nxp.pagerank(G))
+
+
+def test_pagerank_max_iter():
+    with pytest.raises(nx.PowerIterationFailedConvergence):
+        nxp.pagerank(nx.cycle_graph(10, nx.DiGraph), max_iter=3, nstart={0: 1})
+
+
+def test_pagerank_empty():
+    assert nxp.pagerank(nx.DiGraph()) == {}
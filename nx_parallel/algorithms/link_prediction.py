@@ -1,9 +1,8 @@
 from joblib import Parallel, delayed
 import networkx as nx
 import nx_parallel as nxp
-from math import log
+from nx_parallel.utils.csr import _csr_adjacency, _row_batches
 import itertools
-from networkx.algorithms.link_prediction import _community
 
 
 __all__ = [
@@ -15,44 +14,510 @@ __all__ = [
     "cn_soundarajan_hopcroft",
     "ra_index_soundarajan_hopcroft",
     "within_inter_cluster",
+    "link_prediction_features",
 ]
 
+_FEATURES = [
+    "resource_allocation_index",
+    "jaccard_coefficient",
+    "adamic_adar_index",
+    "preferential_attachment",
+]
 
-def _apply_prediction(G, func, ebunch=None, get_chunks="chunks"):
-    """Applies the given function to each edge in the specified iterable
-    of edges.
-    """
 
-    def _process_pair_chunk(pairs_chunk):
-        return [(u, v, func(u, v)) for u, v in pairs_chunk]
+def _prediction_pairs(G, ebunch=None, candidates="non_edges", A=None):
+    """Return the list of node pairs to score, checking that the nodes of a
+    given `ebunch` are in `G`.
 
+    If `ebunch` is None, the pairs are all the non-edges of `G`, or only the
+    non-edges at distance 2 if `candidates` is "two_hop". `A` is the simple
+    adjacency matrix of `G`, built here if not given.
+    """
     if ebunch is None:
-        ebunch = nx.non_edges(G)
-    else:
-        for u, v in ebunch:
-            if u not in G:
-                raise nx.NodeNotFound(f"Node {u} not in G.")
-            if v not in G:
-                raise nx.NodeNotFound(f"Node {v} not in G.")
+        if candidates == "non_edges":
+            return list(nx.non_edges(G))
+        if candidates != "two_hop":
+            raise ValueError(
+                f"candidates must be 'non_edges' or 'two_hop', not {candidates!r}"
+            )
+        return _two_hop_pairs(G, A)
 
     ebunch = list(ebunch)
-    if not ebunch:
-        return []
+    for u, v in ebunch:
+        if u not in G:
+            raise nx.NodeNotFound(f"Node {u} not in G.")
+        if v not in G:
+            raise nx.NodeNotFound(f"Node {v} not in G.")
+    return ebunch
+
+
+def _two_hop_pairs(G, A=None):
+    """Return the pairs of non-adjacent nodes of `G` sharing a neighbor.
+
+    The source nodes are chunked and every worker finds the pairs of its
+    sources from the pattern of ``A[rows] @ A``.
+    """
+    import numpy as np
+
+    if A is None:
+        A = _csr_adjacency(G, simple=True)
 
     n_jobs = nxp.get_n_jobs()
+    nodelist = list(G)
+    rows_chunks = [
+        np.arange(chunk[0], chunk[-1] + 1)
+        for chunk in nxp.chunks(range(len(nodelist)), n_jobs)
+        if chunk
+    ]
+    results = Parallel()(delayed(_two_hop_rows)(A, rows) for rows in rows_chunks)
+
+    return [
+        (nodelist[u], nodelist[v])
+        for us, vs in results
+        for u, v in zip(us.tolist(), vs.tolist())
+    ]
+
+
+def _two_hop_rows(A, rows):
+    """Return the arrays ``us, vs`` of the pairs ``u < v`` with `u` in `rows`
+    that are not adjacent in the simple adjacency `A` but share a neighbor.
+    """
+    import numpy as np
+
+    us, vs = zip(*_two_hop_batches(A, rows))
+    return np.concatenate(us), np.concatenate(vs)
+
+
+def _two_hop_batches(A, rows):
+    """Yield the pairs of `_two_hop_rows` in batches of consecutive rows."""
+    import numpy as np
+
+    deg = np.diff(A.indptr)
+    Ar = A[rows]
+    for batch in _row_batches(Ar @ deg):
+        Ab = Ar[batch]
+        P = Ab @ A
+        P.data[:] = 1
+        P = (P - P.multiply(Ab)).tocoo()
+        u = rows[batch][P.row]
+        keep = (P.data != 0) & (P.col > u)
+        yield u[keep], P.col[keep]
+
+
+def _non_edge_batches(A, rows):
+    """Yield the arrays ``us, vs`` of the pairs ``u < v`` with `u` in `rows`
+    that are not adjacent in the simple adjacency `A`, in batches of
+    consecutive rows.
+    """
+    import numpy as np
+
+    n = A.shape[0]
+    for batch in _row_batches(n - 1 - rows):
+        rb = rows[batch]
+        counts = n - 1 - rb
+        us = np.repeat(rb, counts)
+        starts = np.cumsum(counts) - counts
+        vs = np.arange(len(us)) - np.repeat(starts - rb - 1, counts)
+        Ab = A[rb].tocoo()
+        adjacent = rb[Ab.row] * n + Ab.col
+        keep = ~np.isin(us * n + vs, adjacent)
+        yield us[keep], vs[keep]
+
+
+def _check_top_k(top_k, top_k_per_node):
+    for name, k in [("top_k", top_k), ("top_k_per_node", top_k_per_node)]:
+        if k is not None and k < 0:
+            raise ValueError(f"{name} must be non-negative, not {k}")
+
+
+def _top_positions(us, vs, scores, top_k=None, top_k_per_node=None):
+    """Return the sorted positions of the highest scoring pairs.
+
+    With `top_k_per_node`, a pair is kept if it is among the `top_k_per_node`
+    best pairs of one of its nodes ``us[i]`` or ``vs[i]``. With `top_k`, the
+    `top_k` best of the remaining pairs are kept. Selecting again among the
+    pairs kept from several slices gives the selection over all the slices, so
+    workers and the parent can use the same function.
+    """
+    import numpy as np
+
+    keep = np.arange(len(scores))
+    if top_k_per_node is not None:
+        # sort the (node, pair) incidences by node, then by decreasing score,
+        # and rank every pair within the group of its node
+        ends = np.concatenate((us, vs))
+        pos = np.concatenate((keep, keep))
+        order = np.lexsort((-np.concatenate((scores, scores)), ends))
+        ends, pos = ends[order], pos[order]
+        starts = np.flatnonzero(np.r_[True, ends[1:] != ends[:-1]])
+        sizes = np.diff(np.r_[starts, len(ends)])
+        rank = np.arange(len(ends)) - np.repeat(starts, sizes)
+        keep = np.unique(pos[rank < top_k_per_node])
+    if top_k is not None and len(keep) > top_k:
+        if top_k == 0:
+            return keep[:0]
+        best = np.argpartition(-scores[keep], top_k - 1)[:top_k]
+        keep = np.sort(keep[best])
+    return keep
+
+
+def _top_scores(score, us, vs, args, top_k=None, top_k_per_node=None):
+    """Score the pairs ``(us[i], vs[i])`` and return only the best ones as the
+    arrays ``us, vs, scores``.
+    """
+    scores = score(us, vs, *args)
+    keep = _top_positions(us, vs, scores, top_k, top_k_per_node)
+    return us[keep], vs[keep], scores[keep]
+
+
+def _top_scores_rows(score, rows, args, A, candidates, top_k, top_k_per_node):
+    """Generate the candidate pairs of the source `rows` from `A`, score them
+    and return the best ones as the arrays ``us, vs, scores``.
+
+    The pairs are made, scored and selected one batch of rows at a time, so the
+    memory used does not grow with the number of pairs.
+    """
+    import numpy as np
+
+    if candidates == "two_hop":
+        batches = _two_hop_batches(A, rows)
+    else:
+        batches = _non_edge_batches(A, rows)
+
+    best = None
+    for us, vs in batches:
+        scores = score(us, vs, *args)
+        if best is not None:
+            us, vs, scores = (np.concatenate(x) for x in zip(best, (us, vs, scores)))
+        keep = _top_positions(us, vs, scores, top_k, top_k_per_node)
+        best = us[keep], vs[keep], scores[keep]
+    return best
+
+
+def _merge_top(nodelist, results, top_k=None, top_k_per_node=None):
+    """Select the best pairs among the ones kept by the workers and return
+    them as ``(u, v, p)`` triples sorted by decreasing score.
+    """
+    import numpy as np
 
+    if not results:
+        return []
+    us, vs, scores = (np.concatenate(x) for x in zip(*results))
+    keep = _top_positions(us, vs, scores, top_k, top_k_per_node)
+    keep = keep[np.argsort(-scores[keep], kind="stable")]
+    return [
+        (nodelist[u], nodelist[v], p)
+        for u, v, p in zip(us[keep].tolist(), vs[keep].tolist(), scores[keep].tolist())
+    ]
+
+
+def _chunk_pairs(pairs, get_chunks="chunks"):
+    """Return the non-empty chunks of `pairs`."""
     if get_chunks == "chunks":
-        pairs_chunks = nxp.chunks(ebunch, n_jobs)
+        pairs_chunks = nxp.chunks(pairs, nxp.get_n_jobs())
+    else:
+        pairs_chunks = get_chunks(pairs)
+    return [chunk for chunk in pairs_chunks if len(chunk)]
+
+
+def _pair_positions(chunk, index):
+    """Return the arrays ``us, vs`` of the positions of the nodes of the pairs
+    in `chunk`.
+    """
+    import numpy as np
+
+    us = np.fromiter((index[u] for u, _ in chunk), dtype=np.intp)
+    vs = np.fromiter((index[v] for _, v in chunk), dtype=np.intp)
+    return us, vs
+
+
+def _apply_prediction(
+    G,
+    score,
+    args,
+    ebunch=None,
+    get_chunks="chunks",
+    candidates="non_edges",
+    A=None,
+    top_k=None,
+    top_k_per_node=None,
+):
+    """Scores each pair of the specified iterable of edges with an array kernel.
+
+    The pairs are chunked and every chunk is sent to a worker as two arrays of
+    node positions `us` and `vs` (in ``list(G)`` order). The worker calls
+    ``score(us, vs, *args)`` and returns only the array of scores, which are
+    zipped back with the pairs of the chunk in the parent. `args` are usually
+    the CSR adjacency matrix and degree arrays of `G`, built once and shared by
+    all the workers.
+
+    If `top_k` or `top_k_per_node` is given, every worker only returns the best
+    pairs of its chunk, which are merged in the parent. If moreover `ebunch` is
+    None and the default chunking is used, the source nodes are chunked instead
+    and the workers generate the candidate pairs of their sources themselves,
+    so that the pairs are never all held in memory.
+    """
+    import numpy as np
+
+    top = top_k is not None or top_k_per_node is not None
+    if top:
+        _check_top_k(top_k, top_k_per_node)
+    nodelist = list(G)
+    n_jobs = nxp.get_n_jobs()
+
+    if top and ebunch is None and get_chunks == "chunks":
+        if candidates not in ("non_edges", "two_hop"):
+            # raise the error of `_prediction_pairs`
+            _prediction_pairs(G, candidates=candidates)
+        if A is None:
+            A = _csr_adjacency(G, simple=True)
+        n = len(nodelist)
+        if candidates == "two_hop":
+            work = A @ np.diff(A.indptr)
+        else:
+            work = n - 1 - np.arange(n)
+        # balance the number of candidate pairs of the row chunks
+        budget = max(int(work.sum()) // n_jobs, 1)
+        rows = np.arange(n)
+        results = Parallel()(
+            delayed(_top_scores_rows)(
+                score, rows[batch], args, A, candidates, top_k, top_k_per_node
+            )
+            for batch in _row_batches(work, budget)
+        )
+        return _merge_top(nodelist, results, top_k, top_k_per_node)
+
+    ebunch = _prediction_pairs(G, ebunch, candidates, A)
+    if not ebunch:
+        return []
+
+    index = {node: i for i, node in enumerate(nodelist)}
+    pairs_chunks = _chunk_pairs(ebunch, get_chunks)
+
+    if top:
+        results = Parallel()(
+            delayed(_top_scores)(
+                score, *_pair_positions(chunk, index), args, top_k, top_k_per_node
+            )
+            for chunk in pairs_chunks
+        )
+        return _merge_top(nodelist, results, top_k, top_k_per_node)
+
+    results = Parallel()(
+        delayed(score)(*_pair_positions(chunk, index), *args) for chunk in pairs_chunks
+    )
+
+    return itertools.chain.from_iterable(
+        ((u, v, p) for (u, v), p in zip(chunk, scores.tolist()))
+        for chunk, scores in zip(pairs_chunks, results)
+    )
+
+
+def _common_neighbor_scores(us, vs, A, weights=None):
+    """Return the number of common neighbors of each pair ``(us[i], vs[i])``,
+    or the sum of `weights` over them, from the simple adjacency matrix `A`.
+
+    The common neighbors are the intersection of the sorted rows ``A[us]`` and
+    ``A[vs]``, done blockwise so that the gathered rows stay small.
+    """
+    import numpy as np
+
+    deg = np.diff(A.indptr)
+    scores = np.zeros(len(us))
+    for batch in _row_batches(deg[us] + deg[vs]):
+        common = A[us[batch]].multiply(A[vs[batch]])
+        if weights is None:
+            scores[batch] = common.sum(axis=1)
+        else:
+            scores[batch] = common @ weights
+    return scores
+
+
+def _jaccard_scores(us, vs, A, B=None):
+    """Jaccard coefficients from the simple adjacency `A`, with
+    ``|N(u) | N(v)| = |N(u)| + |N(v)| - |N(u) & N(v)|`` computed over the rows
+    of `B`, the neighbor sets including self-loops (`A` itself if None).
+    """
+    import numpy as np
+
+    common = _common_neighbor_scores(us, vs, A)
+    if B is None:
+        B, intersection = A, common
     else:
-        pairs_chunks = get_chunks(ebunch)
+        intersection = _common_neighbor_scores(us, vs, B)
+    deg = np.diff(B.indptr)
+    union = deg[us] + deg[vs] - intersection
+    return np.divide(common, union, out=np.zeros(len(us)), where=union != 0)
+
 
-    results = Parallel()(delayed(_process_pair_chunk)(chunk) for chunk in pairs_chunks)
+def _common_neighbor_centrality_scores(us, vs, A, alpha):
+    """Common neighbor centrality of the pairs from the simple adjacency `A`.
+
+    The shortest path lengths are only computed from the distinct sources in
+    `us`, by BFS over `A` for a batch of sources at a time, so the dense
+    distance rows held at once stay small.
+    """
+    import numpy as np
+    import scipy as sp
 
-    return itertools.chain.from_iterable(results)
+    if (us == vs).any():
+        raise nx.NetworkXAlgorithmError("Self loops are not supported")
+
+    common = _common_neighbor_scores(us, vs, A)
+    if alpha == 1:
+        return common.astype(np.int64)
+
+    n = A.shape[0]
+    order = np.argsort(us, kind="stable")
+    sources, starts = np.unique(us[order], return_index=True)
+    starts = np.append(starts, len(us))
+    dist = np.empty(len(us))
+    for batch in _row_batches(np.full(len(sources), n)):
+        D = sp.sparse.csgraph.shortest_path(A, unweighted=True, indices=sources[batch])
+        pairs = order[starts[batch.start] : starts[batch.stop]]
+        rows = np.searchsorted(sources[batch], us[pairs])
+        dist[pairs] = D[rows, vs[pairs]]
+    return alpha * common + (1 - alpha) * n / dist
+
+
+def _feature_scores(us, vs, A, W, deg, metrics, B=None):
+    """Return the scores of the pairs for all the `metrics` as a structured
+    array with a field per metric.
+
+    The common neighbors of every pair are gathered once, as the rows of
+    ``A[us].multiply(A[vs])``, and summed against the columns of `W`: ones, the
+    resource allocation weights and the Adamic-Adar weights of the nodes.
+    `deg` and `B` are as in the preferential attachment and Jaccard kernels.
+    """
+    import numpy as np
+
+    sums = np.zeros((len(us), W.shape[1]))
+    degA = np.diff(A.indptr)
+    for batch in _row_batches(degA[us] + degA[vs]):
+        sums[batch] = A[us[batch]].multiply(A[vs[batch]]) @ W
+    common = sums[:, 0]
+
+    out = np.empty(len(us), dtype=[(m, _feature_dtype(m)) for m in metrics])
+    for metric in metrics:
+        if metric == "resource_allocation_index":
+            out[metric] = sums[:, 1]
+        elif metric == "adamic_adar_index":
+            out[metric] = sums[:, 2]
+        elif metric == "preferential_attachment":
+            out[metric] = deg[us] * deg[vs]
+        else:
+            intersection, degB = common, degA
+            if B is not None:
+                intersection = _common_neighbor_scores(us, vs, B)
+                degB = np.diff(B.indptr)
+            union = degB[us] + degB[vs] - intersection
+            out[metric] = np.divide(
+                common, union, out=np.zeros(len(us)), where=union != 0
+            )
+    return out
+
+
+def _feature_dtype(metric):
+    import numpy as np
+
+    return np.int64 if metric == "preferential_attachment" else np.float64
+
+
+def _community_labels(G, community):
+    """Read the `community` attribute of every node of `G` once.
+
+    Returns an array with an integer label per community, in ``list(G)``
+    order, and a dict mapping the positions of the nodes without a community
+    (labelled -1) to the nodes, so that the workers can report them.
+    """
+    import numpy as np
+
+    codes = {}
+    missing = {}
+    labels = np.empty(len(G), dtype=np.intp)
+    no_community = object()
+    for i, (node, c) in enumerate(G.nodes(data=community, default=no_community)):
+        if c is no_community:
+            missing[i] = node
+            labels[i] = -1
+        else:
+            labels[i] = codes.setdefault(c, len(codes))
+    return labels, missing
+
+
+def _check_communities(positions, labels, missing):
+    bad = positions[labels[positions] < 0]
+    if bad.size:
+        node = missing[int(bad[0])]
+        raise nx.NetworkXAlgorithmError(
+            f"No community information available for Node {node}"
+        )
+
+
+def _within_community(us, vs, A, labels, missing, weights=None):
+    """Return the mask of the pairs whose nodes are in the same community and
+    the number of their common neighbors in that community (or the sum of
+    `weights` over them).
+
+    As in networkx, the communities of the common neighbors are only looked up
+    for pairs in the same community, and a missing community raises a
+    `NetworkXAlgorithmError`.
+    """
+    import numpy as np
+
+    _check_communities(us, labels, missing)
+    _check_communities(vs, labels, missing)
+    same = labels[us] == labels[vs]
+    within = np.zeros(len(us))
+
+    idx = np.flatnonzero(same)
+    su, sv = us[idx], vs[idx]
+    deg = np.diff(A.indptr)
+    for batch in _row_batches(deg[su] + deg[sv]):
+        common = A[su[batch]].multiply(A[sv[batch]]).tocoo()
+        _check_communities(common.col, labels, missing)
+        match = labels[common.col] == labels[su[batch]][common.row]
+        if weights is not None:
+            match = match * weights[common.col]
+        within[idx[batch]] = np.bincount(
+            common.row, weights=match, minlength=len(su[batch])
+        )
+    return same, within
+
+
+def _cn_soundarajan_hopcroft_scores(us, vs, A, labels, missing):
+    import numpy as np
+
+    _, within = _within_community(us, vs, A, labels, missing)
+    return (_common_neighbor_scores(us, vs, A) + within).astype(np.int64)
+
+
+def _ra_soundarajan_hopcroft_scores(us, vs, A, labels, missing, weights):
+    _, within = _within_community(us, vs, A, labels, missing, weights)
+    return within
+
+
+def _within_inter_cluster_scores(us, vs, A, labels, missing, delta):
+    import numpy as np
+
+    same, within = _within_community(us, vs, A, labels, missing)
+    inter = _common_neighbor_scores(us, vs, A) - within
+    return np.where(same, within / (inter + delta), 0)
+
+
+def _preferential_attachment_scores(us, vs, deg):
+    return deg[us] * deg[vs]
 
 
 @nxp._configure_if_nx_active()
-def resource_allocation_index(G, ebunch=None, get_chunks="chunks"):
+def resource_allocation_index(
+    G,
+    ebunch=None,
+    get_chunks="chunks",
+    candidates="non_edges",
+    top_k=None,
+    top_k_per_node=None,
+):
     """The edge pairs are chunked into `pairs_chunks` and then the resource
     allocation index for all `pairs_chunks` is computed in parallel over
     `n_jobs` number of CPU cores.
@@ -65,19 +530,57 @@ def resource_allocation_index(G, ebunch=None, get_chunks="chunks"):
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel; all the
+        other non-edges have a score of zero and are left out.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
 
-    def predict(u, v):
-        return sum(1 / G.degree(w) for w in nx.common_neighbors(G, u, v))
+    import numpy as np
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    A = _csr_adjacency(G, simple=True)
+    deg = np.array([d for _, d in G.degree], dtype=float)
+    with np.errstate(divide="ignore"):
+        weights = 1 / deg
+
+    return _apply_prediction(
+        G,
+        _common_neighbor_scores,
+        (A, weights),
+        ebunch,
+        get_chunks,
+        candidates,
+        A,
+        top_k,
+        top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
-def jaccard_coefficient(G, ebunch=None, get_chunks="chunks"):
+def jaccard_coefficient(
+    G,
+    ebunch=None,
+    get_chunks="chunks",
+    candidates="non_edges",
+    top_k=None,
+    top_k_per_node=None,
+):
     """The edge pairs are chunked into `pairs_chunks` and then the jaccard
     coefficient for all `pairs_chunks` is computed in parallel over
     `n_jobs` number of CPU cores.
@@ -90,22 +593,58 @@ def jaccard_coefficient(G, ebunch=None, get_chunks="chunks"):
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
-    """
 
-    def predict(u, v):
-        union_size = len(set(G[u]) | set(G[v]))
-        if union_size == 0:
-            return 0
-        return len(nx.common_neighbors(G, u, v)) / union_size
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel; all the
+        other non-edges have a score of zero and are left out.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
+    """
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    A = _csr_adjacency(G, simple=True)
+    # self-loops count in the union of the neighbor sets, not in the common
+    # neighbors
+    B = None
+    if nx.number_of_selfloops(G):
+        B = _csr_adjacency(G, dtype=A.dtype)
+        B.data[:] = 1
+
+    return _apply_prediction(
+        G,
+        _jaccard_scores,
+        (A, B),
+        ebunch,
+        get_chunks,
+        candidates,
+        A,
+        top_k,
+        top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
-def adamic_adar_index(G, ebunch=None, get_chunks="chunks"):
+def adamic_adar_index(
+    G,
+    ebunch=None,
+    get_chunks="chunks",
+    candidates="non_edges",
+    top_k=None,
+    top_k_per_node=None,
+):
     """The edge pairs are chunked into `pairs_chunks` and then the adamic
     adar index for all `pairs_chunks` is computed in parallel over
     `n_jobs` number of CPU cores.
@@ -118,19 +657,52 @@ def adamic_adar_index(G, ebunch=None, get_chunks="chunks"):
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel; all the
+        other non-edges have a score of zero and are left out.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
 
-    def predict(u, v):
-        return sum(1 / log(G.degree(w)) for w in nx.common_neighbors(G, u, v))
+    import numpy as np
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    A = _csr_adjacency(G, simple=True)
+    deg = np.array([d for _, d in G.degree], dtype=float)
+    with np.errstate(divide="ignore"):
+        weights = 1 / np.log(deg)
+
+    return _apply_prediction(
+        G,
+        _common_neighbor_scores,
+        (A, weights),
+        ebunch,
+        get_chunks,
+        candidates,
+        A,
+        top_k,
+        top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
-def preferential_attachment(G, ebunch=None, get_chunks="chunks"):
+def preferential_attachment(
+    G, ebunch=None, get_chunks="chunks", top_k=None, top_k_per_node=None
+):
     """The edge pairs are chunked into `pairs_chunks` and then the
     preferential attachment for all `pairs_chunks` is computed in
     parallel over `n_jobs` number of CPU cores.
@@ -143,19 +715,41 @@ def preferential_attachment(G, ebunch=None, get_chunks="chunks"):
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
 
-    def predict(u, v):
-        return G.degree(u) * G.degree(v)
+    import numpy as np
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    deg = np.array([d for _, d in G.degree], dtype=np.int64)
+
+    return _apply_prediction(
+        G,
+        _preferential_attachment_scores,
+        (deg,),
+        ebunch,
+        get_chunks,
+        top_k=top_k,
+        top_k_per_node=top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
-def common_neighbor_centrality(G, ebunch=None, alpha=0.8, get_chunks="chunks"):
+def common_neighbor_centrality(
+    G, ebunch=None, alpha=0.8, get_chunks="chunks", top_k=None, top_k_per_node=None
+):
     """The edge pairs are chunked into `pairs_chunks` and then the
     common neighbor centrality for all `pairs_chunks` is computed
     in parallel over `n_jobs` number of CPU cores.
@@ -168,36 +762,45 @@ def common_neighbor_centrality(G, ebunch=None, alpha=0.8, get_chunks="chunks"):
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    if alpha == 1:
-
-        def predict(u, v):
-            if u == v:
-                raise nx.NetworkXAlgorithmError("Self loops are not supported")
+    A = _csr_adjacency(G, simple=True)
 
-            return len(nx.common_neighbors(G, u, v))
-
-    else:
-        spl = dict(nx.shortest_path_length(G))
-        inf = float("inf")
-
-        def predict(u, v):
-            if u == v:
-                raise nx.NetworkXAlgorithmError("Self loops are not supported")
-            path_len = spl[u].get(v, inf)
-
-            n_nbrs = len(nx.common_neighbors(G, u, v))
-            return alpha * n_nbrs + (1 - alpha) * len(G) / path_len
-
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    return _apply_prediction(
+        G,
+        _common_neighbor_centrality_scores,
+        (A, alpha),
+        ebunch,
+        get_chunks,
+        top_k=top_k,
+        top_k_per_node=top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
-def cn_soundarajan_hopcroft(G, ebunch=None, community="community", get_chunks="chunks"):
+def cn_soundarajan_hopcroft(
+    G,
+    ebunch=None,
+    community="community",
+    get_chunks="chunks",
+    candidates="non_edges",
+    top_k=None,
+    top_k_per_node=None,
+):
     """The edge pairs are chunked into `pairs_chunks` and then the
     number of common neighbors for all `pairs_chunks` is computed
     in parallel, using community information, over `n_jobs` number
@@ -211,26 +814,53 @@ def cn_soundarajan_hopcroft(G, ebunch=None, community="community", get_chunks="c
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel; all the
+        other non-edges have a score of zero and are left out.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    def predict(u, v):
-        Cu = _community(G, u, community)
-        Cv = _community(G, v, community)
-        cnbors = nx.common_neighbors(G, u, v)
-        neighbors = (
-            sum(_community(G, w, community) == Cu for w in cnbors) if Cu == Cv else 0
-        )
-        return len(cnbors) + neighbors
+    A = _csr_adjacency(G, simple=True)
+    labels, missing = _community_labels(G, community)
 
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    return _apply_prediction(
+        G,
+        _cn_soundarajan_hopcroft_scores,
+        (A, labels, missing),
+        ebunch,
+        get_chunks,
+        candidates,
+        A,
+        top_k,
+        top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
 def ra_index_soundarajan_hopcroft(
-    G, ebunch=None, community="community", get_chunks="chunks"
+    G,
+    ebunch=None,
+    community="community",
+    get_chunks="chunks",
+    candidates="non_edges",
+    top_k=None,
+    top_k_per_node=None,
 ):
     """The edge pairs are chunked into `pairs_chunks` and then the resource
     allocation index for all `pairs_chunks` is computed in parallel, using the
@@ -244,25 +874,59 @@ def ra_index_soundarajan_hopcroft(
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel; all the
+        other non-edges have a score of zero and are left out.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    def predict(u, v):
-        Cu = _community(G, u, community)
-        Cv = _community(G, v, community)
-        if Cu != Cv:
-            return 0
-        cnbors = nx.common_neighbors(G, u, v)
-        return sum(1 / G.degree(w) for w in cnbors if _community(G, w, community) == Cu)
+    import numpy as np
 
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    A = _csr_adjacency(G, simple=True)
+    labels, missing = _community_labels(G, community)
+    deg = np.array([d for _, d in G.degree], dtype=float)
+    with np.errstate(divide="ignore"):
+        weights = 1 / deg
+
+    return _apply_prediction(
+        G,
+        _ra_soundarajan_hopcroft_scores,
+        (A, labels, missing, weights),
+        ebunch,
+        get_chunks,
+        candidates,
+        A,
+        top_k,
+        top_k_per_node,
+    )
 
 
 @nxp._configure_if_nx_active()
 def within_inter_cluster(
-    G, ebunch=None, delta=0.001, community="community", get_chunks="chunks"
+    G,
+    ebunch=None,
+    delta=0.001,
+    community="community",
+    get_chunks="chunks",
+    candidates="non_edges",
+    top_k=None,
+    top_k_per_node=None,
 ):
     """The edge pairs are chunked into `pairs_chunks` and then the ratio
     of within- and inter-cluster common neighbors is computed, for all
@@ -276,6 +940,23 @@ def within_inter_cluster(
         A function that takes in a list of all the edges (or ebunch) as input and
         returns an iterable `pairs_chunks`. The default chunking is done by slicing
         `ebunch` into `n_jobs` number of chunks.
+
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel; all the
+        other non-edges have a score of zero and are left out.
+
+    top_k : int, optional (default = None)
+        If given, only the `top_k` highest scoring pairs are returned, as a list
+        sorted by decreasing score. Every worker only sends back the best pairs
+        of its chunk, so the result transfer does not grow with the number of
+        pairs.
+
+    top_k_per_node : int, optional (default = None)
+        If given, only the pairs that are among the `top_k_per_node` highest
+        scoring pairs of one of their nodes are returned, as a list sorted by
+        decreasing score. It can be combined with `top_k`.
     """
     if delta <= 0:
         raise nx.NetworkXAlgorithmError("Delta must be greater than zero")
@@ -283,14 +964,119 @@ def within_inter_cluster(
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    def predict(u, v):
-        Cu = _community(G, u, community)
-        Cv = _community(G, v, community)
-        if Cu != Cv:
-            return 0
-        cnbors = nx.common_neighbors(G, u, v)
-        within = {w for w in cnbors if _community(G, w, community) == Cu}
-        inter = cnbors - within
-        return len(within) / (len(inter) + delta)
-
-    return _apply_prediction(G, predict, ebunch, get_chunks)
+    A = _csr_adjacency(G, simple=True)
+    labels, missing = _community_labels(G, community)
+
+    return _apply_prediction(
+        G,
+        _within_inter_cluster_scores,
+        (A, labels, missing, delta),
+        ebunch,
+        get_chunks,
+        candidates,
+        A,
+        top_k,
+        top_k_per_node,
+    )
+
+
+@nxp._configure_if_nx_active()
+@nx.utils.not_implemented_for("directed")
+@nx.utils.not_implemented_for("multigraph")
+def link_prediction_features(
+    G, ebunch=None, metrics=None, get_chunks="chunks", candidates="non_edges"
+):
+    """The edge pairs are chunked into `pairs_chunks` and then all the requested
+    link prediction scores of every chunk are computed together in parallel over
+    `n_jobs` number of CPU cores. The common neighbors of each pair are found
+    once and shared by all the metrics.
+
+    This function has no networkx counterpart; it is called as
+    ``nxp.link_prediction_features``.
+
+    Parameters
+    ----------
+    G : graph
+        A NetworkX undirected graph.
+
+    ebunch : iterable of node pairs, optional (default = None)
+        The pairs to score, as in `resource_allocation_index`.
+
+    metrics : list of str, optional (default = None)
+        The scores to compute, among "resource_allocation_index",
+        "jaccard_coefficient", "adamic_adar_index" and
+        "preferential_attachment". If None, all of them are computed.
+
+    get_chunks : str, function (default = "chunks")
+        A function that takes in a list of all the edges (or ebunch) as input and
+        returns an iterable `pairs_chunks`. The default chunking is done by slicing
+        `ebunch` into `n_jobs` number of chunks.
+
+    candidates : str (default = "non_edges")
+        The pairs scored when `ebunch` is None. "non_edges" scores all the
+        non-edges of `G`, as networkx does. "two_hop" only scores the non-edges
+        whose nodes share a neighbor, which are generated in parallel.
+
+    Returns
+    -------
+    features : NumPy structured array
+        One record per pair, with the fields "u" and "v" holding the nodes of
+        the pair, followed by one field per metric, in the order of `metrics`.
+        The preferential attachment is an integer, the other scores are floats.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> import nx_parallel as nxp
+    >>> G = nx.complete_graph(5)
+    >>> features = nxp.link_prediction_features(
+    ...     G, [(0, 1), (2, 3)], ["jaccard_coefficient", "preferential_attachment"]
+    ... )
+    >>> features["preferential_attachment"]
+    array([16, 16])
+    """
+
+    import numpy as np
+
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
+
+    if metrics is None:
+        metrics = _FEATURES
+    metrics = list(metrics)
+    for metric in metrics:
+        if metric not in _FEATURES:
+            raise ValueError(f"Unknown link prediction metric {metric!r}")
+    if len(set(metrics)) != len(metrics):
+        raise ValueError("metrics must not contain duplicates")
+
+    A = _csr_adjacency(G, simple=True)
+    deg = np.array([d for _, d in G.degree], dtype=np.int64)
+    with np.errstate(divide="ignore"):
+        W = np.column_stack([np.ones(len(deg)), 1 / deg, 1 / np.log(deg)])
+    B = None
+    if "jaccard_coefficient" in metrics and nx.number_of_selfloops(G):
+        B = _csr_adjacency(G, dtype=A.dtype)
+        B.data[:] = 1
+
+    ebunch = _prediction_pairs(G, ebunch, candidates, A)
+    pairs_chunks = _chunk_pairs(ebunch, get_chunks) if ebunch else []
+    pairs = list(itertools.chain.from_iterable(pairs_chunks))
+    dtype = [("u", object), ("v", object)]
+    dtype += [(m, _feature_dtype(m)) for m in metrics]
+    features = np.empty(len(pairs), dtype=dtype)
+    if not pairs:
+        return features
+
+    index = {node: i for i, node in enumerate(G)}
+    results = Parallel()(
+        delayed(_feature_scores)(*_pair_positions(chunk, index), A, W, deg, metrics, B)
+        for chunk in pairs_chunks
+    )
+
+    features["u"] = [u for u, _ in pairs]
+    features["v"] = [v for _, v in pairs]
+    scores = np.concatenate(results)
+    for metric in metrics:
+        features[metric] = scores[metric]
+    return features
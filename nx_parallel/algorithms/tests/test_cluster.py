@@ -0,0 +1,85 @@
+import math
+import random
+
+import networkx as nx
+import numpy as np
+import pytest
+
+import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _row_batches
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_clustering_kernels(directed, weight):
+    G = nx.fast_gnp_random_graph(60, 0.2, seed=42, directed=directed)
+    G.add_edge(0, 0)
+    random.seed(42)
+    for u, v in G.edges():
+        G.edges[u, v]["weight"] = random.random()
+    H = nxp.ParallelGraph(G)
+
+    expected = nx.clustering(G, weight=weight)
+    result = nxp.clustering(H, weight=weight)
+    assert expected.keys() == result.keys()
+    for v in G:
+        assert math.isclose(result[v], expected[v], rel_tol=1e-12, abs_tol=1e-15)
+
+    for count_zeros in [True, False]:
+        assert math.isclose(
+            nxp.average_clustering(H, weight=weight, count_zeros=count_zeros),
+            nx.average_clustering(G, weight=weight, count_zeros=count_zeros),
+        )
+
+
+def test_clustering_negative_weights():
+    # the triangles of some nodes cancel out up to rounding errors
+    G = nx.gnp_random_graph(12, 0.5, seed=187)
+    rng = random.Random(187)
+    for u, v in G.edges():
+        G.edges[u, v]["weight"] = rng.choice([-3, -1, 1, 2, 3, 0.5, -0.7])
+    H = nxp.ParallelGraph(G)
+
+    expected = nx.clustering(G, weight="weight")
+    result = nxp.clustering(H, weight="weight")
+    assert [v for v in G if result[v] == 0] == [v for v in G if expected[v] == 0]
+    assert math.isclose(
+        nxp.average_clustering(H, weight="weight", count_zeros=False),
+        nx.average_clustering(G, weight="weight", count_zeros=False),
+    )
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_square_clustering(directed):
+    G = nx.fast_gnp_random_graph(50, 0.15, seed=42, directed=directed)
+    G.add_edges_from([(0, 0), (3, 3)])
+    H = nxp.ParallelGraph(G)
+
+    for nodes in [None, [0, 5, 7, 3]]:
+        expected = nx.square_clustering(G, nodes)
+        result = nxp.square_clustering(H, nodes)
+        assert expected.keys() == result.keys()
+        for v in expected:
+            assert math.isclose(result[v], expected[v], rel_tol=1e-12, abs_tol=1e-15)
+    assert math.isclose(nxp.square_clustering(H, 5), nx.square_clustering(G, 5))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_square_clustering_row_batches(directed, monkeypatch):
+    from functools import partial
+    from nx_parallel.algorithms.cluster import _square_clustering_rows
+
+    G = nx.fast_gnp_random_graph(40, 0.2, seed=7, directed=directed)
+    nodelist = list(G)
+    A = _csr_adjacency(G, nodelist, simple=True)
+    AT = A.T.tocsr() if directed else A
+    rows = np.arange(len(nodelist))
+    expected = _square_clustering_rows(A, AT, rows, directed)
+
+    # a tiny budget splits the rows into many batches
+    monkeypatch.setattr(
+        "nx_parallel.algorithms.cluster._row_batches", partial(_row_batches, budget=50)
+    )
+    result = _square_clustering_rows(A, AT, rows, directed)
+    assert np.allclose(result, expected)
+    assert np.allclose(result, [nx.square_clustering(G)[v] for v in nodelist])
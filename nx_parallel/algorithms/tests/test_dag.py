@@ -0,0 +1,61 @@
+import networkx as nx
+from joblib import Parallel, parallel_config
+import pytest
+
+import nx_parallel as nxp
+from nx_parallel.algorithms.dag import _stream_colliders
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_colliders_and_v_structures(seed):
+    G = nx.gnp_random_graph(30, 0.3, seed=seed, directed=True)
+    H = nxp.ParallelGraph(G)
+    assert sorted(nxp.colliders(H)) == sorted(nx.dag.colliders(G))
+    assert sorted(nxp.v_structures(H)) == sorted(nx.dag.v_structures(G))
+
+
+def test_small_batches():
+    # batches of a few colliders give the same, if reordered, results
+    G = nx.gn_graph(40, seed=42, kernel=lambda k: k**1.5)
+    expected = sorted(nx.dag.v_structures(G))
+    assert sorted(_stream_colliders(G, v_structures=True, batch_size=4)) == expected
+
+
+def test_default_chunks(monkeypatch):
+    # the default chunking gives every job some of the nodes, even when all
+    # the colliders would fit in one batch
+    G = nx.gn_graph(40, seed=42)
+    batches = []
+    monkeypatch.setattr(nxp, "get_n_jobs", lambda n_jobs=None: 4)
+    monkeypatch.setattr(
+        "nx_parallel.algorithms.dag._batch_colliders",
+        lambda path, nodes, v_structures: batches.append(nodes) or [],
+    )
+    with parallel_config(backend="sequential"):
+        list(_stream_colliders(G))
+    assert len(batches) == 4
+
+
+def test_configured_n_jobs(monkeypatch):
+    # the public functions return generators, but the tasks must still be
+    # dispatched with the configuration of the backend
+    import nx_parallel.algorithms.dag as dag
+
+    n_jobs = []
+
+    class RecordingParallel(Parallel):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            n_jobs.append(self.n_jobs)
+
+    monkeypatch.setattr(dag, "Parallel", RecordingParallel)
+    G = nx.gn_graph(40, seed=42)
+    with nx.config.backends.parallel(n_jobs=3):
+        result = nxp.colliders(G)
+    assert n_jobs == [3]
+    assert sorted(result) == sorted(nx.dag.colliders(G))
+
+
+def test_empty():
+    assert list(nxp.colliders(nx.DiGraph())) == []
+    assert list(nxp.v_structures(nx.DiGraph([(0, 1)]))) == []
@@ -0,0 +1,13 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("n", [1, 40])
+def test_local_efficiency(n):
+    G = nx.gnp_random_graph(n, 0.2, seed=42)
+    result = nxp.local_efficiency(nxp.ParallelGraph(G))
+    # a Python float, as networkx returns
+    assert type(result) is float
+    assert result == pytest.approx(nx.local_efficiency(G))
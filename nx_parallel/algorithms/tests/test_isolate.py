@@ -0,0 +1,49 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_isolates(directed):
+    G = nx.gnp_random_graph(60, 0.02, seed=42, directed=directed)
+    # a self-loop does not make a node isolated in networkx either
+    G.add_edge(100, 100)
+    G.add_node("a")
+    H = nxp.ParallelGraph(G)
+    expected = list(nx.isolates(G))
+    assert list(nxp.isolates(H)) == expected
+    assert nxp.number_of_isolates(H) == len(expected)
+    for v in G:
+        assert nxp.is_isolate(H, v) == nx.is_isolate(G, v)
+
+
+def test_isolates_directed_sink():
+    # a node with only in-edges is not isolated
+    G = nx.DiGraph([(0, 1)])
+    G.add_node(2)
+    assert list(nxp.isolates(G)) == [2]
+    assert not nxp.is_isolate(G, 1)
+
+
+def test_isolates_empty():
+    assert list(nxp.isolates(nx.Graph())) == []
+    assert nxp.number_of_isolates(nx.Graph()) == 0
+
+
+def test_is_isolate_missing_node():
+    with pytest.raises(nx.NetworkXError):
+        nxp.is_isolate(nx.path_graph(3), 9)
+
+
+def test_isolates_view():
+    # the adjacency dicts of a filter view still hold the hidden edges
+    G = nx.MultiGraph([(0, 1), (0, 1), (1, 2), (3, 4)])
+    V = nx.restricted_view(G, [], [(3, 4, 0)])
+    assert list(nxp.isolates(V)) == [3, 4]
+    assert nxp.number_of_isolates(V) == 2
+    assert nxp.is_isolate(V, 3) and not nxp.is_isolate(V, 0)
+
+    D = nx.restricted_view(nx.DiGraph([(0, 1), (2, 3)]), [], [(2, 3)])
+    assert list(nxp.isolates(D)) == [2, 3]
+    assert nxp.is_isolate(D, 3) and not nxp.is_isolate(D, 1)
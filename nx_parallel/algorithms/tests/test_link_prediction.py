@@ -0,0 +1,117 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "resource_allocation_index",
+        "jaccard_coefficient",
+        "adamic_adar_index",
+        "cn_soundarajan_hopcroft",
+        "ra_index_soundarajan_hopcroft",
+        "within_inter_cluster",
+    ],
+)
+def test_two_hop_candidates(func):
+    G = nx.gnp_random_graph(50, 0.08, seed=42)
+    G.add_edge(0, 0)
+    nx.set_node_attributes(G, {v: v % 3 for v in G}, "community")
+    H = nxp.ParallelGraph(G)
+
+    expected = {frozenset((u, v)): p for u, v, p in getattr(nx, func)(G)}
+    result = {
+        frozenset((u, v)): p for u, v, p in getattr(nxp, func)(H, candidates="two_hop")
+    }
+    # only the pairs at distance two are scored, the others all score zero
+    two_hop = {
+        frozenset((u, v)) for u, v in nx.non_edges(G) if nx.common_neighbors(G, u, v)
+    }
+    assert result.keys() == two_hop
+    for pair, p in expected.items():
+        assert math.isclose(result.get(pair, 0), p)
+
+    with pytest.raises(ValueError, match="candidates"):
+        list(getattr(nxp, func)(H, candidates="all"))
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "resource_allocation_index",
+        "jaccard_coefficient",
+        "adamic_adar_index",
+        "preferential_attachment",
+        "common_neighbor_centrality",
+        "cn_soundarajan_hopcroft",
+        "ra_index_soundarajan_hopcroft",
+        "within_inter_cluster",
+    ],
+)
+@pytest.mark.parametrize("ebunch", [None, [(0, 2), (1, 3), (4, 9), (5, 7), (2, 8)]])
+def test_top_k(func, ebunch):
+    G = nx.gnp_random_graph(40, 0.1, seed=42)
+    nx.set_node_attributes(G, {v: v % 2 for v in G}, "community")
+    H = nxp.ParallelGraph(G)
+    expected = list(getattr(nx, func)(G, ebunch))
+
+    result = getattr(nxp, func)(H, ebunch, top_k=3)
+    scores = sorted((p for _, _, p in expected), reverse=True)
+    assert [p for _, _, p in result] == pytest.approx(scores[:3])
+
+    result = getattr(nxp, func)(H, ebunch, top_k_per_node=2)
+    scores = [p for _, _, p in result]
+    assert scores == sorted(scores, reverse=True)
+    for v in G:
+        best = sorted((p for x, y, p in expected if v in (x, y)), reverse=True)
+        kept = sorted((p for x, y, p in result if v in (x, y)), reverse=True)
+        assert kept[:2] == pytest.approx(best[:2])
+
+    assert getattr(nxp, func)(H, ebunch, top_k=0) == []
+    with pytest.raises(ValueError, match="top_k"):
+        getattr(nxp, func)(H, ebunch, top_k=-1)
+
+
+@pytest.mark.parametrize("selfloop", [False, True])
+def test_link_prediction_features(selfloop):
+    G = nx.gnp_random_graph(50, 0.1, seed=42)
+    if selfloop:
+        G.add_edge(0, 0)
+    H = nxp.ParallelGraph(G)
+
+    features = nxp.link_prediction_features(H)
+    assert features.dtype.names == (
+        "u",
+        "v",
+        "resource_allocation_index",
+        "jaccard_coefficient",
+        "adamic_adar_index",
+        "preferential_attachment",
+    )
+    assert {(u, v) for u, v in features[["u", "v"]].tolist()} == set(nx.non_edges(G))
+    for metric in features.dtype.names[2:]:
+        expected = {(u, v): p for u, v, p in getattr(nx, metric)(G)}
+        for row in features:
+            assert math.isclose(row[metric], expected[row["u"], row["v"]])
+
+    ebunch = [(0, 2), (3, 3), (5, 1)]
+    features = nxp.link_prediction_features(
+        H, ebunch, ["preferential_attachment", "jaccard_coefficient"]
+    )
+    assert features[["u", "v"]].tolist() == ebunch
+    assert features["preferential_attachment"].tolist() == [
+        p for _, _, p in nx.preferential_attachment(G, ebunch)
+    ]
+    assert features["jaccard_coefficient"].tolist() == pytest.approx(
+        [p for _, _, p in nx.jaccard_coefficient(G, ebunch)]
+    )
+
+    assert len(nxp.link_prediction_features(H, [])) == 0
+    with pytest.raises(ValueError, match="Unknown"):
+        nxp.link_prediction_features(H, ebunch, ["common_neighbors"])
+    with pytest.raises(nx.NetworkXNotImplemented):
+        nxp.link_prediction_features(nx.DiGraph([(0, 1)]))
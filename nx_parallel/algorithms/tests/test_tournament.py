@@ -0,0 +1,33 @@
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_is_reachable(seed):
+    G = nx.tournament.random_tournament(8, seed=seed)
+    H = nxp.ParallelGraph(G)
+    for s in G:
+        for t in G:
+            expected = nx.tournament.is_reachable(G, s, t)
+            assert nxp.is_reachable(H, s, t) == expected
+
+
+def test_is_reachable_closed_set():
+    # in a transitive tournament, the earlier nodes are never reachable
+    G = nx.DiGraph((u, v) for u in range(6) for v in range(u + 1, 6))
+    assert not nxp.is_reachable(G, 5, 0)
+    assert nxp.is_reachable(G, 0, 5)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_tournament_is_strongly_connected(seed):
+    G = nx.tournament.random_tournament(seed % 5 + 2, seed=seed)
+    expected = nx.tournament.is_strongly_connected(G)
+    assert nxp.tournament_is_strongly_connected(G) == expected
+
+    # not a tournament, although it has as many edges as one
+    D = nx.DiGraph([(0, 1), (1, 0), (1, 2)])
+    expected = nx.tournament.is_strongly_connected(D)
+    assert nxp.tournament_is_strongly_connected(D) == expected
@@ -0,0 +1,52 @@
+import math
+
+import networkx as nx
+import pytest
+
+import nx_parallel as nxp
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_closeness_vitality(directed, weight):
+    G = nx.gnp_random_graph(30, 0.15, seed=42, directed=directed)
+    for i, (u, v) in enumerate(G.edges()):
+        G.edges[u, v]["weight"] = i % 3
+    H = nxp.ParallelGraph(G)
+
+    expected = nx.closeness_vitality(G, weight=weight)
+    result = nxp.closeness_vitality(H, weight=weight)
+    assert expected.keys() == result.keys()
+    for v in G:
+        if math.isnan(expected[v]):
+            assert math.isnan(result[v])
+        else:
+            assert result[v] == pytest.approx(expected[v])
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.barabasi_albert_graph(60, 1, seed=42),
+        nx.barabasi_albert_graph(60, 2, seed=42),
+        nx.random_labeled_tree(40, seed=42),
+        nx.cycle_graph(30),
+        nx.grid_2d_graph(6, 6),
+    ],
+)
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_closeness_vitality_sparse(G, weight):
+    # the nodes dominated by each node are recomputed, or all the distances
+    # from a source when there are many of them, as in the cycle
+    for i, (u, v) in enumerate(G.edges()):
+        G.edges[u, v]["weight"] = i % 3 + 1
+    expected = nx.closeness_vitality(G, weight=weight)
+    result = nxp.closeness_vitality(nxp.ParallelGraph(G), weight=weight)
+    assert result == pytest.approx(expected)
+
+
+def test_closeness_vitality_floats():
+    G = nxp.ParallelGraph(nx.cycle_graph(5))
+    assert all(type(x) is float for x in nxp.closeness_vitality(G).values())
+    assert type(nxp.closeness_vitality(G, node=0)) is float
+    assert type(nxp.closeness_vitality(G, wiener_index=15)[0]) is float
@@ -1,5 +1,6 @@
 from joblib import Parallel, delayed, dump, load
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _row_batches
 import networkx as nx
 import tempfile
 import shutil
@@ -17,6 +18,13 @@ def is_reachable(G, s, t, get_chunks="chunks"):
     neighborhoods of vertices in `G` and checks closure conditions for each
     neighborhood subset in parallel.
 
+    The adjacency matrix is memory-mapped by all the workers. Each worker first
+    keeps the nodes of its chunk whose two-neighborhood contains `s` but not
+    `t`, then computes these two-neighborhoods for blocks of rows with matrix
+    products, and checks whether they are closed by counting, with another
+    product, the neighbors every node has in each of them. The first worker to
+    find a closed two-neighborhood leaves a mark that makes the others stop.
+
     networkx.tournament.is_reachable : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.tournament.is_reachable.html
 
     Parameters
@@ -26,57 +34,99 @@ def is_reachable(G, s, t, get_chunks="chunks"):
         iterable `node_chunks`. The default chunking is done by slicing the `nodes`
         into `n_jobs` number of chunks.
     """
+    if hasattr(G, "graph_object"):
+        G = G.graph_object
 
-    def two_neighborhood_close(adjM_filepath, chunk):
-        adjM = load(adjM_filepath, mmap_mode="r")
-        node_indices = range(adjM.shape[0])
-        for v in chunk:
-            S = {
-                x
-                for x in node_indices
-                if x == v
-                or adjM[v, x]
-                or any(adjM[v, z] and adjM[z, x] for z in node_indices)
-            }
-            if s_ind in S and t_ind not in S and is_closed(adjM, node_indices, S):
-                return False
-        return True
+    return _no_closed_two_neighborhood(G, s, t, get_chunks)
 
-    def is_closed(adjM, node_indices, S):
-        return all(u in S or adjM[u, v] for u in node_indices for v in S)
 
-    if hasattr(G, "graph_object"):
-        G = G.graph_object
+def _no_closed_two_neighborhood(G, s, t, get_chunks):
+    """Return whether no two-neighborhood of a node of `G` that contains `s`
+    and not `t` is closed. If `s` and `t` are None, the two-neighborhoods
+    missing any node are checked instead.
+    """
+    import numpy as np
 
     nodelist = list(G)
-    adjM = nx.to_numpy_array(G, dtype=bool, nodelist=nodelist)
+    # the products count common neighbors, which float32 holds exactly
+    adjM = nx.to_numpy_array(G, dtype=np.float32, nodelist=nodelist, weight=None)
     nodemap = {n: i for i, n in enumerate(nodelist)}
-    s_ind = nodemap[s]
-    t_ind = nodemap[t]
+    s_ind = None if s is None else nodemap[s]
+    t_ind = None if t is None else nodemap[t]
 
     temp_folder = tempfile.mkdtemp()
     adjM_filepath = os.path.join(temp_folder, "adjMatrix.mmap")
+    found_filepath = os.path.join(temp_folder, "found")
     dump(adjM, adjM_filepath)
 
     n_jobs = nxp.get_n_jobs()
+    rows_chunks = _index_chunks(nodelist, nodemap, n_jobs, get_chunks)
+
+    try:
+        results = Parallel()(
+            delayed(_two_neighborhoods_not_closed)(
+                adjM_filepath, rows, s_ind, t_ind, found_filepath
+            )
+            for rows in rows_chunks
+        )
+    finally:
+        shutil.rmtree(temp_folder)
+    return all(results)
 
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(G, n_jobs)
-    else:
-        node_chunks = get_chunks(G)
 
-    results = Parallel()(
-        delayed(two_neighborhood_close)(adjM_filepath, chunk) for chunk in node_chunks
-    )
-    shutil.rmtree(temp_folder)
-    return all(results)
+def _two_neighborhoods_not_closed(adjM_filepath, rows, s, t, found_filepath):
+    """Return False if the two-neighborhood of one of the nodes at `rows`
+    contains `s`, not `t`, and is closed, and True otherwise. If `s` and `t`
+    are None, any closed two-neighborhood other than the whole graph counts.
+
+    Once a closed two-neighborhood is found, an empty file is created at
+    `found_filepath`, and the calls still running return True early as the
+    answer is already known.
+    """
+    import numpy as np
+
+    if os.path.exists(found_filepath):
+        return True
+    adjM = load(adjM_filepath, mmap_mode="r")
+    n = adjM.shape[0]
+
+    if s is not None:
+        # whether `s` and `t` are at distance at most two from the nodes at `rows`
+        P = adjM[rows]
+        has_s = (rows == s) | (P[:, s] > 0) | (P @ adjM[:, s] > 0)
+        has_t = (rows == t) | (P[:, t] > 0) | (P @ adjM[:, t] > 0)
+        rows = rows[has_s & ~has_t]
+
+    for batch in _row_batches(np.full(len(rows), n)):
+        if os.path.exists(found_filepath):
+            return True
+        v = rows[batch]
+        P = adjM[v]
+        S = (P @ adjM > 0) | (P > 0)
+        S[np.arange(len(v)), v] = True
+        # `S` is closed if every node outside of it points to all its nodes
+        inside = S.astype(np.float32) @ adjM.T
+        size = S.sum(axis=1, keepdims=True)
+        closed = ((inside == size) | S).all(axis=1) & (size[:, 0] < n)
+        if closed.any():
+            open(found_filepath, "w").close()
+            return False
+    return True
 
 
 @nxp._configure_if_nx_active()
 def tournament_is_strongly_connected(G, get_chunks="chunks"):
-    """The parallel computation is implemented by dividing the
-    nodes into chunks and then checking whether each node is reachable from each
-    other node in parallel.
+    """The tournament is strongly connected if and only if, by Landau's
+    theorem, the sum of its `k` smallest out-degrees is more than
+    `k * (k - 1) / 2` for every `0 < k < n`. This only takes sorting the
+    out-degrees, so no reachability check is run at all, once the CSR adjacency
+    has been checked to be that of a tournament.
+
+    If `G` is not a tournament, the result is instead that of checking whether
+    each node is reachable from each other node, which holds if no
+    two-neighborhood other than the whole graph is closed. The nodes are
+    divided into chunks whose two-neighborhoods are checked in parallel, as in
+    `is_reachable`, and all the workers stop at the first closed one.
 
     Note, this function uses the name `tournament_is_strongly_connected` while
     dispatching to the backend implementation. So, `nxp.tournament.is_strongly_connected`
@@ -89,22 +139,20 @@ def tournament_is_strongly_connected(G, get_chunks="chunks"):
     get_chunks : str, function (default = "chunks")
         A function that takes in a list of all the nodes as input and returns an
         iterable `node_chunks`. The default chunking is done by slicing the `nodes`
-        into `n_jobs` number of chunks.
+        into `n_jobs` number of chunks. It is only used when `G` is not a
+        tournament.
     """
+    import numpy as np
+
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
-    def is_reachable_subset(G, chunk):
-        return all(nx.tournament.is_reachable(G, u, v) for v in chunk for u in G)
+    n = len(G)
+    A = _csr_adjacency(G)
+    # a tournament has exactly one edge between every two distinct nodes
+    if A.nnz != n * (n - 1) // 2 or A.diagonal().any() or A.multiply(A.T).nnz:
+        return _no_closed_two_neighborhood(G, None, None, get_chunks)
 
-    n_jobs = nxp.get_n_jobs()
-
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(G, n_jobs)
-    else:
-        node_chunks = get_chunks(G)
-
-    results = Parallel()(
-        delayed(is_reachable_subset)(G, chunk) for chunk in node_chunks
-    )
-    return all(results)
+    scores = np.sort(np.diff(A.indptr))
+    k = np.arange(1, n)
+    return bool((np.cumsum(scores)[:-1] > k * (k - 1) // 2).all())
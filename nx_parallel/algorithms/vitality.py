@@ -1,5 +1,5 @@
-from functools import partial
 import nx_parallel as nxp
+from nx_parallel.utils.csr import _csr_adjacency, _index_chunks, _row_batches
 from joblib import Parallel, delayed
 import networkx as nx
 
@@ -13,6 +13,13 @@ def closeness_vitality(
     """The parallel computation is implemented only when the node
     is not specified. The closeness vitality for each node is computed concurrently.
 
+    Instead of computing the Wiener index of ``G - v`` from scratch for every
+    node `v`, the source nodes are chunked and every worker computes the
+    shortest path lengths from its sources once. Removing `v` only changes the
+    distances from a source `s` to the nodes whose shortest paths from `s` all
+    go through `v`, so only those are recomputed, the others are derived from
+    the distances in `G`.
+
     networkx.closeness_vitality : https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.vitality.closeness_vitality.html
 
     Parameters
@@ -23,31 +30,361 @@ def closeness_vitality(
         `nodes` into `n_jobs` number of chunks.
     """
 
-    def closeness_vitality_chunk_subset(chunk):
-        return {v: vitality(v) for v in chunk}
+    import numpy as np
 
     if hasattr(G, "graph_object"):
         G = G.graph_object
 
+    if node is not None or len(G) < 2:
+        if wiener_index is None:
+            wiener_index = nx.wiener_index(G, weight=weight)
+        if node is not None:
+            after = nx.wiener_index(G.subgraph(set(G) - {node}), weight=weight)
+            return float(wiener_index - after)
+        return {
+            v: float(
+                wiener_index - nx.wiener_index(G.subgraph(set(G) - {v}), weight=weight)
+            )
+            for v in G
+        }
+
+    nodelist = list(G)
+    n = len(nodelist)
+    A = _distance_csr(G, nodelist, weight)
+    index = {v: i for i, v in enumerate(nodelist)}
+    rows_chunks = _index_chunks(nodelist, index, nxp.get_n_jobs(), get_chunks)
+
+    results = Parallel()(
+        delayed(_closeness_vitality_rows)(A, rows) for rows in rows_chunks
+    )
+    total, reached, after, after_reached = (sum(x) for x in zip(*results))
+
+    # the sums are over ordered pairs, and are infinite if a pair is unreachable
+    pairs = 1 if G.is_directed() else 2
     if wiener_index is None:
-        wiener_index = nx.wiener_index(G, weight=weight)
+        wiener_index = total / pairs if reached == n * (n - 1) else float("inf")
+    # the sums are NumPy scalars, but networkx returns Python floats
+    wiener_index = float(wiener_index)
+    after = np.where(after_reached == (n - 1) * (n - 2), after / pairs, np.inf)
+    return {v: wiener_index - a for v, a in zip(nodelist, after.tolist())}
+
 
-    if node is not None:
-        after = nx.wiener_index(G.subgraph(set(G) - {node}), weight=weight)
-        return wiener_index - after
+def _distance_csr(G, nodelist, weight):
+    """Return the float CSR matrix of the edge lengths of `G`, without
+    self-loops, taking the lightest of parallel edges as networkx does.
+    """
+    import numpy as np
+    import scipy as sp
 
-    n_jobs = nxp.get_n_jobs()
+    if weight is None:
+        return _csr_adjacency(G, nodelist, dtype=float, simple=True)
+    if not G.is_multigraph():
+        return _csr_adjacency(G, nodelist, weight, float, self_loops=False)
 
-    if get_chunks == "chunks":
-        node_chunks = nxp.chunks(G.nodes, n_jobs)
-    else:
-        node_chunks = get_chunks(G.nodes)
+    index = {v: i for i, v in enumerate(nodelist)}
+    lengths = {}
+    for u, v, w in G.edges(data=weight, default=1):
+        key = (index[u], index[v])
+        lengths[key] = min(w, lengths.get(key, w))
+        if not G.is_directed():
+            lengths[key[::-1]] = lengths[key]
+    rows, cols = np.array(list(lengths), dtype=np.intp).reshape(-1, 2).T
+    data = np.fromiter(lengths.values(), float, len(lengths))
+    keep = rows != cols
+    n = len(nodelist)
+    A = sp.sparse.csr_array((data[keep], (rows[keep], cols[keep])), shape=(n, n))
+    A.sort_indices()
+    return A
 
-    vitality = partial(
-        nx.closeness_vitality, G, weight=weight, wiener_index=wiener_index
-    )
 
-    result = Parallel()(
-        delayed(closeness_vitality_chunk_subset)(chunk) for chunk in node_chunks
+def _closeness_vitality_rows(A, rows):
+    """Return the sums of the distances from the sources `rows` in `G` and in
+    every ``G - v``.
+
+    The returned values are the sum of the finite distances from the sources
+    and their number, then the arrays of the same sums in ``G - v`` for every
+    node `v`. The distances from `s` in ``G - v`` are those in `G`, except
+    for the nodes that `v` dominates in the shortest path DAG from `s`, that
+    is, whose shortest paths all go through `v`. Only these are recomputed,
+    by `_dominated_distances`, unless they are so many that running Dijkstra
+    in every ``G - v`` costs less, as for long cycles.
+    """
+    import numpy as np
+    import scipy as sp
+
+    n = A.shape[0]
+    A = A.copy()
+    E = A.tocoo()
+    if (E.data == 0).any():
+        # with zero lengths, the shortest path DAG may have cycles
+        return _closeness_vitality_rows_recompute(A, rows)
+
+    # the edges into each node, as positions in `A.data`
+    into = np.argsort(A.indices, kind="stable")
+    into_ptr = np.searchsorted(A.indices[into], np.arange(n + 1))
+    # the nodes whose removal is known to leave some node unreachable, for
+    # which nothing more needs to be recomputed
+    disconnecting = np.zeros(n, dtype=bool)
+    # the number of dominated nodes recomputed in about the time of a Dijkstra
+    # run, which visits every node and edge
+    limit = (n + A.nnz) // 32 + 1
+
+    total = 0.0
+    reached = 0
+    after = np.zeros(n)
+    after_reached = np.zeros(n, dtype=np.int64)
+    for batch in _row_batches(np.full(len(rows), max(n, A.nnz))):
+        sources = rows[batch]
+        b = len(sources)
+        D = sp.sparse.csgraph.dijkstra(A, indices=sources)
+        finite = np.isfinite(D)
+        Dfin = np.where(finite, D, 0)
+        sums = Dfin.sum(axis=1)
+        counts = finite.sum(axis=1) - 1
+        total += sums.sum()
+        reached += int(counts.sum())
+
+        # the sums without `v` itself, before the dominated nodes are fixed up
+        others = np.ones((b, n), dtype=bool)
+        others[np.arange(b), sources] = False
+        after += (others * (sums[:, None] - Dfin)).sum(axis=0)
+        after_reached += (others * (counts[:, None] - finite)).sum(axis=0)
+
+        full_s, full_v = [], []
+        for i, (s, d) in enumerate(zip(sources.tolist(), D)):
+            V, X = _dominated_pairs(E, s, d, disconnecting, limit)
+            if X is None:
+                full_s.append(np.full(len(V), i))
+                full_v.append(V)
+                continue
+            # the pairs of one `v` are consecutive, and are kept together
+            starts = np.flatnonzero(np.r_[True, V[1:] != V[:-1]])
+            work = np.add.reduceat(np.diff(into_ptr)[X] + 1, starts) if V.size else V
+            bounds = np.append(starts, len(V))
+            for block in _row_batches(work):
+                pairs = slice(bounds[block.start], bounds[block.stop])
+                v, delta, lost = _dominated_distances(
+                    A, E, into, into_ptr, d, V[pairs], X[pairs]
+                )
+                after[v] += delta
+                after_reached[v] -= lost
+                disconnecting[v[lost > 0]] = True
+
+        if full_v:
+            s, v = np.concatenate(full_s), np.concatenate(full_v)
+            order = np.argsort(v, kind="stable")
+            s, v = s[order], v[order]
+            # replace the sums derived from the distances in `G`
+            before = np.bincount(v, sums[s] - Dfin[s, v], minlength=n)
+            before_reached = np.bincount(v, counts[s] - finite[s, v], minlength=n)
+            removed, sums_v, counts_v = _removed_distances(
+                A, into, into_ptr, sources, s, v
+            )
+            after[removed] += sums_v - before[removed]
+            after_reached[removed] += counts_v - before_reached[removed].astype(int)
+            disconnecting[removed[counts_v < before_reached[removed]]] = True
+    return total, reached, after, after_reached
+
+
+def _dominated_pairs(E, s, d, skip, limit):
+    """Return the arrays of the pairs (`v`, `x`) such that every shortest path
+    from `s` to `x` goes through `v`, sorted by `v` then `x`, given the
+    distances `d` from `s`. The nodes `v` in `skip` are left out.
+
+    If there are more than `limit` pairs per node `v`, only the nodes `v`
+    are returned, and None instead of the nodes `x`.
+
+    The immediate dominators are found in the order of the distances from
+    `s`, as the closest common dominator of the predecessors of every node in
+    the shortest path DAG; as the lengths are positive, the predecessors
+    come first.
+    """
+    import numpy as np
+
+    n = len(d)
+    tight = (d[E.row] + E.data == d[E.col]) & np.isfinite(d[E.col])
+    heads, tails = E.col[tight], E.row[tight]
+    npred = np.bincount(heads, minlength=n)
+    idom = np.full(n, s)
+    idom[heads] = tails
+    multi = np.flatnonzero(npred > 1)
+    if multi.size:
+        rank = np.empty(n, dtype=np.intp)
+        rank[np.argsort(d, kind="stable")] = np.arange(n)
+        multi = multi[np.argsort(rank[multi])]
+        order = np.argsort(heads, kind="stable")
+        tails = tails[order].tolist()
+        ptr = np.searchsorted(heads[order], np.arange(n + 1)).tolist()
+        rank = rank.tolist()
+        dom = idom.tolist()
+        for x in multi.tolist():
+            a = tails[ptr[x]]
+            for b in tails[ptr[x] + 1 : ptr[x + 1]]:
+                while a != b:
+                    while rank[a] > rank[b]:
+                        a = dom[a]
+                    while rank[b] > rank[a]:
+                        b = dom[b]
+            dom[x] = a
+        idom = np.array(dom)
+
+    # link every node to its closest dominator that is not skipped
+    skip = skip.copy()
+    skip[s] = False
+    up = idom
+    while (hop := skip[up]).any():
+        up = np.where(hop, up[up], up)
+
+    x = np.flatnonzero(np.isfinite(d))
+    x = x[x != s]
+    a = up[x]
+    # the immediate dominators of the nodes `x`, which dominate all the others
+    critical = np.unique(a[a != s])
+    limit *= len(critical)
+    V, X = [], []
+    size = 0
+    while (keep := a != s).any():
+        x, a = x[keep], a[keep]
+        size += len(a)
+        if size > limit:
+            return critical, None
+        V.append(a)
+        X.append(x)
+        a = up[a]
+    if not V:
+        return np.zeros(0, np.intp), np.zeros(0, np.intp)
+    V, X = np.concatenate(V), np.concatenate(X)
+    order = np.lexsort((X, V))
+    return V[order], X[order]
+
+
+def _dominated_distances(A, E, into, into_ptr, d, V, X):
+    """Recompute the distances from a source to the nodes `X` in ``G - v``
+    for the pairs (`v`, `x`) of `V` and `X`, grouped by `v`, given the
+    distances `d` from the source in `G`.
+
+    The nodes dominated by each `v` form a block of a block diagonal graph,
+    entered from a node of its own through edges whose lengths are the
+    distances through the nodes that `v` does not dominate. One Dijkstra run
+    from all the entry nodes gives the distances of all the blocks at once.
+
+    Returns the nodes `v`, the changes of the sums of their finite distances,
+    and the numbers of nodes that became unreachable.
+    """
+    import numpy as np
+    import scipy as sp
+
+    n = len(d)
+    P = len(X)
+    v, block = np.unique(V, return_inverse=True)
+    k = len(v)
+    key = block * n + X
+
+    # the edges (y, x) into the dominated nodes
+    indeg = into_ptr[X + 1] - into_ptr[X]
+    j = np.repeat(np.arange(P), indeg)
+    first = np.repeat(np.cumsum(indeg) - indeg, indeg)
+    pos = into[np.repeat(into_ptr[X], indeg) + np.arange(len(j)) - first]
+    y, w = E.row[pos], E.data[pos]
+    ykey = block[j] * n + y
+    loc = np.minimum(np.searchsorted(key, ykey), P - 1)
+    inside = key[loc] == ykey
+    outside = ~inside & (y != v[block[j]]) & np.isfinite(d[y])
+
+    entry = np.full(P, np.inf)
+    np.minimum.at(entry, j[outside], d[y[outside]] + w[outside])
+    seeded = np.flatnonzero(np.isfinite(entry))
+    M = sp.sparse.csr_array(
+        (
+            np.concatenate([w[inside], entry[seeded]]),
+            (
+                np.concatenate([loc[inside], P + block[seeded]]),
+                np.concatenate([j[inside], seeded]),
+            ),
+        ),
+        shape=(P + k, P + k),
     )
-    return {k: v for d in result for k, v in d.items()}
+    dist = sp.sparse.csgraph.dijkstra(M, indices=P + np.arange(k), min_only=True)[:P]
+    new = np.isfinite(dist)
+    delta = np.bincount(block, np.where(new, dist, 0) - d[X], minlength=k)
+    lost = np.bincount(block[~new], minlength=k)
+    return v, delta, lost
+
+
+def _closeness_vitality_rows_recompute(A, rows):
+    """Return the same sums as `_closeness_vitality_rows`, recomputing the
+    distances from `s` in ``G - v`` with the edges into `v` set to infinity
+    whenever `v` precedes some node on its shortest paths from `s`.
+
+    This is used when some lengths are zero, as a node can then be its own
+    shortest path predecessor.
+    """
+    import numpy as np
+    import scipy as sp
+
+    n = A.shape[0]
+    A = A.copy()
+    E = A.tocoo()
+    # positions in `A.data` of the edges into each node
+    into = np.argsort(A.indices, kind="stable")
+    into_ptr = np.searchsorted(A.indices[into], np.arange(n + 1))
+
+    total = 0.0
+    reached = 0
+    after = np.zeros(n)
+    after_reached = np.zeros(n, dtype=np.int64)
+    for batch in _row_batches(np.full(len(rows), max(n, A.nnz))):
+        sources = rows[batch]
+        b = len(sources)
+        D = sp.sparse.csgraph.dijkstra(A, indices=sources)
+        finite = np.isfinite(D)
+        Dfin = np.where(finite, D, 0)
+        sums = Dfin.sum(axis=1)
+        counts = finite.sum(axis=1) - 1
+        total += sums.sum()
+        reached += int(counts.sum())
+
+        # the edges (u, w) on a shortest path from each source
+        tight = (D[:, E.row] + E.data == D[:, E.col]) & finite[:, E.col]
+        s, e = np.nonzero(tight)
+        critical = np.zeros((b, n), dtype=bool)
+        critical[s, E.row[e]] = True
+        critical[np.arange(b), sources] = False
+
+        unchanged = ~critical
+        unchanged[np.arange(b), sources] = False
+        after += (unchanged * (sums[:, None] - Dfin)).sum(axis=0)
+        after_reached += (unchanged * (counts[:, None] - finite)).sum(axis=0)
+
+        v, s = np.nonzero(critical.T)
+        removed, sums_v, counts_v = _removed_distances(A, into, into_ptr, sources, s, v)
+        after[removed] += sums_v
+        after_reached[removed] += counts_v
+    return total, reached, after, after_reached
+
+
+def _removed_distances(A, into, into_ptr, sources, s, v):
+    """Return the nodes of `v`, the sums of the finite distances from the
+    sources ``sources[s]`` in ``G - v`` for each, and their numbers, where the
+    pairs of `s` and `v` are sorted by `v`.
+
+    The distances from all the sources of a removed node are computed at once,
+    with the edges into it set to infinity in `A`, which is restored.
+    """
+    import numpy as np
+    import scipy as sp
+
+    removed, starts = np.unique(v, return_index=True)
+    stops = np.append(starts[1:], len(v))
+    sums = np.zeros(len(removed))
+    counts = np.zeros(len(removed), dtype=np.int64)
+    for i, (node, start, stop) in enumerate(zip(removed, starts, stops)):
+        edges = into[into_ptr[node] : into_ptr[node + 1]]
+        lengths = A.data[edges]
+        A.data[edges] = np.inf
+        Dv = sp.sparse.csgraph.dijkstra(A, indices=sources[s[start:stop]])
+        A.data[edges] = lengths
+        finite = np.isfinite(Dv)
+        sums[i] = Dv[finite].sum()
+        counts[i] = int(finite.sum()) - (stop - start)
+    return removed, sums, counts
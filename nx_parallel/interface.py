@@ -7,8 +7,11 @@ __all__ = ["BackendInterface", "ParallelGraph"]
 ALGORITHMS = [
     # Bipartite
     "node_redundancy",
+    "latapy_clustering",
     # Isolates
     "number_of_isolates",
+    "isolates",
+    "is_isolate",
     # Vitality
     "closeness_vitality",
     # Tournament
@@ -23,18 +26,30 @@ ALGORITHMS = [
     "cn_soundarajan_hopcroft",
     "ra_index_soundarajan_hopcroft",
     "within_inter_cluster",
+    "link_prediction_features",
     # Centrality
     "betweenness_centrality",
     "edge_betweenness_centrality",
     "harmonic_centrality",
+    "eigenvector_centrality",
+    "katz_centrality",
+    # Link Analysis
+    "pagerank",
     # Components : attracting
     "number_attracting_components",
+    "attracting_components",
+    "is_attracting_component",
     # Components : connected
     "number_connected_components",
+    "connected_components",
+    "node_connected_component",
     # Components : strongly connected
     "number_strongly_connected_components",
+    "strongly_connected_components",
     # Components : weakly connected
     "number_weakly_connected_components",
+    "weakly_connected_components",
+    "is_weakly_connected",
     # Dag
     "colliders",
     "v_structures",
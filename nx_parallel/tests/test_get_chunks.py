@@ -36,7 +36,6 @@ def test_get_functions_with_get_chunks():
 
 
 ignore_funcs = [
-    "number_of_isolates",
     "is_reachable",
 ]
 
@@ -64,18 +63,39 @@ def test_get_chunks(func):
     ]
     not_implemented_undirected = [
         "number_attracting_components",
+        "attracting_components",
+        "is_attracting_component",
         "number_weakly_connected_components",
+        "weakly_connected_components",
+        "is_weakly_connected",
         "number_strongly_connected_components",
+        "strongly_connected_components",
     ]
     dag_funcs = [
         "v_structures",
         "colliders",
     ]
+    bipartite_funcs = [
+        "latapy_clustering",
+    ]
+    structured_array_funcs = [
+        "link_prediction_features",
+    ]
+    func_kwargs = {
+        # the default alpha exceeds the inverse of the largest eigenvalue
+        "katz_centrality": {"alpha": 0.01},
+    }
+    requires_node = [
+        "node_connected_component",
+        "is_isolate",
+    ]
 
     if func in tournament_funcs:
         G = nx.tournament.random_tournament(15, seed=42)
     elif func in dag_funcs:
         G = nx.gn_graph(25, seed=42, create_using=nx.DiGraph)
+    elif func in bipartite_funcs:
+        G = nx.bipartite.random_graph(20, 20, 0.6, seed=42)
     else:
         G = nx.fast_gnp_random_graph(
             40, 0.6, seed=42, directed=func in not_implemented_undirected
@@ -88,6 +108,12 @@ def test_get_chunks(func):
         ebunch = [(0, 3)]
         c1 = getattr(nxp, func)(H, ebunch)
         c2 = getattr(nxp, func)(H, ebunch, get_chunks=random_chunking)
+    elif func in requires_node:
+        c1 = getattr(nxp, func)(H, 0)
+        c2 = getattr(nxp, func)(H, 0, get_chunks=random_chunking)
+    elif func in func_kwargs:
+        c1 = getattr(nxp, func)(H, **func_kwargs[func])
+        c2 = getattr(nxp, func)(H, **func_kwargs[func], get_chunks=random_chunking)
     else:
         c1 = getattr(nxp, func)(H)
         c2 = getattr(nxp, func)(H, get_chunks=random_chunking)
@@ -111,6 +137,8 @@ def test_get_chunks(func):
         else:
             if isinstance(c1, float):
                 assert math.isclose(c1, c2, abs_tol=1e-16)
+            elif func in structured_array_funcs:
+                assert sorted(c1.tolist()) == sorted(c2.tolist())
             elif isinstance(c1, Iterable):
                 assert sorted(c1) == sorted(c2)
             else:
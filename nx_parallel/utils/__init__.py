@@ -1,3 +1,6 @@
 from .chunk import *
 from .decorators import *
 from .should_run_policies import *
+from .csr import *
+from .shared import *
+from .spmv import *
@@ -0,0 +1,164 @@
+"""Helpers for running array kernels over a CSR view of a graph.
+
+The CSR arrays built here are passed straight to the module level kernels
+dispatched through joblib. Arrays bigger than the `max_nbytes` config are
+memory-mapped by joblib, so all workers read the same copy of the graph.
+"""
+
+from itertools import chain
+import networkx as nx
+from nx_parallel.utils.chunk import chunks
+
+__all__ = [
+    "_csr_adjacency",
+    "_index_chunks",
+    "_cost_chunks",
+    "_edge_chunks",
+    "_row_batches",
+]
+
+
+def _csr_adjacency(
+    G, nodelist=None, weight=None, dtype=None, *, simple=False, self_loops=True
+):
+    """Return the adjacency matrix of `G` as a SciPy CSR array with sorted
+    column indices.
+
+    If `self_loops` is False, the diagonal entries are dropped. If `simple` is
+    True, self-loops are dropped and every remaining entry is set to 1, so that
+    row `i` holds exactly the neighbor set ``set(G[u]) - {u}`` of
+    ``u = nodelist[i]``; `weight` is ignored in that case.
+    """
+    import numpy as np
+    import scipy as sp
+
+    if nodelist is None:
+        nodelist = list(G)
+    if not nodelist:
+        return sp.sparse.csr_array((0, 0), dtype=dtype or np.int64)
+
+    if simple:
+        weight = None
+    n = len(nodelist)
+    # Graph views filter their adjacency dicts lazily, so their lengths may
+    # disagree with what iterating over them gives.
+    if n == len(G) and not hasattr(G, "_graph"):
+        # Reading the adjacency dicts directly is a lot faster than going
+        # through `nx.to_scipy_sparse_array`.
+        index = {node: i for i, node in enumerate(nodelist)}
+        nbrs = [G._adj[node] for node in nodelist]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, nbrs), np.int64, n), out=indptr[1:])
+        indices = np.fromiter(
+            map(index.__getitem__, chain.from_iterable(nbrs)), np.int64
+        )
+        datadicts = chain.from_iterable(nbr.values() for nbr in nbrs)
+        if weight is None:
+            if G.is_multigraph():
+                data = np.fromiter(map(len, datadicts), dtype or np.int64)
+            else:
+                data = np.ones(len(indices), dtype=dtype or np.int64)
+        else:
+            # parallel edges add up, and a missing weight counts as 1
+            if G.is_multigraph():
+                weights = (
+                    sum(d.get(weight, 1) for d in keydict.values())
+                    for keydict in datadicts
+                )
+            else:
+                weights = (d.get(weight, 1) for d in datadicts)
+            if dtype is None:
+                data = np.array(list(weights))
+            else:
+                data = np.fromiter(weights, dtype)
+        A = sp.sparse.csr_array((data, indices, indptr), shape=(n, n))
+    else:
+        A = nx.to_scipy_sparse_array(
+            G, nodelist=nodelist, weight=weight, dtype=dtype, format="csr"
+        )
+    if simple or not self_loops:
+        A = A.tocoo()
+        keep = A.row != A.col
+        if simple:
+            data = np.ones(np.count_nonzero(keep), dtype=dtype or np.int64)
+        else:
+            data = A.data[keep]
+        A = sp.sparse.csr_array((data, (A.row[keep], A.col[keep])), shape=A.shape)
+    A.sort_indices()
+    return A
+
+
+def _index_chunks(nodes, index, n_jobs, get_chunks="chunks"):
+    """Chunk `nodes` and yield each non-empty chunk as an array of positions.
+
+    Parameters
+    ----------
+    nodes : list
+        The nodes to be chunked.
+    index : dict
+        Maps each node to its row in the CSR arrays.
+    n_jobs : int
+        The number of chunks used by the default chunking.
+    get_chunks : str, function (default = "chunks")
+        A function that takes in `nodes` and returns an iterable of node chunks.
+        The default chunking is done by slicing `nodes` into `n_jobs` chunks.
+    """
+    import numpy as np
+
+    if get_chunks == "chunks":
+        node_chunks = chunks(nodes, n_jobs)
+    else:
+        node_chunks = get_chunks(nodes)
+
+    for chunk in node_chunks:
+        rows = np.fromiter((index[v] for v in chunk), dtype=np.intp)
+        if rows.size:
+            yield rows
+
+
+def _cost_chunks(cost, n_chunks):
+    """Split the positions ``0, ..., len(cost) - 1`` into at most `n_chunks`
+    arrays of about the same total `cost`.
+
+    The positions are dealt out to the chunks by decreasing cost, going back
+    and forth over the chunks, so that the most expensive items are spread
+    over all the workers. Every returned array is sorted and non-empty.
+    """
+    import numpy as np
+
+    order = np.argsort(cost, kind="stable")[::-1]
+    rounds, col = np.divmod(np.arange(len(order)), n_chunks)
+    owner = np.where(rounds % 2, n_chunks - 1 - col, col)
+    node_chunks = (np.sort(order[owner == c]) for c in range(n_chunks))
+    return [chunk for chunk in node_chunks if chunk.size]
+
+
+def _edge_chunks(A, n_chunks):
+    """Split the rows of the CSR array `A` into at most `n_chunks` ranges of
+    consecutive rows with about the same number of entries, returned as
+    arrays of positions.
+    """
+    import numpy as np
+
+    work = np.diff(A.indptr) + 1
+    budget = -(-int(work.sum()) // n_chunks)
+    return [np.arange(s.start, s.stop) for s in _row_batches(work, budget)]
+
+
+def _row_batches(work, budget=1 << 22):
+    """Yield slices splitting consecutive rows into batches whose summed
+    `work` stays around `budget`.
+
+    Kernels use this to bound the size of the intermediate sparse products
+    they materialize. A row heavier than `budget` gets a batch of its own.
+    """
+    import numpy as np
+
+    cum = np.cumsum(work)
+    start = 0
+    while start < len(cum):
+        base = cum[start - 1] if start else 0
+        end = int(np.searchsorted(cum, base + budget, side="right"))
+        end = max(end, start + 1)
+        yield slice(start, end)
+        start = end
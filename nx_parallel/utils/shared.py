@@ -0,0 +1,55 @@
+"""Helpers for sharing Python objects with the workers without pickling them
+into every task.
+
+The object is dumped once into a temporary file and the tasks only carry its
+path. Each worker process loads the file the first time one of its tasks asks
+for it and keeps it for the next tasks. The path is the generation of the
+cache: a task asking for another path evicts the stale object before loading
+its own, so a worker holds at most a single object, and an idle worker holds
+it only until loky shuts it down after its idle timeout.
+"""
+
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import contextmanager
+from joblib import dump, load
+
+__all__ = ["_shared_object", "_load_shared"]
+
+# the path of the cached object and the object
+_loaded = [None, None]
+
+
+@contextmanager
+def _shared_object(obj):
+    """Dump `obj` into a temporary file and yield the path to pass to the
+    tasks; the file is removed on exit.
+    """
+    temp_folder = tempfile.mkdtemp()
+    # the name is unique, so a stale cache entry can never be mistaken for it
+    path = os.path.join(temp_folder, f"{uuid.uuid4().hex}.pkl")
+    try:
+        dump(obj, path)
+        yield path
+    finally:
+        # the tasks may have run in this process, with the sequential backend
+        if _loaded[0] == path:
+            _loaded[:] = [None, None]
+        shutil.rmtree(temp_folder, ignore_errors=True)
+
+
+def _load_shared(path, mmap_mode=None):
+    """Return the object dumped at `path` by `_shared_object`, loading it only
+    once per worker process.
+
+    With a `mmap_mode` such as ``"r"``, the NumPy arrays within the object are
+    memory-mapped from the file instead of read into memory, so that all the
+    workers share the same pages.
+    """
+    if _loaded[0] != path:
+        # free the stale object before loading the new one
+        _loaded[:] = [None, None]
+        _loaded[:] = [path, load(path, mmap_mode=mmap_mode)]
+    return _loaded[1]
@@ -0,0 +1,86 @@
+"""Helpers for running power iterations as parallel sparse matrix-vector
+products over row blocks of a CSR array.
+
+The blocks are dumped once with `_shared_object` and memory-mapped by the
+workers, so the matrix is never sent again. The current iterate and the next
+one live in two memory-mapped vectors: every task reads the current iterate
+and writes its rows of the next one in place, and sends back only its partial
+reductions, such as the norm of its rows.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from joblib import Parallel, delayed
+from nx_parallel.utils.shared import _shared_object, _load_shared
+
+__all__ = ["_spmv_engine"]
+
+
+@contextmanager
+def _spmv_engine(M, rows_chunks, *vectors):
+    """Share the row blocks ``M[rows]`` of the CSR array `M` with the workers
+    and yield a function running one product over all of them in parallel.
+
+    Parameters
+    ----------
+    M : SciPy CSR array
+        The square matrix to multiply with.
+    rows_chunks : list of arrays
+        The rows of every block, which together cover all the rows of `M`.
+    vectors : arrays
+        Vectors the size of `M` that the `step` of every block reads its rows
+        of; they are shared along with the blocks.
+
+    Yields
+    ------
+    spmv : function
+        ``spmv(x, step=None, *args)`` returns the pair of ``y = M @ x`` and the
+        sums over the blocks of their reductions. If `step` is given, every
+        block ``y[rows]`` is first replaced by the first item of
+        ``step(y[rows], x[rows], *(v[rows] for v in vectors), *args)``, whose
+        second item is the tuple of the reductions of the block. `step` must be
+        a module level function, so that it is pickled by reference.
+    """
+    import numpy as np
+
+    n = M.shape[0]
+    blocks = [(M[rows], rows, *(v[rows] for v in vectors)) for rows in rows_chunks]
+    with (
+        _shared_object(blocks) as path,
+        tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_folder,
+        Parallel() as parallel,
+    ):
+        x_path = os.path.join(temp_folder, "x.npy")
+        y_path = os.path.join(temp_folder, "y.npy")
+        x_shared = np.lib.format.open_memmap(x_path, "w+", np.float64, (n,))
+        y_shared = np.lib.format.open_memmap(y_path, "w+", np.float64, (n,))
+
+        def spmv(x, step=None, *args):
+            x_shared[:] = x
+            x_shared.flush()
+            reductions = parallel(
+                delayed(_spmv_block)(path, i, x_path, y_path, step, args)
+                for i in range(len(blocks))
+            )
+            return np.array(y_shared), np.sum(reductions, axis=0)
+
+        yield spmv
+
+
+def _spmv_block(path, i, x_path, y_path, step, args):
+    """Write the rows of block `i` of ``M @ x`` into the vector at `y_path`,
+    after applying `step` to them, and return the reductions of the block.
+    """
+    import numpy as np
+
+    M, rows, *vectors = _load_shared(path, mmap_mode="r")[i]
+    x = np.load(x_path, mmap_mode="r")
+    y = M @ x
+    reductions = ()
+    if step is not None:
+        y, reductions = step(y, x[rows], *vectors, *args)
+    y_shared = np.load(y_path, mmap_mode="r+")
+    y_shared[rows] = y
+    y_shared.flush()
+    return reductions
@@ -0,0 +1,83 @@
+import networkx as nx
+from nx_parallel.utils.csr import (
+    _csr_adjacency,
+    _index_chunks,
+    _cost_chunks,
+    _edge_chunks,
+    _row_batches,
+)
+
+
+def test_csr_adjacency():
+    G = nx.MultiGraph([(0, 1), (0, 1), (1, 1), (1, 2)])
+    A = _csr_adjacency(G, [0, 1, 2], simple=True)
+    assert A.toarray().tolist() == [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+
+    A = _csr_adjacency(G, [0, 1, 2])
+    assert A.toarray().tolist() == [[0, 2, 0], [2, 1, 1], [0, 1, 0]]
+
+    A = _csr_adjacency(G, [0, 1, 2], self_loops=False)
+    assert A.toarray().tolist() == [[0, 2, 0], [2, 0, 1], [0, 1, 0]]
+
+    assert _csr_adjacency(nx.Graph()).shape == (0, 0)
+
+
+def test_csr_adjacency_views():
+    # the adjacency dicts of filter views are longer than what they yield
+    G = nx.MultiGraph([(0, 1), (0, 1), (1, 2), (3, 4)])
+    for V in [
+        G.edge_subgraph([(0, 1, 0), (1, 2, 0)]),
+        nx.restricted_view(G, [], [(3, 4, 0)]),
+    ]:
+        A = _csr_adjacency(V, list(V))
+        expected = nx.to_scipy_sparse_array(V, list(V), format="csr")
+        assert A.toarray().tolist() == expected.toarray().tolist()
+
+
+def test_csr_adjacency_weighted():
+    G = nx.MultiDiGraph([(0, 1, {"w": 2.5}), (0, 1), (1, 1, {"w": 3}), (2, 0)])
+    A = _csr_adjacency(G, [0, 1, 2], weight="w")
+    expected = nx.to_scipy_sparse_array(G, [0, 1, 2], weight="w", format="csr")
+    assert A.toarray().tolist() == expected.toarray().tolist()
+    assert A.dtype == expected.dtype
+
+    G = nx.Graph([(0, 1, {"w": 2}), (1, 1), (1, 2, {"w": 0})])
+    A = _csr_adjacency(G, [2, 1, 0], weight="w", dtype=float)
+    assert A.toarray().tolist() == [[0, 0, 0], [0, 1, 2], [0, 2, 0]]
+    # a zero weight is kept as an explicit entry
+    assert A.nnz == 5
+
+
+def test_index_chunks():
+    nodes = ["a", "b", "c", "d", "e"]
+    index = {v: i for i, v in enumerate(nodes)}
+
+    chunks = list(_index_chunks(nodes, index, 2))
+    assert [c.tolist() for c in chunks] == [[0, 1, 2], [3, 4]]
+
+    # empty chunks are dropped
+    chunks = list(_index_chunks(nodes[:1], index, 3))
+    assert [c.tolist() for c in chunks] == [[0]]
+
+    chunks = list(_index_chunks(nodes, index, 2, lambda x: [x[::2], x[1::2]]))
+    assert [c.tolist() for c in chunks] == [[0, 2, 4], [1, 3]]
+
+
+def test_cost_chunks():
+    chunks = _cost_chunks([1, 9, 1, 5, 3, 4], 2)
+    assert [c.tolist() for c in chunks] == [[1, 2, 4], [0, 3, 5]]
+    assert sum(len(c) for c in _cost_chunks([1, 2], 4)) == 2
+    assert _cost_chunks([], 3) == []
+
+
+def test_row_batches():
+    batches = list(_row_batches([5, 5, 5, 20, 1, 1], budget=10))
+    assert batches == [slice(0, 2), slice(2, 3), slice(3, 4), slice(4, 6)]
+    assert list(_row_batches([], budget=10)) == []
+
+
+def test_edge_chunks():
+    A = _csr_adjacency(nx.path_graph(4))
+    chunks = _edge_chunks(A, 2)
+    assert [c.tolist() for c in chunks] == [[0, 1], [2, 3]]
+    assert _edge_chunks(_csr_adjacency(nx.Graph()), 2) == []
@@ -0,0 +1,26 @@
+import os
+import networkx as nx
+from nx_parallel.utils import shared
+from nx_parallel.utils.shared import _shared_object, _load_shared
+
+
+def test_shared_object():
+    G = nx.path_graph(4)
+    with _shared_object(G) as path:
+        H = _load_shared(path)
+        assert nx.utils.graphs_equal(G, H)
+        # loaded once, then served from the cache
+        assert _load_shared(path) is H
+    assert not os.path.exists(path)
+    # and evicted when the context exits in this process
+    assert shared._loaded == [None, None]
+
+
+def test_shared_object_evicts_stale():
+    G, H = nx.path_graph(4), nx.cycle_graph(4)
+    with _shared_object(G) as path:
+        _load_shared(path)
+        # a worker reused for another object keeps only the new one
+        with _shared_object(H) as other:
+            assert nx.utils.graphs_equal(_load_shared(other), H)
+            assert shared._loaded[0] == other
@@ -0,0 +1,28 @@
+import numpy as np
+import scipy as sp
+
+from nx_parallel.utils.spmv import _spmv_engine
+
+
+def _scaled_rows(y, x, scale, factor):
+    y = factor * scale * y
+    return y, (np.abs(y).sum(), len(y))
+
+
+def test_spmv_engine():
+    M = sp.sparse.random_array((30, 30), density=0.2, format="csr", rng=42)
+    x = np.arange(30.0)
+    scale = np.linspace(1, 2, 30)
+    rows_chunks = [np.arange(0, 30, 2), np.arange(1, 30, 2)]
+
+    with _spmv_engine(M, rows_chunks, scale) as spmv:
+        y, reductions = spmv(x)
+        assert np.allclose(y, M @ x)
+        assert reductions.size == 0
+
+        # repeated products reuse the shared blocks
+        y, (norm, count) = spmv(y, _scaled_rows, 3.0)
+        expected = 3.0 * scale * (M @ (M @ x))
+        assert np.allclose(y, expected)
+        assert np.isclose(norm, np.abs(expected).sum())
+        assert count == 30